@@ -1,16 +1,18 @@
-from .pipeline import (
-    Cinema4DHost
-)
+"""Cinema 4D host API.
 
-from .lib import (
-    maintained_selection
-)
+The members are imported on first access so that the modules that do not
+depend on the `c4d` module, e.g. `lib_frames` and `lib_products`, can be
+imported outside of Cinema 4D.
+"""
+import importlib
 
-from .workio import (
-    save_file,
-    current_file,
-    has_unsaved_changes
-)
+_MEMBER_MODULES = {
+    "Cinema4DHost": ".pipeline",
+    "maintained_selection": ".lib",
+    "save_file": ".workio",
+    "current_file": ".workio",
+    "has_unsaved_changes": ".workio",
+}
 
 __all__ = [
     "Cinema4DHost",
@@ -19,3 +21,15 @@ __all__ = [
     "current_file",
     "has_unsaved_changes",
 ]
+
+
+def __getattr__(name):
+    module_name = _MEMBER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,6 +11,7 @@ from .lib import (
 )
 from .lib_renderproducts import (
     find_video_post,
+    get_ocio_names,
     REDSHIFT_RENDER_ENGINE_ID,
     set_scene_ocio_config
 )
@@ -102,6 +103,16 @@ def reset_render_settings():
 def _set_redshift_colorspace(video_post, render, display, view):
     # TODO: video_post[REDSHIFT_RENDERER_COLOR_MANAGEMENT_OCIO_CONFIG]?
     # TODO: video_post[REDSHIFT_RENDERER_COLOR_MANAGEMENT_OCIO_USE_FILE_RULES]?
+    # Warn about names that do not exist in the document's OCIO config
+    names = get_ocio_names(video_post.GetDocument())
+    for name, indices in (
+        (render, names.colorspace_indices),
+        (display, names.display_indices),
+        (view, names.view_indices),
+    ):
+        if name not in indices:
+            log.warning(f"OCIO name '{name}' not found in OCIO config.")
+
     video_post[c4d.REDSHIFT_RENDERER_COLOR_MANAGEMENT_OCIO_RENDERING_COLORSPACE] = render  # noqa: E501
     video_post[c4d.REDSHIFT_RENDERER_COLOR_MANAGEMENT_OCIO_DISPLAY] = display
     video_post[c4d.REDSHIFT_RENDERER_COLOR_MANAGEMENT_OCIO_VIEW] = view
@@ -0,0 +1,131 @@
+"""Headless export worker running a single export job from a job file.
+
+The worker is started by `lib_exportworker.ExportWorkerPool` with:
+
+    c4dpy export_worker.py <job file>
+
+It loads the scene snapshot, selects the objects of the job, runs the
+exporter and reports the result on its output.
+"""
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+
+import c4d
+
+log = logging.getLogger(__name__)
+
+
+def create_pool(executable="", processes=0):
+    """Return an export worker pool running this worker script.
+
+    Args:
+        executable (str): The worker executable. Defaults to the `c4dpy`
+            of the running Cinema 4D.
+        processes (int): The number of parallel workers.
+
+    Returns:
+        ExportWorkerPool: The worker pool.
+
+    """
+    from ayon_cinema4d.api import lib
+    from ayon_cinema4d.api.lib_exportworker import ExportWorkerPool
+
+    return ExportWorkerPool(
+        executable=executable or lib.get_python_executable(),
+        script=os.path.abspath(__file__),
+        processes=processes,
+        env=os.environ.copy(),
+        sys_path=sys.path,
+    )
+
+
+def run_job(job):
+    """Export the objects of the job from its scene snapshot.
+
+    Raises an error when the export fails, which `main` reports as a
+    failed result.
+    """
+    from ayon_cinema4d.api import lib, exporters
+
+    exporter = {
+        "alembic": exporters.extract_alembic,
+        "redshiftproxy": exporters.extract_redshiftproxy,
+    }.get(job.job_type)
+    if exporter is None:
+        raise ValueError(f"Unknown export job type: {job.job_type}")
+
+    doc = c4d.documents.LoadDocument(
+        job.scene_path,
+        c4d.SCENEFILTER_OBJECTS | c4d.SCENEFILTER_MATERIALS,
+    )
+    if doc is None:
+        raise RuntimeError(f"Failed to load scene: {job.scene_path}")
+
+    try:
+        c4d.documents.InsertBaseDocument(doc)
+        c4d.documents.SetActiveDocument(doc)
+        if job.document_path:
+            # Resolve relative paths against the original scene
+            doc.SetDocumentPath(job.document_path)
+
+        objects = []
+        for index_path in job.objects:
+            obj = lib.get_object_by_index_path(doc, index_path)
+            if obj is None:
+                raise RuntimeError(
+                    f"Object not found in scene snapshot: {index_path}"
+                )
+            objects.append(obj)
+
+        options = dict(job.options)
+        isolate = options.pop("isolate", False)
+        lib.set_selection(doc, objects)
+        exporter(
+            job.filepath,
+            selection=True,
+            doc=doc,
+            verbose=True,
+            isolate_objects=objects if isolate else None,
+            **options
+        )
+    finally:
+        c4d.documents.KillDocument(doc)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    with open(argv[0], "r") as f:
+        data = json.load(f)
+
+    # Make the host's Python packages available to the worker
+    for path in reversed(data.get("sys_path", [])):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    from ayon_cinema4d.api.lib_exportworker import (
+        ExportJob,
+        ExportResult,
+        format_result,
+    )
+
+    job = ExportJob.from_dict(data["job"])
+    result = ExportResult(job_id=job.id)
+    start = time.perf_counter()
+    try:
+        run_job(job)
+        result.succeeded = True
+    except Exception:
+        result.message = traceback.format_exc()
+    result.duration = time.perf_counter() - start
+
+    print(format_result(result), flush=True)
+    return 0 if result.succeeded else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    sys.exit(main())
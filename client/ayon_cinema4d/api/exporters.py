@@ -1,9 +1,13 @@
+import contextlib
 import json
 import logging
 import os
+import time
 
 import c4d
 
+from . import lib
+
 log = logging.getLogger(__name__)
 
 
@@ -45,6 +49,10 @@ class RenderError(RuntimeError):
     pass
 
 
+class ExportError(RuntimeError):
+    pass
+
+
 def get_plugin_imexport_options(plugin, label=None):
     if label is None:
         label = str(plugin)
@@ -72,6 +80,332 @@ def get_plugin_imexport_options(plugin, label=None):
     return imexporter_options
 
 
+class ExporterOptions:
+    """Cached options container of an exporter plug-in.
+
+    The options container is retrieved once per exporter and only options
+    that differ from the values in the container are written. The values
+    that were replaced are restored with `reset`, so the options of one
+    export don't leak into the next one.
+
+    Some options are not picked up by the exporter when they are written
+    directly, e.g. `ABCEXPORT_SELECTION_ONLY`. The boolean and integer
+    `toggle_keys` are always written, first with the inverted value.
+    See: https://developers.maxon.net/forum/topic/12767/alembic-export-options-not-working/6  # noqa: E501
+    """
+
+    def __init__(self, plugin, label=None, toggle_keys=None):
+        self.plugin = plugin
+        self.label = label or str(plugin)
+        self.toggle_keys = set(toggle_keys or [])
+        self.container = get_plugin_imexport_options(plugin, label=label)
+
+        # The values before they were applied per option name
+        self._original = {}
+
+    def is_alive(self):
+        return self.container is not None and self.container.IsAlive()
+
+    def apply(self, options):
+        """Write the options that differ from the current values.
+
+        Args:
+            options (dict[str, Any]): The values per `c4d` option name.
+
+        Returns:
+            list[str]: The names of the written options.
+
+        """
+        written = []
+        for key, value in options.items():
+            key_id = getattr(c4d, key)
+            current = self.container[key_id]
+            toggle = key in self.toggle_keys and isinstance(value, (bool, int))
+            if not toggle and _is_equal(current, value):
+                continue
+
+            self._original.setdefault(key, current)
+            if toggle:
+                self.container[key_id] = not value
+            self.container[key_id] = value
+            written.append(key)
+        return written
+
+    def reset(self):
+        """Restore the values replaced by `apply`."""
+        for key, value in self._original.items():
+            if value is None:
+                continue
+            key_id = getattr(c4d, key)
+            if key in self.toggle_keys and isinstance(value, (bool, int)):
+                self.container[key_id] = not value
+            self.container[key_id] = value
+        self._original.clear()
+
+    @contextlib.contextmanager
+    def applied(self, options, verbose=False):
+        """Apply the options for the duration of the context.
+
+        The options written before `apply` fails are reset as well.
+        """
+        try:
+            written = self.apply(options)
+            if verbose:
+                log.debug(
+                    "Applied %s export options: %s",
+                    self.label, ", ".join(written) or "<none>",
+                )
+            yield
+        finally:
+            self.reset()
+
+
+_exporter_options = {}
+
+
+def get_exporter_options(plugin, label=None, toggle_keys=None):
+    """Return the cached `ExporterOptions` of the exporter plug-in."""
+    exporter_options = _exporter_options.get(plugin)
+    if exporter_options is None or not exporter_options.is_alive():
+        exporter_options = ExporterOptions(
+            plugin, label=label, toggle_keys=toggle_keys)
+        _exporter_options[plugin] = exporter_options
+    return exporter_options
+
+
+def _is_equal(current, value):
+    # Only compare simple values, other data types are always written
+    simple_types = (bool, int, float, str)
+    if isinstance(current, simple_types) and isinstance(value, simple_types):
+        return current == value
+    return False
+
+
+def save_document_snapshot(doc, filepath):
+    """Save a copy of the document to export from in another process.
+
+    A clone of the document is saved, because saving renames the saved
+    document and clears its changed state. The document itself keeps its
+    name, path and changed state.
+
+    Returns:
+        str: The saved filepath.
+
+    """
+    state = (doc.GetDocumentName(), doc.GetDocumentPath(), doc.GetChanged())
+
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    snapshot = doc.GetClone(c4d.COPYFLAGS_DOCUMENT)
+    try:
+        saved = c4d.documents.SaveDocument(
+            snapshot,
+            filepath,
+            c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST,
+            c4d.FORMAT_C4DEXPORT,
+        )
+    finally:
+        c4d.documents.KillDocument(snapshot)
+
+    new_state = (
+        doc.GetDocumentName(), doc.GetDocumentPath(), doc.GetChanged()
+    )
+    if new_state != state:
+        log.warning(
+            "Saving the document snapshot changed the document state from "
+            "%s to %s, restoring it.", state, new_state
+        )
+        doc.SetDocumentName(state[0])
+        doc.SetDocumentPath(state[1])
+        if state[2]:
+            doc.SetChanged()
+
+    if not saved:
+        raise RuntimeError(f"Failed to save document snapshot: {filepath}")
+    return filepath
+
+
+def get_isolation_blockers(doc, objects):
+    """Return reasons why the objects can't be exported from an isolated doc.
+
+    Isolating the objects into a new document breaks them when they depend
+    on objects that are not isolated along, e.g. through expression tags,
+    links to other objects, field lists or animated parents.
+
+    Args:
+        doc (c4d.documents.BaseDocument): The document of the objects.
+        objects (list[c4d.BaseObject]): The objects to isolate.
+
+    Returns:
+        list[str]: The reasons, empty if the objects can be isolated.
+
+    """
+    isolated = set()
+    for obj in objects:
+        isolated.add(obj)
+        isolated.update(lib.iter_all_children(obj))
+
+    blockers = []
+    for obj in objects:
+        parent = obj.GetUp()
+        while parent is not None:
+            if parent not in isolated and (
+                parent.GetCTracks() or _has_expression_tag(parent)
+            ):
+                blockers.append(
+                    f"'{obj.GetName()}' has animated parent "
+                    f"'{parent.GetName()}'"
+                )
+                break
+            parent = parent.GetUp()
+
+    for obj in isolated:
+        if _has_expression_tag(obj):
+            blockers.append(f"'{obj.GetName()}' has an expression tag")
+            continue
+
+        for linked in _iter_linked_objects(doc, obj):
+            if linked not in isolated:
+                blockers.append(
+                    f"'{obj.GetName()}' links to '{linked.GetName()}'"
+                )
+                break
+    return blockers
+
+
+def _has_expression_tag(obj):
+    return any(
+        tag.GetInfo() & c4d.TAG_EXPRESSION for tag in obj.GetTags()
+    )
+
+
+def _iter_linked_objects(doc, obj):
+    """Yield objects linked in the parameters of the object.
+
+    This includes the objects used by the layers of field lists, e.g. of
+    effectors and deformers.
+    """
+    data = obj.GetDataInstance()
+    index = 0
+    while True:
+        key = data.GetIndexId(index)
+        if key == c4d.NOTOK:
+            break
+        index += 1
+
+        data_type = data.GetType(key)
+        if data_type == c4d.DA_ALIASLINK:
+            linked = data.GetLink(key, doc)
+            if isinstance(linked, c4d.BaseObject):
+                yield linked
+        elif data_type == c4d.CUSTOMDATATYPE_INEXCLUDE_LIST:
+            in_exclude = data[key]
+            if in_exclude is None:
+                continue
+            for list_index in range(in_exclude.GetObjectCount()):
+                linked = in_exclude.ObjectFromIndex(doc, list_index)
+                if isinstance(linked, c4d.BaseObject):
+                    yield linked
+        elif data_type == c4d.CUSTOMDATATYPE_FIELDLIST:
+            field_list = data[key]
+            if field_list is None:
+                continue
+            yield from _iter_field_layer_objects(
+                doc, field_list.GetLayersRoot().GetFirst())
+
+
+def _iter_field_layer_objects(doc, layer):
+    """Yield the objects linked by the field layers and their child layers.
+    """
+    while layer is not None:
+        linked = layer.GetLinkedObject(doc)
+        if isinstance(linked, c4d.BaseObject):
+            yield linked
+        # Folder layers hold their layers as children
+        yield from _iter_field_layer_objects(doc, layer.GetDown())
+        layer = layer.GetNext()
+
+
+def isolate_document(doc, objects):
+    """Return a new document containing only the objects to export.
+
+    The new document contains copies of the objects with their children and
+    the materials they use. All its objects are selected.
+
+    Args:
+        doc (c4d.documents.BaseDocument): The document of the objects.
+        objects (list[c4d.BaseObject]): The objects to isolate.
+
+    Returns:
+        Optional[c4d.documents.BaseDocument]: The isolated document or None
+            if the objects can not be isolated without breaking them.
+
+    """
+    blockers = get_isolation_blockers(doc, objects)
+    if blockers:
+        log.debug(
+            "Can not isolate objects for export:\n- %s",
+            "\n- ".join(blockers),
+        )
+        return None
+
+    isolated = c4d.documents.IsolateObjects(doc, objects)
+    if isolated is None:
+        return None
+
+    # Match the document settings that affect the export
+    isolated.SetFps(doc.GetFps())
+    isolated.SetMinTime(doc.GetMinTime())
+    isolated.SetMaxTime(doc.GetMaxTime())
+    isolated.SetLoopMinTime(doc.GetLoopMinTime())
+    isolated.SetLoopMaxTime(doc.GetLoopMaxTime())
+    isolated.SetTime(doc.GetTime())
+    isolated.SetDocumentPath(doc.GetDocumentPath())
+    isolated[c4d.DOCUMENT_DOCUNIT] = doc[c4d.DOCUMENT_DOCUNIT]
+
+    for obj in lib.iter_objects(isolated.GetFirstObject()):
+        obj.SetBit(c4d.BIT_ACTIVE)
+    return isolated
+
+
+def _save_document(doc, filepath, format_id, label, objects=None):
+    """Save the document with the exporter.
+
+    When `objects` are provided these are exported from an isolated document
+    that only contains those objects so that the rest of the scene is not
+    evaluated for each frame. If the objects can't be isolated or the export
+    from the isolated document fails, the full document is exported instead.
+    """
+    flags = c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST
+    if objects:
+        isolated = isolate_document(doc, objects)
+        if isolated is not None:
+            try:
+                start = time.perf_counter()
+                if c4d.documents.SaveDocument(
+                    isolated, filepath, flags, format_id
+                ):
+                    log.debug(
+                        "Exported %s from isolated document in %.2fs",
+                        label, time.perf_counter() - start,
+                    )
+                    return True
+                log.warning(
+                    "Export of %s from isolated document failed. "
+                    "Exporting from the full document instead.", label
+                )
+            finally:
+                c4d.documents.KillDocument(isolated)
+
+    start = time.perf_counter()
+    result = c4d.documents.SaveDocument(doc, filepath, flags, format_id)
+    if result:
+        log.debug(
+            "Exported %s from full document in %.2fs",
+            label, time.perf_counter() - start,
+        )
+    return result
+
+
 def extract_alembic(filepath,
                     frame_start=None,
                     frame_end=None,
@@ -81,8 +415,17 @@ def extract_alembic(filepath,
                     selection=True,
                     doc=None,
                     verbose=False,
+                    isolate_objects=None,
                     **kwargs):
-    """Extract a single Alembic Cache."""
+    """Extract a single Alembic Cache.
+
+    When `isolate_objects` are provided only those objects are exported
+    from an isolated document, see `isolate_document`.
+
+    Raises:
+        ExportError: When the export fails.
+
+    """
     doc = doc or c4d.documents.GetActiveDocument()
 
     # Fallback to Cinema4d timeline if no start or end frame provided.
@@ -91,10 +434,6 @@ def extract_alembic(filepath,
     if frame_end is None:
         frame_end = doc.GetMinTime().GetFrame(doc.GetFps())
 
-    # Set export options
-    options = get_plugin_imexport_options(c4d.FORMAT_ABCEXPORT,
-                                          label="Alembic")
-
     applied_options = {
         # Animation
         "ABCEXPORT_FRAME_START": frame_start,
@@ -143,35 +482,38 @@ def extract_alembic(filepath,
         # "ABCEXPORT_STR_GENERAL": None,  # ???
         # "ABCEXPORT_STR_OPTIONS": None,  # ???
     }
+
+    # Set export options. Options are not always applied for the export when
+    # just set directly, e.g. `ABCEXPORT_SELECTION_ONLY`, so all options are
+    # toggled like before the options were cached.
+    options = get_exporter_options(
+        c4d.FORMAT_ABCEXPORT,
+        label="Alembic",
+        toggle_keys=set(applied_options),
+    )
     if verbose:
         log.debug(
             "Preparing Alembic export with options: %s",
             json.dumps(applied_options, indent=4),
         )
 
-    for key, value in applied_options.items():
-        key_id = getattr(c4d, key)
-        # There appears to be a bug where if the value is just set directly
-        # that it fails to apply them for the export, e.g. still exporting the
-        # whole scene even though `c4d.ABCEXPORT_SELECTION_ONLY` is True.
-        # See: https://developers.maxon.net/forum/topic/12767/alembic-export-options-not-working/6  # noqa: E501
-        options[key_id] = not value
-        options[key_id] = value
-
     # Ensure output directory exists
     parent_dir = os.path.dirname(filepath)
     os.makedirs(parent_dir, exist_ok=True)
 
-    if c4d.documents.SaveDocument(
-        doc,
-        filepath,
-        c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST,
-        c4d.FORMAT_ABCEXPORT,
-    ):
+    with options.applied(applied_options, verbose=verbose):
+        succeeded = _save_document(
+            doc,
+            filepath,
+            c4d.FORMAT_ABCEXPORT,
+            label="Alembic",
+            objects=isolate_objects,
+        )
+    if succeeded:
         if verbose:
             log.debug("Extracted Alembic to: %s", filepath)
     else:
-        log.error("Extraction of Alembic failed: %s", filepath)
+        raise ExportError(f"Extraction of Alembic failed: {filepath}")
 
     return filepath
 
@@ -180,62 +522,59 @@ def extract_fbx(filepath, verbose=False, **kwargs):
     """Extract a single fbx file."""
 
     doc = c4d.documents.GetActiveDocument()
-    options = get_plugin_imexport_options(FBX_EXPORTER_ID,
-                                                     label="FBX")
-
-    # File format
-    options[c4d.FBXEXPORT_FBX_VERSION] = kwargs.get("fbxVersion", 0)
-    options[c4d.FBXEXPORT_ASCII] = kwargs.get("fbxAscii", False)
-
-    # General
-    options[c4d.FBXEXPORT_SELECTION_ONLY] = kwargs.get("selectionOnly", False)
-    options[c4d.FBXEXPORT_CAMERAS] = kwargs.get("cameras", True)
-    options[c4d.FBXEXPORT_SPLINES] = kwargs.get("splines", True)
-    options[c4d.FBXEXPORT_INSTANCES] = kwargs.get("instances", True)
-    options[c4d.FBXEXPORT_GLOBAL_MATRIX] = kwargs.get("globalMatrix", False)
-    options[c4d.FBXEXPORT_SDS] = kwargs.get("subdivisionSurfaces", True)
-    options[c4d.FBXEXPORT_LIGHTS] = kwargs.get("lights", True)
-
-    # Animation
-    options[c4d.FBXEXPORT_TRACKS] = kwargs.get("tracks", False)
-    options[c4d.FBXEXPORT_BAKE_ALL_FRAMES] = kwargs.get(
-        "bakeAllFrames", False
-    )
-    options[c4d.FBXEXPORT_PLA_TO_VERTEXCACHE] = kwargs.get(
-        "plaToVertexCache", False
-    )
 
-    # Geometry
-    options[c4d.FBXEXPORT_SAVE_NORMALS] = kwargs.get("normals", False)
-    options[c4d.FBXEXPORT_SAVE_VERTEX_MAPS_AS_COLORS] = kwargs.get(
-        "vertexMapsAsColors", False
-    )
-    options[c4d.FBXEXPORT_SAVE_VERTEX_COLORS] = kwargs.get(
-        "vertexColors", False
-    )
-    options[c4d.FBXEXPORT_TRIANGULATE] = kwargs.get("triangulate", False)
-    options[c4d.FBXEXPORT_SDS_SUBDIVISION] = kwargs.get(
-        "bakedSubdivisionSurfaces", False
-    )
-    options[c4d.FBXEXPORT_LOD_SUFFIX] = kwargs.get("lodSuffix", False)
+    applied_options = {
+        # File format
+        "FBXEXPORT_FBX_VERSION": kwargs.get("fbxVersion", 0),
+        "FBXEXPORT_ASCII": kwargs.get("fbxAscii", False),
 
-    # Additional
+        # General
+        "FBXEXPORT_SELECTION_ONLY": kwargs.get("selectionOnly", False),
+        "FBXEXPORT_CAMERAS": kwargs.get("cameras", True),
+        "FBXEXPORT_SPLINES": kwargs.get("splines", True),
+        "FBXEXPORT_INSTANCES": kwargs.get("instances", True),
+        "FBXEXPORT_GLOBAL_MATRIX": kwargs.get("globalMatrix", False),
+        "FBXEXPORT_SDS": kwargs.get("subdivisionSurfaces", True),
+        "FBXEXPORT_LIGHTS": kwargs.get("lights", True),
+
+        # Animation
+        "FBXEXPORT_TRACKS": kwargs.get("tracks", False),
+        "FBXEXPORT_BAKE_ALL_FRAMES": kwargs.get("bakeAllFrames", False),
+        "FBXEXPORT_PLA_TO_VERTEXCACHE": kwargs.get(
+            "plaToVertexCache", False
+        ),
+
+        # Geometry
+        "FBXEXPORT_SAVE_NORMALS": kwargs.get("normals", False),
+        "FBXEXPORT_SAVE_VERTEX_MAPS_AS_COLORS": kwargs.get(
+            "vertexMapsAsColors", False
+        ),
+        "FBXEXPORT_SAVE_VERTEX_COLORS": kwargs.get("vertexColors", False),
+        "FBXEXPORT_TRIANGULATE": kwargs.get("triangulate", False),
+        "FBXEXPORT_SDS_SUBDIVISION": kwargs.get(
+            "bakedSubdivisionSurfaces", False
+        ),
+        "FBXEXPORT_LOD_SUFFIX": kwargs.get("lodSuffix", False),
+
+        # Additional
+        "FBXEXPORT_EMBED_TEXTURES": kwargs.get("embedTextures", False),
+        "FBXEXPORT_FLIP_Z_AXIS": kwargs.get("flipZAxis", False),
+        "FBXEXPORT_SUBSTANCES": kwargs.get("substances", False),
+        "FBXEXPORT_UP_AXIS": kwargs.get(
+            "upAxis", c4d.FBXEXPORT_UP_AXIS_Y
+        ),
+    }
     if hasattr(c4d, "FBXEXPORT_TEXTURES"):
         # Cinema4d S22 doesn't have this option anymore
-        options[c4d.FBXEXPORT_TEXTURES] = kwargs.get("textures", False)
+        applied_options["FBXEXPORT_TEXTURES"] = kwargs.get("textures", False)
     if hasattr(c4d, "FBXEXPORT_BAKE_MATERIALS"):
         # Cinema4d S22 now has the ability to bake materials
-        options[c4d.FBXEXPORT_BAKE_MATERIALS] = kwargs.get(
+        applied_options["FBXEXPORT_BAKE_MATERIALS"] = kwargs.get(
             "bakeMaterials", False
         )
-    options[c4d.FBXEXPORT_EMBED_TEXTURES] = kwargs.get(
-        "embedTextures", False
-    )
-    options[c4d.FBXEXPORT_FLIP_Z_AXIS] = kwargs.get("flipZAxis", False)
-    options[c4d.FBXEXPORT_SUBSTANCES] = kwargs.get("substances", False)
-    options[c4d.FBXEXPORT_UP_AXIS] = kwargs.get(
-        "upAxis", c4d.FBXEXPORT_UP_AXIS_Y
-    )
+
+    # Set export options
+    options = get_exporter_options(FBX_EXPORTER_ID, label="FBX")
 
     # Ensure output directory exists
     parent_dir = os.path.dirname(filepath)
@@ -248,12 +587,14 @@ def extract_fbx(filepath, verbose=False, **kwargs):
             json.dumps(kwargs, indent=4),
         )
 
-    if c4d.documents.SaveDocument(
-        doc,
-        filepath,
-        c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST,
-        FBX_EXPORTER_ID,
-    ):
+    with options.applied(applied_options, verbose=verbose):
+        succeeded = c4d.documents.SaveDocument(
+            doc,
+            filepath,
+            c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST,
+            FBX_EXPORTER_ID,
+        )
+    if succeeded:
         if verbose:
             log.debug("Extracted FBX to: %s", filepath)
     else:
@@ -272,8 +613,17 @@ def extract_redshiftproxy(
         export_compress=True,
         export_polygon_connectivity=False,
         doc=None,
-        verbose=False):
-    """Extract a Redshift Proxy."""
+        verbose=False,
+        isolate_objects=None):
+    """Extract a Redshift Proxy.
+
+    When `isolate_objects` are provided only those objects are exported
+    from an isolated document, see `isolate_document`.
+
+    Raises:
+        ExportError: When the export fails.
+
+    """
 
     # Redshift may not be available so we import here
     import redshift  # noqa
@@ -290,10 +640,6 @@ def extract_redshiftproxy(
     scale = c4d.UnitScaleData()
     scale.SetUnitScale(1.0, c4d.DOCUMENT_UNIT_CM)
 
-    # Set export options
-    options = get_plugin_imexport_options(redshift.Frsproxyexport,
-                                          label="Alembic")
-
     applied_options = {
         "REDSHIFT_PROXYEXPORT_ANIMATION_FRAME_END": frame_end,
         "REDSHIFT_PROXYEXPORT_ANIMATION_FRAME_START": frame_start,
@@ -332,36 +678,38 @@ def extract_redshiftproxy(
         # "REDSHIFT_PROXYEXPORT_GROUP_AUTOPROXY": ...,
         # "REDSHIFT_PROXYEXPORT_GROUP_OPTIONS": ...,
     }
+
+    # Set export options. Like for the Alembic export all boolean and integer
+    # options are toggled to ensure they are applied for the export.
+    options = get_exporter_options(
+        redshift.Frsproxyexport,
+        label="Redshift Proxy",
+        toggle_keys=set(applied_options),
+    )
+
     if verbose:
         log.debug(
             "Preparing Redshift Proxy export with options: %s",
             json.dumps(applied_options, indent=4, default=str),
         )
 
-    for key, value in applied_options.items():
-        key_id = getattr(c4d, key)
-        # There appears to be a bug where if the value is just set directly
-        # that it fails to apply them for the export, e.g. still exporting the
-        # whole scene even though `c4d.ABCEXPORT_SELECTION_ONLY` is True.
-        # See: https://developers.maxon.net/forum/topic/12767/alembic-export-options-not-working/6  # noqa: E501
-        if isinstance(value, (bool, int)):
-            options[key_id] = not value
-        options[key_id] = value
-
     # Ensure output directory exists
     parent_dir = os.path.dirname(filepath)
     os.makedirs(parent_dir, exist_ok=True)
 
-    if c4d.documents.SaveDocument(
-        doc,
-        filepath,
-        c4d.SAVEDOCUMENTFLAGS_DONTADDTORECENTLIST,
-        redshift.Frsproxyexport,
-    ):
+    with options.applied(applied_options, verbose=verbose):
+        succeeded = _save_document(
+            doc,
+            filepath,
+            redshift.Frsproxyexport,
+            label="Redshift Proxy",
+            objects=isolate_objects,
+        )
+    if succeeded:
         if verbose:
             log.debug("Extracted Redshift Proxy to: %s", filepath)
     else:
-        log.error("Extraction of Redshift Proxy failed: %s", filepath)
+        raise ExportError(f"Extraction of Redshift Proxy failed: {filepath}")
 
     return filepath
 
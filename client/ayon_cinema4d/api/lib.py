@@ -2,10 +2,14 @@
 import contextlib
 import math
 import json
+import os
+import sys
+import weakref
 
 import c4d
 
 from ayon_core.lib import NumberDef
+from ayon_core.pipeline.create import UnavailableSharedData
 
 AYON_CONTAINERS = "AYON_CONTAINERS"
 JSON_PREFIX = "JSON::"
@@ -27,7 +31,7 @@ def collect_animation_defs(create_context, fps=False):
     """
 
     # use task entity attributes to set defaults based on current context
-    task_entity = create_context.get_current_task_entity()
+    task_entity = get_create_context_cache(create_context).get_task_entity()
     attrib: dict = task_entity["attrib"]
     frame_start: int = attrib["frameStart"]
     frame_end: int = attrib["frameEnd"]
@@ -67,6 +71,157 @@ def collect_animation_defs(create_context, fps=False):
     return defs
 
 
+class CreateContextCache:
+    """Memoize entity and product name lookups for a create context.
+
+    Creators query the current project, folder and task entities and compute
+    product names for each instance they collect, e.g. once per Take for
+    render instances. This fetches each entity only once and caches product
+    names per creator, variant, product type and task.
+
+    The cache is invalidated when the current project, folder or task of the
+    create context changes and at the start of each collection pass of a
+    publisher reset, since the entities may have changed on the server. Use
+    `get_create_context_cache` to retrieve the cache for a create context.
+
+    """
+    def __init__(self, create_context):
+        self._create_context_ref = weakref.ref(create_context)
+        self._context_key = None
+        self._data = {}
+        self._product_names = {}
+
+    @property
+    def create_context(self):
+        return self._create_context_ref()
+
+    def _validate(self):
+        create_context = self.create_context
+        context_key = (
+            create_context.get_current_project_name(),
+            create_context.get_current_folder_path(),
+            create_context.get_current_task_name(),
+        )
+        if context_key != self._context_key:
+            self.clear()
+            self._context_key = context_key
+
+    def _get(self, key, getter):
+        self._validate()
+        if key not in self._data:
+            self._data[key] = getter()
+        return self._data[key]
+
+    def get_project_name(self) -> str:
+        return self._get(
+            "project_name", self.create_context.get_current_project_name
+        )
+
+    def get_folder_entity(self) -> dict:
+        return self._get(
+            "folder_entity", self.create_context.get_current_folder_entity
+        )
+
+    def get_task_entity(self) -> dict:
+        return self._get(
+            "task_entity", self.create_context.get_current_task_entity
+        )
+
+    def get_product_name(self, creator, variant, product_type) -> str:
+        """Return product name for the creator in the current context.
+
+        Arguments:
+            creator (BaseCreator): The creator to compute product name for.
+            variant (str): The product variant.
+            product_type (str): The product type.
+
+        Returns:
+            str: The product name.
+
+        """
+        task_entity = self.get_task_entity()
+        task_name = task_entity["name"] if task_entity else None
+        key = (creator.identifier, variant, product_type, task_name)
+        product_name = self._product_names.get(key)
+        if product_name is None:
+            product_name = creator.get_product_name(
+                self.get_project_name(),
+                self.get_folder_entity(),
+                task_entity,
+                variant,
+                self.create_context.host_name,
+                product_type=product_type,
+            )
+            self._product_names[key] = product_name
+        return product_name
+
+    def clear(self):
+        self._context_key = None
+        self._data.clear()
+        self._product_names.clear()
+
+
+_create_context_caches = weakref.WeakKeyDictionary()
+
+
+def get_create_context_cache(create_context) -> CreateContextCache:
+    """Return the lookup cache for the create context.
+
+    Arguments:
+        create_context (CreateContext): The publisher's create context.
+
+    Returns:
+        CreateContextCache: The cache scoped to the create context.
+
+    """
+    cache = _create_context_caches.get(create_context)
+    if cache is None:
+        cache = CreateContextCache(create_context)
+        _create_context_caches[create_context] = cache
+
+    # Clear the cache once per collection pass of a publisher reset
+    try:
+        shared_data = create_context.collection_shared_data
+    except UnavailableSharedData:
+        shared_data = None
+    if shared_data is not None and not shared_data.get(
+            "cinema4d_create_context_cache_cleared"):
+        shared_data["cinema4d_create_context_cache_cleared"] = True
+        cache.clear()
+    return cache
+
+
+def get_texture_paths(doc=None):
+    """Return the filepaths of all textures used in the document.
+
+    This includes textures referenced by render engine materials, like
+    Redshift materials, that register their assets with Cinema 4D.
+
+    Args:
+        doc (Optional[c4d.documents.BaseDocument]): The document.
+            Defaults to the active document.
+
+    Returns:
+        list[str]: The texture filepaths.
+
+    """
+    doc = doc or active_document()
+    assets = []
+    c4d.documents.GetAllAssetsNew(
+        doc,
+        allowDialogs=False,
+        lastPath="",
+        flags=c4d.ASSETDATA_FLAG_TEXTURESONLY,
+        assetList=assets
+    )
+    paths = []
+    for asset in assets:
+        path = asset.get("filename")
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
 def get_main_window():
     return None
 
@@ -81,6 +236,50 @@ def active_document():
     return c4d.documents.GetActiveDocument()
 
 
+def prune_closed_document_caches(caches):
+    """Remove the cache entries of documents that are no longer open.
+
+    Arguments:
+        caches (dict[int, Any]): Caches keyed by the `hash` of a document.
+    """
+    open_documents = set()
+    open_doc = c4d.documents.GetFirstDocument()
+    while open_doc:
+        open_documents.add(hash(open_doc))
+        open_doc = open_doc.GetNext()
+    for cache_key in list(caches):
+        if cache_key not in open_documents:
+            caches.pop(cache_key)
+
+
+def get_commandline_executable() -> str:
+    """Return the path to the Cinema 4D command line render executable.
+
+    The executable is located next to the running Cinema 4D application.
+    """
+    app_dir = os.path.dirname(c4d.storage.GeGetStartupApplication())
+    if sys.platform == "win32":
+        return os.path.join(app_dir, "Commandline.exe")
+    if sys.platform == "darwin":
+        return os.path.join(
+            app_dir, "Commandline.app", "Contents", "MacOS", "Commandline")
+    return os.path.join(app_dir, "Commandline")
+
+
+def get_python_executable() -> str:
+    """Return the path to the `c4dpy` executable of the running Cinema 4D.
+
+    The executable is located next to the running Cinema 4D application.
+    """
+    app_dir = os.path.dirname(c4d.storage.GeGetStartupApplication())
+    if sys.platform == "win32":
+        return os.path.join(app_dir, "c4dpy.exe")
+    if sys.platform == "darwin":
+        return os.path.join(
+            app_dir, "c4dpy.app", "Contents", "MacOS", "c4dpy")
+    return os.path.join(app_dir, "c4dpy")
+
+
 @contextlib.contextmanager
 def maintained_selection():
     """Maintain selection during context."""
@@ -107,9 +306,14 @@ def set_selection(doc, nodes):
 
 
 @contextlib.contextmanager
-def undo_chunk():
-    """Open a undo chunk during context."""
-    doc = active_document()
+def undo_chunk(doc=None):
+    """Open a undo chunk during context.
+
+    Arguments:
+        doc (optional c4d.documents.BaseDocument): The document to open the
+            undo chunk in. Default is the active document.
+    """
+    doc = doc or active_document()
     try:
         doc.StartUndo()
         yield
@@ -117,6 +321,24 @@ def undo_chunk():
         doc.EndUndo()
 
 
+def remove_nodes(nodes, doc=None):
+    """Remove nodes from the document in a single undo step.
+
+    Only a single `c4d.EventAdd` is fired after all nodes are removed.
+
+    Arguments:
+        nodes (Iterable[c4d.GeListNode]): The nodes to remove.
+        doc (optional c4d.documents.BaseDocument): The document the nodes
+            belong to. Default is the active document.
+    """
+    doc = doc or active_document()
+    with undo_chunk(doc):
+        for node in nodes:
+            doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, node)
+            node.Remove()
+    c4d.EventAdd()
+
+
 def get_unique_namespace(folder_name, prefix=None, suffix=None, doc=None):
     """Get a unique namespace for a newly loaded asset.
 
@@ -360,6 +582,37 @@ def iter_all_children(obj):
         yield child_obj
 
 
+def get_object_index_path(obj):
+    """Return the sibling indices from the root object down to the object.
+
+    Unlike the object itself the index path identifies the object in a
+    saved copy of the document, see `get_object_by_index_path`.
+    """
+    index_path = []
+    while obj is not None:
+        index = 0
+        previous = obj.GetPred()
+        while previous is not None:
+            index += 1
+            previous = previous.GetPred()
+        index_path.append(index)
+        obj = obj.GetUp()
+    index_path.reverse()
+    return index_path
+
+
+def get_object_by_index_path(doc, index_path):
+    """Return the object at the index path, see `get_object_index_path`."""
+    obj = None
+    siblings = doc.GetObjects()
+    for index in index_path:
+        if index >= len(siblings):
+            return None
+        obj = siblings[index]
+        siblings = obj.GetChildren()
+    return obj
+
+
 def get_all_children(obj):
     """Returns all children of an object, including grandchildren."""
     return list(iter_all_children(obj))
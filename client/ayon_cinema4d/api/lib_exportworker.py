@@ -0,0 +1,291 @@
+"""Pool of headless worker processes exporting from a scene snapshot.
+
+Each export job is written to a JSON job file that is passed to a worker
+process, e.g. `c4dpy export_worker.py <job file>`. The worker reports its
+result as a single line prefixed with `RESULT_PREFIX` on its output.
+
+This module does not depend on the `c4d` module so the pool can be used
+with any worker executable, e.g. a stub worker reporting the results.
+"""
+from __future__ import annotations
+import collections
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, Optional
+
+import attr
+
+log = logging.getLogger(__name__)
+
+RESULT_PREFIX = "AYON_EXPORT_RESULT:"
+
+
+@attr.s
+class ExportJob:
+    """A single export from the scene snapshot.
+
+    Attributes:
+        job_type: The exporter to use, e.g. "alembic" or "redshiftproxy".
+        scene_path: The scene snapshot to export from.
+        filepath: The output filepath.
+        objects: The objects to export as hierarchy index paths.
+        options: Keyword arguments for the exporter.
+        document_path: The directory of the original scene, to resolve
+            relative paths in the snapshot against.
+
+    """
+    job_type: str = attr.ib()
+    scene_path: str = attr.ib()
+    filepath: str = attr.ib()
+    objects: list[list[int]] = attr.ib(factory=list)
+    options: dict[str, Any] = attr.ib(factory=dict)
+    document_path: str = attr.ib(default="")
+    id: str = attr.ib(factory=lambda: uuid.uuid4().hex)
+
+    def to_dict(self) -> dict:
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExportJob":
+        return cls(**data)
+
+    def __str__(self) -> str:
+        return f"{self.job_type} {os.path.basename(self.filepath)}"
+
+
+@attr.s
+class ExportResult:
+    """The result of an export job reported by a worker."""
+    job_id: str = attr.ib()
+    succeeded: bool = attr.ib(default=False)
+    message: str = attr.ib(default="")
+    duration: float = attr.ib(default=0.0)
+
+    def to_dict(self) -> dict:
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExportResult":
+        return cls(**data)
+
+
+def format_result(result: ExportResult) -> str:
+    """Return the output line a worker reports the result with."""
+    return RESULT_PREFIX + json.dumps(result.to_dict())
+
+
+def parse_result(line: str) -> Optional[ExportResult]:
+    """Return the result reported on a worker output line, if any."""
+    line = line.strip()
+    if not line.startswith(RESULT_PREFIX):
+        return None
+    try:
+        return ExportResult.from_dict(
+            json.loads(line[len(RESULT_PREFIX):]))
+    except (ValueError, TypeError) as exc:
+        log.debug(f"Invalid export worker result: {exc}")
+        return None
+
+
+class ExportWorkerPool:
+    """Run export jobs with a pool of parallel worker processes.
+
+    Jobs are started as soon as they are submitted, up to `processes` at
+    the same time. Use `iter_results` to process the results in the order
+    the jobs finish.
+
+    Args:
+        executable: The worker executable, e.g. `c4dpy`.
+        script: The worker script passed to the executable.
+        processes: The number of parallel workers. Defaults to half the
+            CPU count when zero.
+        env: The environment for the worker processes.
+        sys_path: Python paths the worker adds before running the job.
+        output_lines: The number of output lines kept to report failures.
+        cleanup_paths: Directories removed on shutdown, e.g. the directory
+            of the scene snapshot.
+
+    Pools that are not shut down, e.g. because the publish stopped before
+    their results were collected, are shut down with
+    `shutdown_active_pools`.
+
+    """
+
+    def __init__(
+        self,
+        executable: str,
+        script: str,
+        processes: int = 0,
+        env: Optional[dict[str, str]] = None,
+        sys_path: Optional[list[str]] = None,
+        output_lines: int = 50,
+        cleanup_paths: Optional[list[str]] = None,
+    ):
+        if processes <= 0:
+            processes = max(1, (os.cpu_count() or 1) // 2)
+        self.executable: str = executable
+        self.script: str = script
+        self.processes: int = processes
+        self.env: Optional[dict[str, str]] = env
+        self.sys_path: list[str] = list(sys_path or [])
+        self.output_lines: int = output_lines
+        self.cleanup_paths: list[str] = list(cleanup_paths or [])
+
+        self._executor = ThreadPoolExecutor(max_workers=processes)
+        self._pending: dict[Future, ExportJob] = {}
+        self._callbacks: dict[str, Callable[[ExportResult], None]] = {}
+        self._job_dir: str = tempfile.mkdtemp(prefix="ayon_c4d_export_")
+        self._processes: set[subprocess.Popen] = set()
+        self._lock = threading.Lock()
+        self._cancelled: bool = False
+        _active_pools.append(self)
+
+    def build_command(self, job_file: str) -> list[str]:
+        return [self.executable, self.script, job_file]
+
+    def submit(
+        self,
+        job: ExportJob,
+        callback: Optional[Callable[[ExportResult], None]] = None,
+    ) -> Future:
+        """Start the job and return its future result.
+
+        The `callback` is called with the result of a succeeded job from
+        `iter_results`, in the thread iterating the results. When it raises
+        an error the result is marked as failed with the error message.
+        """
+        future: Future = self._executor.submit(self._run, job)
+        self._pending[future] = job
+        if callback is not None:
+            self._callbacks[job.id] = callback
+        return future
+
+    def iter_results(
+        self,
+        timeout: Optional[float] = None
+    ) -> Iterator[tuple[ExportJob, ExportResult]]:
+        """Yield the submitted jobs with their result as they finish.
+
+        The callback of each succeeded job is called before it is yielded.
+        """
+        pending = dict(self._pending)
+        self._pending.clear()
+        for future in as_completed(pending, timeout=timeout):
+            job: ExportJob = pending[future]
+            result: ExportResult = future.result()
+            callback = self._callbacks.pop(job.id, None)
+            if callback is not None and result.succeeded:
+                try:
+                    callback(result)
+                except Exception as exc:
+                    log.debug(f"Callback of {job} failed.", exc_info=True)
+                    result.succeeded = False
+                    result.message = str(exc)
+            yield job, result
+
+    def shutdown(self, cancel: bool = False):
+        """Wait for the running jobs and remove the job files.
+
+        Args:
+            cancel: Kill the running workers and skip the queued jobs
+                instead of waiting for them.
+
+        """
+        if cancel:
+            with self._lock:
+                self._cancelled = True
+                for process in self._processes:
+                    process.kill()
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        self._pending.clear()
+        self._callbacks.clear()
+        for path in [self._job_dir, *self.cleanup_paths]:
+            shutil.rmtree(path, ignore_errors=True)
+        if self in _active_pools:
+            _active_pools.remove(self)
+
+    def __enter__(self) -> "ExportWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def _run(self, job: ExportJob) -> ExportResult:
+        job_file = os.path.join(self._job_dir, f"{job.id}.json")
+        with open(job_file, "w") as f:
+            json.dump({"job": job.to_dict(), "sys_path": self.sys_path}, f)
+
+        command: list[str] = self.build_command(job_file)
+        log.debug(f"Running: {subprocess.list2cmdline(command)}")
+        start = time.perf_counter()
+        with self._lock:
+            if self._cancelled:
+                return ExportResult(
+                    job_id=job.id, message="Export worker was cancelled")
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    env=self.env,
+                    text=True,
+                    errors="replace",
+                )
+            except OSError as exc:
+                return ExportResult(
+                    job_id=job.id,
+                    message=f"Failed to start export worker: {exc}",
+                )
+            self._processes.add(process)
+
+        result: Optional[ExportResult] = None
+        output: collections.deque = collections.deque(
+            maxlen=self.output_lines)
+        for line in process.stdout:
+            reported = parse_result(line)
+            if reported is not None:
+                result = reported
+            else:
+                output.append(line.rstrip())
+        returncode: int = process.wait()
+        with self._lock:
+            self._processes.discard(process)
+
+        if result is None:
+            result = ExportResult(
+                job_id=job.id,
+                message=(
+                    f"Export worker exited with code {returncode} without "
+                    "reporting a result:\n" + "\n".join(output)
+                ),
+            )
+        elif returncode != 0 and result.succeeded:
+            result.succeeded = False
+            result.message = f"Export worker exited with code {returncode}"
+        if not result.duration:
+            result.duration = time.perf_counter() - start
+        return result
+
+
+_active_pools: list[ExportWorkerPool] = []
+
+
+def shutdown_active_pools() -> int:
+    """Cancel all pools that were not shut down yet.
+
+    Returns:
+        int: The number of pools that were shut down.
+
+    """
+    pools = list(_active_pools)
+    for pool in pools:
+        pool.shutdown(cancel=True)
+    return len(pools)
@@ -0,0 +1,435 @@
+"""Frame sequence helpers for render products.
+
+This module does not depend on the `c4d` module.
+"""
+from __future__ import annotations
+import os
+import re
+from typing import Iterable, Iterator
+
+import attr
+
+
+@attr.s(frozen=True)
+class FrameSequence:
+    """Compact description of a sequence of frame files.
+
+    Each file path is `head` + zero padded frame number + `tail`. The paths
+    are only generated when iterating the sequence so that long sequences
+    with many AOVs do not need to hold every single path in memory.
+
+    Frames in `holes` are excluded from the sequence.
+    """
+    head: str = attr.ib()
+    padding: int = attr.ib()
+    tail: str = attr.ib()
+    start: int = attr.ib()
+    end: int = attr.ib()
+    step: int = attr.ib(default=1)
+    holes: frozenset[int] = attr.ib(default=frozenset(), converter=frozenset)
+
+    @classmethod
+    def from_range_set(
+        cls, head: str, padding: int, tail: str, frames: FrameRangeSet
+    ) -> FrameSequence:
+        """Return the sequence of files for the frames in the range set.
+
+        Frames in between multiple ranges are stored as holes.
+        """
+        frame_range = frames.as_range()
+        if frame_range is not None:
+            return cls(head, padding, tail,
+                       start=frame_range.start,
+                       end=frame_range.stop - 1,
+                       step=frame_range.step)
+
+        holes = set(range(frames.first, frames.last + 1)).difference(frames)
+        return cls(head, padding, tail,
+                   start=frames.first,
+                   end=frames.last,
+                   holes=holes)
+
+    def frames(self) -> Iterator[int]:
+        """Yield the frame numbers in the sequence."""
+        for frame in range(self.start, self.end + 1, self.step):
+            if frame not in self.holes:
+                yield frame
+
+    def format(self, frame: int) -> str:
+        """Return the file path for the frame."""
+        return f"{self.head}{str(frame).zfill(self.padding)}{self.tail}"
+
+    def to_list(self) -> list[str]:
+        """Return the file paths of all frames in the sequence."""
+        return list(self)
+
+    def to_frame_list(self) -> str:
+        """Return the frames as compact frame list string."""
+        if self.holes:
+            return format_frame_ranges(self.frames())
+        # Avoid iterating all frames of the sequence
+        return FrameRangeSet.from_range(
+            self.start, self.end, self.step).to_frame_list()
+
+    def __iter__(self) -> Iterator[str]:
+        for frame in self.frames():
+            yield self.format(frame)
+
+    def __len__(self) -> int:
+        total: int = len(range(self.start, self.end + 1, self.step))
+        if not self.holes:
+            return total
+        return sum(1 for _ in self.frames())
+
+    def __str__(self) -> str:
+        frame_range = f"{self.start}-{self.end}"
+        if self.step != 1:
+            frame_range += f"x{self.step}"
+        label = f"{self.head}%0{self.padding}d{self.tail} [{frame_range}]"
+        if self.holes:
+            holes = ", ".join(str(frame) for frame in sorted(self.holes))
+            label += f" (holes: {holes})"
+        return label
+
+
+@attr.s(frozen=True)
+class FrameRangeSet:
+    """Set of frames stored as sorted, merged `(start, end, step)` ranges.
+
+    Use this to describe the frames that will actually be rendered without
+    listing every single frame.
+
+    Examples:
+        >>> frames = FrameRangeSet.from_range(1001, 1010, 3)
+        >>> str(frames), len(frames), frames.last
+        ('1001-1010x3', 4, 1010)
+        >>> str(frames.union(FrameRangeSet.from_range(1020, 1020)))
+        '1001-1010x3,1020'
+
+    """
+    ranges: tuple[tuple[int, int, int], ...] = attr.ib(
+        default=(), converter=tuple)
+
+    @classmethod
+    def from_range(cls, start: int, end: int, step: int = 1) -> FrameRangeSet:
+        """Return the frames from `start` up to and including `end`."""
+        frames = range(start, end + 1, max(1, step))
+        if len(frames) > 2:
+            return cls(((frames[0], frames[-1], frames.step),))
+        return cls.from_frames(frames)
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[int]) -> FrameRangeSet:
+        return cls(frames_to_ranges(frames))
+
+    @classmethod
+    def parse(cls, frame_list: str) -> FrameRangeSet:
+        """Return the frames of a frame list string, e.g. `1001-1100x2,1200`.
+        """
+        return cls.from_frames(parse_frame_ranges(frame_list))
+
+    @property
+    def first(self) -> int:
+        return self.ranges[0][0]
+
+    @property
+    def last(self) -> int:
+        return self.ranges[-1][1]
+
+    def as_range(self) -> range | None:
+        """Return the frames as a single `range` if possible."""
+        if not self.ranges:
+            return range(0)
+        if len(self.ranges) != 1:
+            return None
+        start, end, step = self.ranges[0]
+        return range(start, end + 1, step)
+
+    def union(self, other: FrameRangeSet) -> FrameRangeSet:
+        if not other.ranges:
+            return self
+        if not self.ranges:
+            return other
+        return FrameRangeSet.from_frames(set(self) | set(other))
+
+    def to_frame_list(self) -> str:
+        """Return the frames as compact frame list string."""
+        return _format_ranges(self.ranges)
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end, step in self.ranges:
+            yield from range(start, end + 1, step)
+
+    def __len__(self) -> int:
+        return sum(
+            len(range(start, end + 1, step))
+            for start, end, step in self.ranges
+        )
+
+    def __contains__(self, frame: int) -> bool:
+        return any(
+            start <= frame <= end and (frame - start) % step == 0
+            for start, end, step in self.ranges
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def __str__(self) -> str:
+        return self.to_frame_list()
+
+
+def expand_files(files: FrameSequence | list[str]) -> list[str]:
+    """Return the file paths as a list.
+
+    Use this at the boundary where a list of file paths is required.
+    """
+    if isinstance(files, FrameSequence):
+        return files.to_list()
+    return list(files)
+
+
+def frames_to_ranges(frames: Iterable[int]) -> list[tuple[int, int, int]]:
+    """Return the frames as a minimal list of `(start, end, step)` ranges.
+
+    Examples:
+        >>> frames_to_ranges([1, 2, 3, 5, 7, 9, 20])
+        [(1, 3, 1), (5, 9, 2), (20, 20, 1)]
+
+    """
+    frames = sorted(set(frames))
+    ranges: list[tuple[int, int, int]] = []
+    index = 0
+    while index < len(frames):
+        start = frames[index]
+        if index + 1 == len(frames):
+            ranges.append((start, start, 1))
+            break
+
+        step = frames[index + 1] - start
+        end_index = index + 1
+        while (
+            end_index + 1 < len(frames)
+            and frames[end_index + 1] - frames[end_index] == step
+        ):
+            end_index += 1
+
+        if end_index == index + 1 and step != 1:
+            # Two frames far apart are better described as single frames
+            # so the next frame can start its own run.
+            ranges.append((start, start, 1))
+            index += 1
+            continue
+
+        ranges.append((start, frames[end_index], step))
+        index = end_index + 1
+    return ranges
+
+
+def split_frame_range(
+    start: int,
+    end: int,
+    step: int,
+    shards: int
+) -> list[tuple[int, int]]:
+    """Split the frame range into at most `shards` contiguous ranges.
+
+    The ranges start on frames of the stepped frame range and differ at
+    most one frame in length.
+
+    Examples:
+        >>> split_frame_range(1001, 1010, 1, 3)
+        [(1001, 1004), (1005, 1007), (1008, 1010)]
+        >>> split_frame_range(1, 9, 2, 2)
+        [(1, 5), (7, 9)]
+
+    """
+    frames = range(int(start), int(end) + 1, max(1, int(step)))
+    shards = max(1, min(shards, len(frames)))
+    size, remainder = divmod(len(frames), shards)
+    ranges: list[tuple[int, int]] = []
+    index = 0
+    for shard in range(shards):
+        count = size + (1 if shard < remainder else 0)
+        if not count:
+            break
+        ranges.append((frames[index], frames[index + count - 1]))
+        index += count
+    return ranges
+
+
+def format_frame_ranges(frames: Iterable[int]) -> str:
+    """Return the frames as compact frame list string.
+
+    Examples:
+        >>> format_frame_ranges(range(1001, 2001))
+        '1001-2000x1'
+        >>> format_frame_ranges([1, 3, 5, 10])
+        '1-5x2,10'
+
+    """
+    return _format_ranges(frames_to_ranges(frames))
+
+
+def _format_ranges(ranges: Iterable[tuple[int, int, int]]) -> str:
+    labels: list[str] = []
+    for start, end, step in ranges:
+        if start == end:
+            labels.append(str(start))
+        else:
+            labels.append(f"{start}-{end}x{step}")
+    return ",".join(labels)
+
+
+def parse_frame_ranges(frame_ranges: str) -> list[int]:
+    """Return the frames of a frame list string.
+
+    This is the inverse of `format_frame_ranges`, e.g. `1001-2000x1,2010`.
+    """
+    frames: list[int] = []
+    for label in frame_ranges.split(","):
+        label = label.strip()
+        if not label:
+            continue
+
+        step = 1
+        if "x" in label:
+            label, step_str = label.split("x", 1)
+            step = int(step_str)
+
+        # Split on the separating dash, not a negative frame number's sign
+        start_str, sep, end_str = label[1:].partition("-")
+        start_str = label[0] + start_str
+        if not sep:
+            frames.append(int(start_str))
+            continue
+        frames.extend(range(int(start_str), int(end_str) + 1, step))
+    return frames
+
+
+def encode_compact_files(
+    products: dict[str, FrameSequence | list[str]]
+) -> dict[str, dict]:
+    """Encode render product files per AOV into a compact representation.
+
+    Each frame sequence is stored as its directory, a filename pattern with
+    a printf-style frame token and a frame list string instead of listing
+    every single file path. Products that are not a `FrameSequence` are
+    stored as a list of filenames relative to their common directory.
+
+    Use `decode_compact_files` to get the full list of files again.
+
+    Returns:
+        dict[str, dict]: The compact encoding per AOV name.
+
+    """
+    encoded: dict[str, dict] = {}
+    for aov_name, files in products.items():
+        if isinstance(files, FrameSequence):
+            directory, head = os.path.split(files.head)
+            pattern: str = "{}%0{}d{}".format(
+                head.replace("%", "%%"),
+                files.padding,
+                files.tail.replace("%", "%%")
+            )
+            encoded[aov_name] = {
+                "directory": directory,
+                "pattern": pattern,
+                "frames": files.to_frame_list(),
+            }
+            continue
+
+        files = list(files)
+        directory = os.path.dirname(files[0]) if files else ""
+        if all(os.path.dirname(path) == directory for path in files):
+            encoded[aov_name] = {
+                "directory": directory,
+                "files": [os.path.basename(path) for path in files],
+            }
+        else:
+            encoded[aov_name] = {"directory": "", "files": files}
+    return encoded
+
+
+def decode_compact_files(encoded: dict[str, dict]) -> dict[str, list[str]]:
+    """Decode the result of `encode_compact_files` into lists of files.
+
+    Returns:
+        dict[str, list[str]]: The file paths per AOV name.
+
+    """
+    decoded: dict[str, list[str]] = {}
+    for aov_name, data in encoded.items():
+        directory: str = data["directory"]
+        if "pattern" in data:
+            filenames = [
+                data["pattern"] % frame
+                for frame in parse_frame_ranges(data["frames"])
+            ]
+        else:
+            filenames = data["files"]
+
+        if directory:
+            # Join with the separator used by the encoded directory so that
+            # files decode the same on other platforms, e.g. on the farm.
+            sep: str = os.sep
+            if "/" in directory:
+                sep = "/"
+            elif "\\" in directory:
+                sep = "\\"
+            directory = directory.rstrip(sep)
+            decoded[aov_name] = [
+                f"{directory}{sep}{filename}" for filename in filenames
+            ]
+        else:
+            decoded[aov_name] = list(filenames)
+    return decoded
+
+
+@attr.s(frozen=True)
+class ScannedFrame:
+    """A frame file found by `scan_frame_files`."""
+    filename: str = attr.ib()
+    size: int = attr.ib()
+    padding: int = attr.ib()
+
+
+def scan_frame_files(
+    directory: str,
+    head: str,
+    tail: str,
+) -> dict[int, ScannedFrame]:
+    """Return the frame files in the directory with a single directory scan.
+
+    Files are matched as `head` + frame number + `tail` with any padding of
+    the frame number. The file size is read in the same pass.
+
+    Args:
+        directory: The directory to scan.
+        head: The filename up to the frame number.
+        tail: The filename after the frame number, e.g. the extension.
+
+    Returns:
+        dict[int, ScannedFrame]: The found files per frame number.
+
+    """
+    pattern = re.compile(
+        rf"^{re.escape(head)}(-?\d+){re.escape(tail)}$"
+    )
+    frames: dict[int, ScannedFrame] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if not match:
+                continue
+            frame_str: str = match.group(1)
+            try:
+                size: int = entry.stat().st_size
+            except OSError:
+                continue
+            frames[int(frame_str)] = ScannedFrame(
+                filename=entry.name,
+                size=size,
+                padding=len(frame_str.lstrip("-")),
+            )
+    return frames
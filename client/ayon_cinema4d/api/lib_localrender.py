@@ -0,0 +1,253 @@
+"""Local render scheduler running Cinema 4D command line renders.
+
+The frames of each take are split into chunks that are rendered by
+parallel command line render processes, each with its own thread budget.
+
+This module does not depend on the `c4d` module so it can be used with any
+render executable, e.g. a stub executable printing the expected progress.
+"""
+from __future__ import annotations
+import logging
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Pattern
+
+import attr
+
+from .lib_frames import FrameRangeSet
+from .lib_renderwatch import AOVStatus, RenderOutputWatcher
+
+log = logging.getLogger(__name__)
+
+# The Cinema 4D command line render logs e.g. "Rendering frame 1001 at ..."
+PROGRESS_REGEX: Pattern = re.compile(r"Rendering frame (-?\d+)", re.IGNORECASE)
+
+
+@attr.s
+class RenderJob:
+    """A take of a scene to render locally.
+
+    The `expected_files` are the output files per frame to validate the
+    render result against.
+    """
+    scene_path: str = attr.ib()
+    take: str = attr.ib()
+    frames: FrameRangeSet = attr.ib()
+    expected_files: dict[int, list[str]] = attr.ib(factory=dict)
+
+
+@attr.s
+class RenderChunk:
+    """A single command line render of consecutive frames of a job."""
+    job: RenderJob = attr.ib()
+    start: int = attr.ib()
+    end: int = attr.ib()
+    step: int = attr.ib(default=1)
+
+    attempts: int = attr.ib(default=0)
+    returncode: Optional[int] = attr.ib(default=None)
+    rendered_frames: set[int] = attr.ib(factory=set)
+    missing_files: list[str] = attr.ib(factory=list)
+
+    @property
+    def frames(self) -> range:
+        return range(self.start, self.end + 1, self.step)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.returncode == 0 and not self.missing_files
+
+    def __str__(self) -> str:
+        return f"{self.job.take} [{self.start}-{self.end}x{self.step}]"
+
+
+def split_frames(
+    job: RenderJob,
+    chunk_size: int
+) -> list[RenderChunk]:
+    """Split the frames of the job into chunks of at most `chunk_size` frames.
+    """
+    chunk_size = max(1, chunk_size)
+    chunks: list[RenderChunk] = []
+    for start, end, step in job.frames.ranges:
+        frames = range(start, end + 1, step)
+        for index in range(0, len(frames), chunk_size):
+            chunk_frames = frames[index:index + chunk_size]
+            chunks.append(RenderChunk(
+                job=job,
+                start=chunk_frames[0],
+                end=chunk_frames[-1],
+                step=step,
+            ))
+    return chunks
+
+
+@attr.s
+class LocalRenderScheduler:
+    """Render jobs with parallel command line render processes.
+
+    Attributes:
+        executable: The Cinema 4D command line render executable.
+        processes: The number of parallel render processes. Defaults to one
+            process per four CPU cores when zero.
+        threads: The render threads per process. Defaults to the CPU cores
+            divided by the number of processes when zero.
+        chunk_size: The maximum number of frames per render process.
+        retries: How often a failed chunk is rendered again.
+        env: The environment for the render processes.
+        progress_callback: Called with the chunk and frame number whenever
+            a render process reports a rendered frame.
+        watchers: Render output watchers per name, e.g. per instance, that
+            are polled every `watch_interval` seconds while rendering and
+            once more when the render finished.
+        watch_callback: Called with the name and the status per AOV after
+            each poll of a watcher.
+
+    """
+    executable: str = attr.ib()
+    processes: int = attr.ib(default=0)
+    threads: int = attr.ib(default=0)
+    chunk_size: int = attr.ib(default=10)
+    retries: int = attr.ib(default=2)
+    env: Optional[dict[str, str]] = attr.ib(default=None)
+    progress_callback: Optional[Callable[[RenderChunk, int], None]] = attr.ib(
+        default=None)
+    progress_regex: Pattern = attr.ib(default=PROGRESS_REGEX)
+    watchers: dict[str, RenderOutputWatcher] = attr.ib(factory=dict)
+    watch_interval: float = attr.ib(default=10.0)
+    watch_callback: Optional[
+        Callable[[str, dict[str, AOVStatus]], None]
+    ] = attr.ib(default=None)
+
+    def get_process_count(self, chunk_count: int) -> int:
+        processes: int = self.processes
+        if processes <= 0:
+            processes = max(1, (os.cpu_count() or 1) // 4)
+        return max(1, min(processes, chunk_count))
+
+    def get_thread_count(self, processes: int) -> int:
+        if self.threads > 0:
+            return self.threads
+        return max(1, (os.cpu_count() or 1) // processes)
+
+    def build_command(self, chunk: RenderChunk, threads: int) -> list[str]:
+        return [
+            self.executable,
+            "-nogui",
+            "-render", chunk.job.scene_path,
+            "-take", chunk.job.take,
+            "-frame", f"{chunk.start},{chunk.end},{chunk.step}",
+            "-threads", str(threads),
+        ]
+
+    def render(self, jobs: list[RenderJob]) -> list[RenderChunk]:
+        """Render all jobs and return the rendered chunks.
+
+        Check `RenderChunk.succeeded` of the returned chunks for the
+        result of each chunk.
+        """
+        chunks: list[RenderChunk] = []
+        for job in jobs:
+            chunks.extend(split_frames(job, self.chunk_size))
+        if not chunks:
+            return chunks
+
+        processes: int = self.get_process_count(len(chunks))
+        threads: int = self.get_thread_count(processes)
+        log.info(
+            f"Rendering {len(chunks)} chunks with {processes} processes "
+            f"of {threads} threads."
+        )
+        finished = threading.Event()
+        watch_thread: Optional[threading.Thread] = None
+        if self.watchers:
+            watch_thread = threading.Thread(
+                target=self._watch, args=(finished,), daemon=True)
+            watch_thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=processes) as executor:
+                for chunk in executor.map(
+                    lambda chunk: self._render_chunk(chunk, threads), chunks
+                ):
+                    if not chunk.succeeded:
+                        log.error(
+                            f"Render of {chunk} failed after "
+                            f"{chunk.attempts} attempts."
+                        )
+        finally:
+            finished.set()
+            if watch_thread is not None:
+                watch_thread.join()
+        return chunks
+
+    def _watch(self, finished: threading.Event):
+        """Poll the output watchers until the render finished."""
+        while True:
+            is_finished: bool = finished.wait(self.watch_interval)
+            for name, watcher in self.watchers.items():
+                status = watcher.poll()
+                if self.watch_callback:
+                    try:
+                        self.watch_callback(name, status)
+                    except Exception:
+                        log.debug("Render output callback failed.",
+                                  exc_info=True)
+            if is_finished:
+                return
+
+    def _render_chunk(self, chunk: RenderChunk, threads: int) -> RenderChunk:
+        while chunk.attempts <= self.retries:
+            chunk.attempts += 1
+            chunk.rendered_frames.clear()
+            try:
+                chunk.returncode = self._run(chunk, threads)
+            except OSError as exc:
+                log.error(f"Failed to start render of {chunk}: {exc}")
+                chunk.returncode = -1
+                return chunk
+
+            chunk.missing_files = self._get_missing_files(chunk)
+            if chunk.succeeded:
+                log.debug(f"Rendered {chunk}")
+                return chunk
+
+            log.warning(
+                f"Render of {chunk} failed (attempt {chunk.attempts}, "
+                f"exit code {chunk.returncode}, "
+                f"{len(chunk.missing_files)} missing files)"
+            )
+        return chunk
+
+    def _run(self, chunk: RenderChunk, threads: int) -> int:
+        command: list[str] = self.build_command(chunk, threads)
+        log.debug(f"Running: {subprocess.list2cmdline(command)}")
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self.env,
+            text=True,
+            errors="replace",
+        )
+        for line in process.stdout:
+            match = self.progress_regex.search(line)
+            if not match:
+                continue
+
+            frame = int(match.group(1))
+            chunk.rendered_frames.add(frame)
+            if self.progress_callback:
+                self.progress_callback(chunk, frame)
+        return process.wait()
+
+    @staticmethod
+    def _get_missing_files(chunk: RenderChunk) -> list[str]:
+        return [
+            path
+            for frame in chunk.frames
+            for path in chunk.job.expected_files.get(frame, [])
+            if not os.path.isfile(path)
+        ]
@@ -0,0 +1,183 @@
+"""Bake simulation cache tags once before the extractors run.
+
+Extractors otherwise each simulate dynamics and MoGraph from the start of
+the document for their own frame range. Once the cache tags are baked the
+exports play back the cached simulation instead.
+"""
+from __future__ import annotations
+import contextlib
+import logging
+from typing import Iterable, Iterator, Optional
+
+import attr
+
+import c4d
+
+from . import lib
+
+log = logging.getLogger(__name__)
+
+MOGRAPH_CACHE_TAG_ID = 1019337
+DYNAMICS_BODY_TAG_ID = 180000102
+
+# The bake button parameter per cache tag type
+BAKE_BUTTONS: dict[int, str] = {
+    MOGRAPH_CACHE_TAG_ID: "MGCACHETAG_BAKESEQUENCE",
+    DYNAMICS_BODY_TAG_ID: "RIGID_BODY_CACHE_BAKE",
+}
+
+
+@attr.s
+class BakedTag:
+    """A baked cache tag with a copy of the tag from before the bake."""
+    tag: c4d.BaseTag = attr.ib()
+    original: c4d.BaseTag = attr.ib()
+
+
+def iter_cache_tags(objects: Iterable[c4d.BaseObject]) -> Iterator[c4d.BaseTag]:
+    """Yield the bakeable cache tags of the objects and their children."""
+    processed: set[c4d.BaseObject] = set()
+    for obj in objects:
+        for node in (obj, *lib.iter_all_children(obj)):
+            if node in processed:
+                continue
+            processed.add(node)
+            for tag in node.GetTags():
+                if tag.GetType() in BAKE_BUTTONS:
+                    yield tag
+
+
+@contextlib.contextmanager
+def maintained_time_range(doc: c4d.documents.BaseDocument):
+    """Restore the document's time range and current time on exit."""
+    min_time, max_time = doc.GetMinTime(), doc.GetMaxTime()
+    current_time = doc.GetTime()
+    try:
+        yield
+    finally:
+        doc.SetMinTime(min_time)
+        doc.SetMaxTime(max_time)
+        doc.SetTime(current_time)
+
+
+def bake_cache_tags(
+    doc: c4d.documents.BaseDocument,
+    tags: Iterable[c4d.BaseTag],
+    frame_start: int,
+    frame_end: int,
+) -> list[BakedTag]:
+    """Bake the cache tags up to the end frame.
+
+    The simulations keep starting at the start of the document so the baked
+    result matches the simulation without the cache. Cache tags that are
+    disabled or whose bake button is not available are skipped.
+
+    Returns:
+        list[BakedTag]: The baked tags, to restore with `restore_cache_tags`.
+
+    """
+    fps: int = doc.GetFps()
+    baked: list[BakedTag] = []
+    with maintained_time_range(doc):
+        if doc.GetMinTime().GetFrame(fps) > frame_start:
+            doc.SetMinTime(c4d.BaseTime(frame_start, fps))
+        doc.SetMaxTime(c4d.BaseTime(frame_end, fps))
+
+        for tag in tags:
+            button_id = getattr(c4d, BAKE_BUTTONS[tag.GetType()], None)
+            if button_id is None or not tag.IsEnabled():
+                continue
+
+            log.debug(f"Baking cache tag of: {tag.GetObject().GetName()}")
+            original: c4d.BaseTag = tag.GetClone(c4d.COPYFLAGS_NONE)
+            c4d.CallButton(tag, button_id)
+            baked.append(BakedTag(tag=tag, original=original))
+    return baked
+
+
+def restore_cache_tags(baked: Iterable[BakedTag]):
+    """Restore the cache tags to their state from before the bake."""
+    for baked_tag in baked:
+        if not baked_tag.tag.IsAlive():
+            continue
+        baked_tag.original.CopyTo(baked_tag.tag, c4d.COPYFLAGS_NONE)
+
+
+class PreBake:
+    """Baked cache tags shared by the extractors of a publish.
+
+    The tags are restored once all `instance_ids` are extracted, or as soon
+    as an extraction fails, see `extracting`. Pre-bakes that were not
+    restored, e.g. because the publish stopped before any extraction, are
+    restored with `restore_pending_prebakes`.
+    """
+
+    def __init__(self, baked: list[BakedTag], instance_ids: Iterable[str]):
+        self.baked: list[BakedTag] = baked
+        self.pending: set[str] = set(instance_ids)
+        _pending_prebakes.append(self)
+
+    def restore(self):
+        if self in _pending_prebakes:
+            _pending_prebakes.remove(self)
+        restore_cache_tags(self.baked)
+        self.baked = []
+        c4d.EventAdd()
+
+    @contextlib.contextmanager
+    def extracting(self, instance_id: str):
+        """Restore the tags after the last instance or on failure."""
+        try:
+            yield
+        except BaseException:
+            log.debug("Extraction failed, restoring baked cache tags.")
+            self.restore()
+            raise
+        finally:
+            self.pending.discard(instance_id)
+            if not self.pending and self.baked:
+                self.restore()
+
+
+_pending_prebakes: list[PreBake] = []
+
+
+def restore_pending_prebakes() -> int:
+    """Restore all pre-bakes that were not restored yet.
+
+    Returns:
+        int: The number of restored pre-bakes.
+
+    """
+    pending = list(_pending_prebakes)
+    for prebake in pending:
+        prebake.restore()
+    return len(pending)
+
+
+@contextlib.contextmanager
+def extracting(instance):
+    """Extract the instance within the publish's pre-bake, if any."""
+    prebake: Optional[PreBake] = instance.context.data.get("preBake")
+    if prebake is None:
+        yield
+        return
+
+    with prebake.extracting(instance.id):
+        yield
+
+
+def get_unbaked_cache_tags(instance) -> list[c4d.BaseTag]:
+    """Return the enabled cache tags of the instance members not pre-baked.
+
+    Exports that start evaluating the document in the middle of the frame
+    range, e.g. frame range shards, simulate these tags incorrectly.
+    """
+    prebake: Optional[PreBake] = instance.context.data.get("preBake")
+    baked: set[c4d.BaseTag] = set()
+    if prebake is not None:
+        baked = {baked_tag.tag for baked_tag in prebake.baked}
+    return [
+        tag for tag in iter_cache_tags(instance[:])
+        if tag.IsEnabled() and tag not in baked
+    ]
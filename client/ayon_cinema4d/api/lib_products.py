@@ -0,0 +1,213 @@
+"""Render product engine computing expected files from snapshots.
+
+The `c4d` dependent part of collecting render products, resolving tokens
+of render data and takes, is captured once into plain snapshot records by
+`lib_renderproducts.snapshot_take`. This module computes the output files
+from those snapshots and does not depend on the `c4d` module.
+"""
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+import attr
+
+from .lib_frames import FrameRangeSet, FrameSequence
+
+# Placeholder for the `$take` token so that a compiled template can be shared
+# by all takes and the take name is filled in afterwards.
+TAKE_PLACEHOLDER = "____TAKE__NAME__PLACEHOLDER____"
+
+# Frame number used to locate the `$frame` token in a resolved path. It must
+# be longer than any padding the token system may apply to the frame number.
+FRAME_SENTINEL = 987654321
+
+
+@attr.s(frozen=True, slots=True)
+class NameFormat:
+    """The frame number and extension formatting of a render data name format.
+
+    This holds the pre-computed result of the `c4d.RDATA_NAMEFORMAT` so that
+    it can be applied to many filepaths without recomputing it.
+    """
+    padding: int = attr.ib()
+    separator: str = attr.ib()      # Separator forced before the frame number
+    extension: str = attr.ib()      # Extension including dot, or empty
+
+    def get_head(self, path: str) -> str:
+        """Return the filepath head the frame number is appended to."""
+        head, _ = os.path.splitext(path)
+        # Whenever the frame number directly follows the name and the name
+        # ends with a digit then C4D adds an underscore before the frame
+        # number.
+        if not self.separator and head and head[-1].isdigit():
+            head += "_"
+        return head + self.separator
+
+    def apply(self, path: str, frame: int = 0) -> str:
+        """Apply the name format to the filepath for the given frame."""
+        frame_str = str(frame).zfill(self.padding)
+        return f"{self.get_head(path)}{frame_str}{self.extension}"
+
+
+@attr.s(frozen=True, slots=True)
+class FilepathTemplate:
+    """A resolved token path with the frame number as the only variable.
+
+    The `parts` are the literal parts of the resolved path in between each
+    occurrence of the frame number.
+    """
+    parts: tuple[str, ...] = attr.ib()
+    padding: int = attr.ib(default=0)
+
+    @property
+    def has_frame(self) -> bool:
+        return len(self.parts) > 1
+
+    def format(self, frame: int) -> str:
+        return str(frame).zfill(self.padding).join(self.parts)
+
+    def replace(self, old: str, new: str) -> "FilepathTemplate":
+        """Return template with `old` replaced by `new` in its parts."""
+        return FilepathTemplate(
+            parts=tuple(part.replace(old, new) for part in self.parts),
+            padding=self.padding,
+        )
+
+
+@attr.s(frozen=True, slots=True)
+class OutputFormat:
+    """The pixel layout and compression class of rendered image files."""
+    bytes_per_channel: int = attr.ib()
+    channels: int = attr.ib(default=4)
+    # Approximate compressed size relative to the uncompressed pixel data
+    compression_ratio: float = attr.ib(default=1.0)
+
+    def estimate_file_size(self, width: int, height: int) -> int:
+        """Return the estimated size in bytes of a single image file."""
+        return int(
+            width * height * self.channels * self.bytes_per_channel
+            * self.compression_ratio
+        )
+
+
+def format_bytes(size: float) -> str:
+    """Return the size in bytes as human-readable string.
+
+    Examples:
+        >>> format_bytes(1536)
+        '1.5 KB'
+        >>> format_bytes(3 * 1024 ** 4)
+        '3.0 TB'
+
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+@attr.s(frozen=True, slots=True)
+class ProductSnapshot:
+    """The resolved output path of a single render product.
+
+    Either `template` is set, with the `$take` token replaced by
+    `TAKE_PLACEHOLDER`, or the paths resolved for each frame are stored in
+    `paths` because the path contains frame-dependent tokens.
+    """
+    name: str = attr.ib()           # AOV name or "" for Beauty
+    name_format: NameFormat = attr.ib()
+    template: Optional[FilepathTemplate] = attr.ib(default=None)
+    paths: tuple[str, ...] = attr.ib(default=(), converter=tuple)
+
+
+@attr.s(frozen=True, slots=True)
+class TakeSnapshot:
+    """The render products of a single take for the frames it renders.
+
+    The `take_name` is the take's `$take` token value as resolved by
+    Cinema 4D, which replaces `TAKE_PLACEHOLDER` in the templates as is.
+    """
+    take_name: str = attr.ib()
+    frames: FrameRangeSet = attr.ib()
+    products: tuple[ProductSnapshot, ...] = attr.ib(converter=tuple)
+
+
+def compute_product_files(
+    product: ProductSnapshot,
+    take_name: str,
+    frames: FrameRangeSet
+) -> FrameSequence | list[str]:
+    """Return filepaths for all frames of the render product.
+
+    Returns a lazy `FrameSequence` when the frame number is the only
+    varying part of the filepaths, otherwise a list of filepaths.
+    """
+    if not frames:
+        return []
+
+    name_format = product.name_format
+    if product.template is None:
+        return [
+            name_format.apply(path, frame)
+            for path, frame in zip(product.paths, frames)
+        ]
+
+    template = product.template.replace(TAKE_PLACEHOLDER, take_name)
+    if not template.has_frame:
+        return FrameSequence.from_range_set(
+            head=name_format.get_head(template.format(0)),
+            padding=name_format.padding,
+            tail=name_format.extension,
+            frames=frames,
+        )
+    return [
+        name_format.apply(template.format(frame), frame)
+        for frame in frames
+    ]
+
+
+def compute_products(
+    snapshot: TakeSnapshot
+) -> dict[str, FrameSequence | list[str]]:
+    """Return the files per AOV name for the take snapshot."""
+    return {
+        product.name: compute_product_files(
+            product, snapshot.take_name, snapshot.frames
+        )
+        for product in snapshot.products
+    }
+
+
+def compute_products_batch(
+    snapshots: Iterable[TakeSnapshot],
+    processes: Optional[int] = None,
+) -> list[dict[str, FrameSequence | list[str]]]:
+    """Return the files per AOV name for each of the take snapshots.
+
+    When `processes` is larger than one the snapshots are distributed over
+    a process pool. Only use this outside of the Cinema 4D interpreter, e.g.
+    in `c4dpy` or standalone Python, since new processes are started with
+    the current Python executable.
+
+    Args:
+        snapshots: The take snapshots.
+        processes: The number of worker processes. Computes in the current
+            process when not larger than one.
+
+    Returns:
+        list[dict[str, FrameSequence | list[str]]]: The products in order
+            of the snapshots.
+
+    """
+    snapshots = list(snapshots)
+    if not processes or processes <= 1 or len(snapshots) <= 1:
+        return [compute_products(snapshot) for snapshot in snapshots]
+
+    processes = min(processes, len(snapshots))
+    chunksize = max(1, len(snapshots) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(
+            executor.map(compute_products, snapshots, chunksize=chunksize)
+        )
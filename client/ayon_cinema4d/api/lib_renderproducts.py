@@ -1,7 +1,10 @@
 from __future__ import annotations
 from typing import Any, Optional, Generator
+import hashlib
+import json
 import logging
 import os
+import re
 import copy
 
 import attr
@@ -9,7 +12,19 @@ import attr
 import c4d.documents
 import redshift
 
+from ayon_core.lib import get_launcher_local_dir
+
 from . import lib
+from .lib_frames import FrameRangeSet, FrameSequence
+from .lib_products import (
+    FRAME_SENTINEL,
+    TAKE_PLACEHOLDER,
+    FilepathTemplate,
+    NameFormat,
+    OutputFormat,
+    ProductSnapshot,
+    TakeSnapshot,
+)
 
 log = logging.getLogger(__name__)
 
@@ -127,13 +142,8 @@ def resolve_filepath(
     return resolved
 
 
-def apply_name_format(
-    path: str,
-    name_format: int,
-    file_format: int,
-    frame: int = 0
-) -> str:
-    """Apply the C4D render data name format to the given filepath.
+def get_name_format(name_format: int, file_format: int) -> NameFormat:
+    """Return the name format for C4D render data format constants.
 
     Reference:
         RDATA_NAMEFORMAT_0 = Name0000.TIF
@@ -145,15 +155,13 @@ def apply_name_format(
         RDATA_NAMEFORMAT_6 = Name.0000.TIF
 
     Args:
-        path:
-        name_format:
-        file_format:
-        frame:
+        name_format: The C4D render data name format constant.
+        file_format: The C4D render data file format constant.
 
     Returns:
+        NameFormat: The name format.
 
     """
-    head, _ = os.path.splitext(path)
     try:
         padding: int = {
             c4d.RDATA_NAMEFORMAT_0: 4,
@@ -165,33 +173,537 @@ def apply_name_format(
             c4d.RDATA_NAMEFORMAT_6: 4,
         }[name_format]
     except KeyError as exc:
-        raise ValueError(f"Unsupported name format: {name_format}") from exc
-    frame_str = str(frame).zfill(padding)
+        raise ValueError(
+            f"Unsupported name format: {name_format}") from exc
 
     # Prefix frame number with a dot for specific name formats
+    separator: str = ""
     if name_format in {
         c4d.RDATA_NAMEFORMAT_2,
         c4d.RDATA_NAMEFORMAT_5,
         c4d.RDATA_NAMEFORMAT_6,
     }:
-        frame_str = "." + frame_str
-    # Whenever the frame number directly follows the name and the name ends
-    # with a digit then C4D adds an underscore before the frame number.
-    elif head and head[-1].isdigit():
-        frame_str = "_" + frame_str
+        separator = "."
 
     # Add file format extension if name format includes it
+    extension: str = ""
     if name_format in {
         c4d.RDATA_NAMEFORMAT_0,
         c4d.RDATA_NAMEFORMAT_3,
         c4d.RDATA_NAMEFORMAT_6,
     }:
-        extension: str = get_renderdata_file_format_extension(file_format)
+        extension = get_renderdata_file_format_extension(file_format)
+
+    return NameFormat(
+        padding=padding, separator=separator, extension=extension)
+
+
+def apply_name_format(
+    path: str,
+    name_format: int,
+    file_format: int,
+    frame: int = 0
+) -> str:
+    """Apply the C4D render data name format to the given filepath.
+
+    See `NameFormat` to apply the same name format to many filepaths.
+
+    Args:
+        path: The filepath to apply the name format to.
+        name_format: The C4D render data name format constant.
+        file_format: The C4D render data file format constant.
+        frame: The frame number.
+
+    Returns:
+        str: The filepath with frame number and extension.
+
+    """
+    return get_name_format(name_format, file_format).apply(path, frame)
+
+
+def compile_filepath_template(
+    token_path: str,
+    frame_start: int,
+    frame_end: int,
+    **kwargs
+) -> Optional[FilepathTemplate]:
+    """Resolve the token path once into a template for all frames.
+
+    The tokens are resolved with a sentinel frame number to locate where the
+    `$frame` token resolves to. The template is then validated against the
+    token system's result for the first and last frame so that it is only
+    used when the frame number is the only frame-dependent value in the path.
+
+    This avoids resolving the tokens through Cinema4D for each single frame.
+
+    Args:
+        token_path: The path with tokens.
+        frame_start: The first frame to validate the template with.
+        frame_end: The last frame to validate the template with.
+        **kwargs: Additional keyword arguments for `resolve_filepath`.
+
+    Returns:
+        Optional[FilepathTemplate]: The template, or None if the path can't
+            be templated because it contains frame-dependent tokens that
+            do not behave like the `$frame` token.
+
+    """
+    sentinel_path = resolve_filepath(
+        token_path, frame=FRAME_SENTINEL, **kwargs)
+    parts = tuple(sentinel_path.split(str(FRAME_SENTINEL)))
+
+    first_path = resolve_filepath(token_path, frame=frame_start, **kwargs)
+    template: Optional[FilepathTemplate] = None
+    if len(parts) == 1:
+        if first_path == sentinel_path:
+            template = FilepathTemplate(parts=parts)
     else:
-        # No extension
-        extension: str = ""
+        # Detect the padding the token system applies to the frame number
+        for padding in range(len(str(FRAME_SENTINEL))):
+            candidate = FilepathTemplate(parts=parts, padding=padding)
+            if candidate.format(frame_start) == first_path:
+                template = candidate
+                break
+
+    if template is None:
+        return None
 
-    return f"{head}{frame_str}{extension}"
+    if frame_end != frame_start:
+        last_path = resolve_filepath(token_path, frame=frame_end, **kwargs)
+        if template.format(frame_end) != last_path:
+            return None
+
+    return template
+
+
+@attr.s(frozen=True)
+class ProductSpec:
+    """The unresolved output path of a single render product."""
+    token_path: str = attr.ib()
+    layer_name: str = attr.ib(default="$userpass")
+    layer_type_name: str = attr.ib(default="$pass")
+    file_format: int = attr.ib(default=0)
+
+
+@attr.s
+class ProductGraph:
+    """The render products of a render data, shareable between takes.
+
+    The `templates` are compiled lazily per product and per take camera,
+    with the `$take` token replaced by `TAKE_PLACEHOLDER`. The `$camera`
+    token depends on the take as well, so takes with different cameras
+    get their own template. A `None` template means the product's path
+    must be resolved per frame.
+    """
+    products: dict[str, ProductSpec] = attr.ib()
+    name_format: int = attr.ib()
+    templates: dict[
+        tuple[ProductSpec, str], Optional[FilepathTemplate]
+    ] = attr.ib(factory=dict)
+
+
+_product_graph_cache: dict[tuple, ProductGraph] = {}
+PRODUCT_GRAPH_CACHE_SIZE = 32
+
+
+def get_render_data_checksum(
+    render_data: c4d.documents.RenderData
+) -> tuple:
+    """Return a key that changes whenever the render products may change.
+
+    The key consists of the render data and video posts identities and
+    their dirty counters, the document path and the scene light groups
+    used for Redshift light group AOVs.
+    """
+    doc: c4d.documents.BaseDocument = render_data.GetDocument()
+    key = [
+        hash(render_data),
+        render_data.GetDirty(c4d.DIRTYFLAGS_DATA),
+        doc.GetDocumentPath(),
+        doc.GetDocumentName(),
+    ]
+    video_post = render_data.GetFirstVideoPost()
+    while video_post is not None:
+        key.append((
+            hash(video_post),
+            video_post.GetType(),
+            video_post.GetDirty(c4d.DIRTYFLAGS_DATA)
+        ))
+        video_post = video_post.GetNext()
+
+    if render_data[c4d.RDATA_RENDERENGINE] == REDSHIFT_RENDER_ENGINE_ID:
+        key.append(frozenset(get_redshift_light_group_members(doc)))
+
+    return tuple(key)
+
+
+def get_cached_product_graph(key: tuple) -> Optional[ProductGraph]:
+    return _product_graph_cache.get(key)
+
+
+def cache_product_graph(key: tuple, graph: ProductGraph):
+    if len(_product_graph_cache) >= PRODUCT_GRAPH_CACHE_SIZE:
+        # Remove the oldest entry
+        _product_graph_cache.pop(next(iter(_product_graph_cache)))
+    _product_graph_cache[key] = graph
+
+
+def get_render_frames(
+    render_data: c4d.documents.RenderData,
+    fps: Optional[float] = None
+) -> FrameRangeSet:
+    """Return the frames the render data renders.
+
+    This respects the render data's frame sequence mode, e.g. 'Current
+    Frame', 'All Frames' or 'Preview Range', and its frame step.
+    """
+    doc: c4d.documents.BaseDocument = render_data.GetDocument()
+    if fps is None:
+        fps = doc.GetFps()
+
+    frame_sequence: int = render_data[c4d.RDATA_FRAMESEQUENCE]
+    if frame_sequence == c4d.RDATA_FRAMESEQUENCE_CURRENTFRAME:
+        frame = int(doc.GetTime().GetFrame(fps))
+        return FrameRangeSet.from_range(frame, frame)
+    elif frame_sequence == c4d.RDATA_FRAMESEQUENCE_ALLFRAMES:
+        start, end = doc.GetMinTime(), doc.GetMaxTime()
+    elif frame_sequence == c4d.RDATA_FRAMESEQUENCE_PREVIEWRANGE:
+        start, end = doc.GetLoopMinTime(), doc.GetLoopMaxTime()
+    else:
+        start = render_data[c4d.RDATA_FRAMEFROM]
+        end = render_data[c4d.RDATA_FRAMETO]
+
+    return FrameRangeSet.from_range(
+        int(start.GetFrame(fps)),
+        int(end.GetFrame(fps)),
+        int(render_data[c4d.RDATA_FRAMESTEP])
+    )
+
+
+def _get_take_camera_name(
+    render_data: c4d.documents.RenderData,
+    take: c4d.modules.takesystem.BaseTake,
+) -> str:
+    """Return the name of the take's camera the `$camera` token resolves to.
+    """
+    doc: c4d.documents.BaseDocument = render_data.GetDocument()
+    camera, _ = take.GetEffectiveCamera(doc.GetTakeData())
+    if camera is None:
+        return ""
+    return camera.GetName()
+
+
+def snapshot_product(
+    graph: ProductGraph,
+    aov_name: str,
+    render_data: c4d.documents.RenderData,
+    take: c4d.modules.takesystem.BaseTake,
+    frames: FrameRangeSet,
+) -> ProductSnapshot:
+    """Capture the resolved output path of a render product of the graph.
+
+    The tokens are resolved only once for all frames and takes if possible
+    and the compiled template is stored on the graph. Otherwise, the path is
+    resolved for each frame.
+    """
+    product: ProductSpec = graph.products[aov_name]
+    name_format = get_name_format(graph.name_format, product.file_format)
+    if not frames:
+        return ProductSnapshot(name=aov_name, name_format=name_format)
+
+    resolve_kwargs = dict(
+        doc=render_data.GetDocument(),
+        render_data=render_data,
+        layer_name=product.layer_name,
+        layer_type_name=product.layer_type_name,
+        take=take,
+    )
+    template_key = (product, _get_take_camera_name(render_data, take))
+    if template_key not in graph.templates:
+        graph.templates[template_key] = compile_filepath_template(
+            product.token_path.replace("$take", TAKE_PLACEHOLDER),
+            frames.first,
+            frames.last,
+            **resolve_kwargs
+        )
+    template = graph.templates[template_key]
+    if template is not None:
+        return ProductSnapshot(
+            name=aov_name, name_format=name_format, template=template)
+
+    log.debug(
+        "Resolving tokens per frame because path contains "
+        f"frame-dependent tokens: {product.token_path}"
+    )
+    paths: list[str] = [
+        resolve_filepath(product.token_path, frame=frame, **resolve_kwargs)
+        for frame in frames
+    ]
+    return ProductSnapshot(
+        name=aov_name, name_format=name_format, paths=paths)
+
+
+def snapshot_take(
+    graph: ProductGraph,
+    render_data: c4d.documents.RenderData,
+    take: c4d.modules.takesystem.BaseTake,
+    frames: FrameRangeSet,
+) -> TakeSnapshot:
+    """Capture the take's render products into a `c4d` independent record.
+
+    Use `lib_products.compute_products` to compute the output files.
+    """
+    # Resolve the `$take` token with Cinema 4D so the take name that replaces
+    # `TAKE_PLACEHOLDER` is sanitized the same as in per frame resolved paths
+    take_name: str = resolve_filepath(
+        "$take",
+        doc=render_data.GetDocument(),
+        render_data=render_data,
+        take=take,
+    )
+    return TakeSnapshot(
+        take_name=take_name,
+        frames=frames,
+        products=[
+            snapshot_product(graph, aov_name, render_data, take, frames)
+            for aov_name in graph.products
+        ]
+    )
+
+
+# Tokens that resolve to the current date or time. Render products using
+# them are never stored in the render products manifest cache.
+VOLATILE_TOKENS = ("$YYYY", "$YY", "$MM", "$DD", "$hh", "$mm", "$ss")
+RENDER_PRODUCTS_MANIFEST_VERSION = 2
+RENDER_PRODUCTS_MANIFEST_LIMIT = 256
+MEMORY_ADDRESS_REGEX = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _get_stable_value(value: Any, doc: c4d.documents.BaseDocument) -> Any:
+    """Return a representation of the value that is stable across sessions.
+
+    Linked nodes are represented by their type and name since their `repr`
+    includes their memory address.
+    """
+    if isinstance(value, c4d.BaseLink):
+        value = value.GetLink(doc)
+    if isinstance(value, c4d.BaseList2D):
+        return f"{value.GetType()}:{value.GetName()}"
+    if isinstance(value, c4d.BaseTime):
+        return value.Get()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    # Strip the memory address of other data types without a stable
+    # representation, e.g. `<c4d.InExcludeData object at 0x...>`
+    return MEMORY_ADDRESS_REGEX.sub("", repr(value))
+
+
+def _hash_container(
+    hasher,
+    container: c4d.BaseContainer,
+    doc: c4d.documents.BaseDocument,
+):
+    """Update the hasher with the parameter ids and values of a container.
+    """
+    index = 0
+    while True:
+        key: int = container.GetIndexId(index)
+        if key == c4d.NOTOK:
+            break
+        index += 1
+
+        try:
+            value = container[key]
+        except (AttributeError, TypeError):
+            # Data types that are not supported by the Python API
+            value = None
+        hasher.update(f"{container.GetType(key)}".encode())
+        if isinstance(value, c4d.BaseContainer):
+            hasher.update(f"{key}:{{".encode())
+            _hash_container(hasher, value, doc)
+            hasher.update(b"}")
+            continue
+        value = _get_stable_value(value, doc)
+        hasher.update(f"{key}:{type(value).__name__}={value};".encode())
+
+
+_render_data_content_cache: dict[tuple, Optional[str]] = {}
+
+
+def get_render_data_content_checksum(
+    render_data: c4d.documents.RenderData
+) -> Optional[str]:
+    """Return a content checksum of the render data, video posts and AOVs.
+
+    The checksum is computed once per `get_render_data_checksum` key so
+    takes sharing the render data only hash their take specific inputs,
+    see `get_render_products_checksum`.
+
+    Returns:
+        Optional[str]: The checksum or None if the render products depend
+            on the current date or time and should not be cached.
+
+    """
+    key = get_render_data_checksum(render_data)
+    if key in _render_data_content_cache:
+        return _render_data_content_cache[key]
+
+    doc: c4d.documents.BaseDocument = render_data.GetDocument()
+    hasher = hashlib.sha1()
+    token_paths: list[str] = [
+        render_data[c4d.RDATA_PATH],
+        render_data[c4d.RDATA_MULTIPASS_FILENAME],
+    ]
+    _hash_container(hasher, render_data.GetDataInstance(), doc)
+    video_post = render_data.GetFirstVideoPost()
+    while video_post is not None:
+        hasher.update(f"videopost={video_post.GetType()};".encode())
+        _hash_container(hasher, video_post.GetDataInstance(), doc)
+        if video_post.IsInstanceOf(REDSHIFT_RENDER_ENGINE_ID):
+            for aov in redshift.RendererGetAOVs(video_post):
+                for parameter in (
+                    c4d.REDSHIFT_AOV_NAME,
+                    c4d.REDSHIFT_AOV_EFFECTIVE_NAME,
+                    c4d.REDSHIFT_AOV_TYPE,
+                    c4d.REDSHIFT_AOV_ENABLED,
+                    c4d.REDSHIFT_AOV_MULTIPASS_ENABLED,
+                    c4d.REDSHIFT_AOV_FILE_ENABLED,
+                    c4d.REDSHIFT_AOV_FILE_PATH,
+                    c4d.REDSHIFT_AOV_FILE_EFFECTIVE_PATH,
+                    c4d.REDSHIFT_AOV_LIGHTGROUP_NAMES,
+                    c4d.REDSHIFT_AOV_LIGHTGROUP_ALL,
+                    c4d.REDSHIFT_AOV_LIGHTGROUP_GLOBALAOV,
+                ):
+                    hasher.update(
+                        f"{parameter}={aov.GetParameter(parameter)};".encode()
+                    )
+                token_paths.append(
+                    aov.GetParameter(c4d.REDSHIFT_AOV_FILE_PATH))
+            light_groups = sorted(get_redshift_light_group_members(doc))
+            hasher.update(f"lightgroups={light_groups};".encode())
+        video_post = video_post.GetNext()
+
+    checksum: Optional[str] = hasher.hexdigest()
+    if any(
+        token in token_path
+        for token_path in token_paths
+        for token in VOLATILE_TOKENS
+    ):
+        checksum = None
+
+    if len(_render_data_content_cache) >= PRODUCT_GRAPH_CACHE_SIZE:
+        # Remove the oldest entry
+        _render_data_content_cache.pop(next(iter(_render_data_content_cache)))
+    _render_data_content_cache[key] = checksum
+    return checksum
+
+
+def get_render_products_checksum(
+    render_data: c4d.documents.RenderData,
+    take: c4d.modules.takesystem.BaseTake,
+    frames: FrameRangeSet,
+) -> Optional[str]:
+    """Return a content checksum of all inputs of a take's render products.
+
+    Unlike `get_render_data_checksum` this does not rely on dirty counters
+    so the checksum remains the same across sessions for an unchanged
+    scene. It combines the `get_render_data_content_checksum` of the
+    effective render data with the take and its camera, the document path
+    and the rendered frames.
+
+    Returns:
+        Optional[str]: The checksum or None if the render products depend
+            on the current date or time and should not be cached.
+
+    """
+    render_data_checksum = get_render_data_content_checksum(render_data)
+    if render_data_checksum is None:
+        return None
+
+    doc: c4d.documents.BaseDocument = render_data.GetDocument()
+    hasher = hashlib.sha1()
+    hasher.update(f"{RENDER_PRODUCTS_MANIFEST_VERSION}".encode())
+    hasher.update(f"{c4d.GetC4DVersion()}".encode())
+    hasher.update(render_data_checksum.encode())
+    hasher.update(
+        os.path.join(doc.GetDocumentPath(), doc.GetDocumentName()).encode()
+    )
+    hasher.update(f"take={take.GetName()};frames={frames};".encode())
+    hasher.update(
+        f"camera={_get_take_camera_name(render_data, take)};".encode())
+    return hasher.hexdigest()
+
+
+def get_render_products_manifest_dir() -> str:
+    return get_launcher_local_dir("cinema4d", "render_products")
+
+
+def load_render_products_manifest(
+    checksum: str
+) -> Optional[dict[str, FrameSequence | list[str]]]:
+    """Return the render products stored for the checksum, if any."""
+    path = os.path.join(get_render_products_manifest_dir(), f"{checksum}.json")
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "r") as f:
+            data: dict = json.load(f)
+    except (OSError, ValueError):
+        log.debug(f"Failed to read render products manifest: {path}",
+                  exc_info=True)
+        return None
+
+    if data.get("version") != RENDER_PRODUCTS_MANIFEST_VERSION:
+        return None
+
+    products: dict[str, FrameSequence | list[str]] = {}
+    for aov_name, product in data["products"].items():
+        if "sequence" in product:
+            products[aov_name] = FrameSequence(**product["sequence"])
+        else:
+            products[aov_name] = product["files"]
+    return products
+
+
+def save_render_products_manifest(
+    checksum: str,
+    products: dict[str, FrameSequence | list[str]]
+):
+    """Store the render products for the checksum.
+
+    Only the most recent `RENDER_PRODUCTS_MANIFEST_LIMIT` manifests are kept.
+    """
+    data_products: dict[str, dict] = {}
+    for aov_name, files in products.items():
+        if isinstance(files, FrameSequence):
+            sequence: dict = attr.asdict(files)
+            sequence["holes"] = sorted(files.holes)
+            data_products[aov_name] = {"sequence": sequence}
+        else:
+            data_products[aov_name] = {"files": list(files)}
+
+    manifest_dir = get_render_products_manifest_dir()
+    path = os.path.join(manifest_dir, f"{checksum}.json")
+    try:
+        os.makedirs(manifest_dir, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({
+                "version": RENDER_PRODUCTS_MANIFEST_VERSION,
+                "products": data_products
+            }, f)
+
+        manifests = [
+            entry for entry in os.scandir(manifest_dir)
+            if entry.name.endswith(".json")
+        ]
+        if len(manifests) > RENDER_PRODUCTS_MANIFEST_LIMIT:
+            manifests.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in manifests[:-RENDER_PRODUCTS_MANIFEST_LIMIT]:
+                os.remove(entry.path)
+    except OSError:
+        log.debug(f"Failed to write render products manifest: {path}",
+                  exc_info=True)
 
 
 def get_renderdata_file_format_extension(file_format: int) -> str:
@@ -234,7 +746,57 @@ def get_renderdata_file_format_extension(file_format: int) -> str:
         raise ValueError(f"Unsupported file format: {file_format}") from exc
 
 
-@attr.s
+def get_output_format(
+    render_data: c4d.documents.RenderData,
+    multipass: bool = False
+) -> OutputFormat:
+    """Return the bit depth and compression class of the render outputs.
+
+    The compression ratios are rough averages for typical CG renders and
+    only meant to estimate the output size of a render.
+
+    Args:
+        render_data: The render data.
+        multipass: Whether to get the format of the Multi-Pass image
+            instead of the Regular image.
+
+    Returns:
+        OutputFormat: The output format.
+
+    """
+    if multipass:
+        file_format: int = render_data[c4d.RDATA_MULTIPASS_SAVEFORMAT]
+        depth: int = render_data[c4d.RDATA_MULTIPASS_SAVEDEPTH]
+    else:
+        file_format: int = render_data[c4d.RDATA_FORMAT]
+        depth: int = render_data[c4d.RDATA_FORMATDEPTH]
+
+    bytes_per_channel: int = {
+        c4d.RDATA_FORMATDEPTH_8: 1,
+        c4d.RDATA_FORMATDEPTH_16: 2,
+        c4d.RDATA_FORMATDEPTH_32: 4,
+    }.get(depth, 2)
+
+    compression_ratio: float = {
+        c4d.FILTER_EXR: 0.5,
+        c4d.FILTER_PNG: 0.5,
+        c4d.FILTER_TIF: 0.7,
+        c4d.FILTER_TIF_B3D: 0.7,
+        c4d.FILTER_JPG: 0.1,
+        c4d.FILTER_HDR: 0.5,
+    }.get(file_format, 1.0)
+
+    # Full float data compresses worse than half float or integer data
+    if bytes_per_channel == 4:
+        compression_ratio = min(1.0, compression_ratio * 1.4)
+
+    return OutputFormat(
+        bytes_per_channel=bytes_per_channel,
+        compression_ratio=compression_ratio,
+    )
+
+
+@attr.s(slots=True)
 class AOV:
     """Dataclass for AOVs
 
@@ -259,17 +821,87 @@ class AOV:
         return self.name
 
 
-def get_redshift_light_groups(doc: c4d.documents.BaseDocument) -> set[str]:
-    light_groups: set[str] = set()
-    for obj in lib.iter_objects(doc.GetFirstObject()):
-        if obj.GetType() != c4d.Orslight:
-            continue
+@attr.s
+class RedshiftLightGroups:
+    """Redshift light groups of a document and the lights in each group.
 
-        light_group: str = obj[c4d.REDSHIFT_LIGHT_LIGHT_GROUP]
+    The `checksum` holds the GUID and data dirty counter of each Redshift
+    light so that changes to other objects do not invalidate the cache.
+    """
+    members: dict[str, list[c4d.BaseObject]] = attr.ib(factory=dict)
+    checksum: tuple = attr.ib(default=())
+    objects_dirty: Optional[int] = attr.ib(default=None)
+
+
+_light_group_caches: dict[int, RedshiftLightGroups] = {}
+
+
+def get_redshift_light_group_members(
+    doc: c4d.documents.BaseDocument
+) -> dict[str, list[c4d.BaseObject]]:
+    """Return the Redshift lights per light group in the document.
+
+    The result is cached per document. When no object in the document
+    changed since the last call the object tree is not traversed at all,
+    otherwise the light groups are only re-read when any Redshift light
+    was added, removed or changed.
+
+    The returned dictionary is shared with the cache and must not be
+    modified.
+    """
+    key = hash(doc)
+    cache = _light_group_caches.get(key)
+    if cache is None:
+        # Drop caches of documents that are no longer open
+        lib.prune_closed_document_caches(_light_group_caches)
+
+        cache = RedshiftLightGroups()
+        _light_group_caches[key] = cache
+
+    objects_dirty: int = doc.GetHDirty(
+        c4d.HDIRTYFLAGS_OBJECT | c4d.HDIRTYFLAGS_OBJECT_HIERARCHY)
+    if cache.objects_dirty == objects_dirty:
+        return cache.members
+
+    lights: list[c4d.BaseObject] = [
+        obj for obj in lib.iter_objects(doc.GetFirstObject())
+        if obj.GetType() == c4d.Orslight
+    ]
+    checksum = tuple(
+        (light.GetGUID(), light.GetDirty(c4d.DIRTYFLAGS_DATA))
+        for light in lights
+    )
+    cache.objects_dirty = objects_dirty
+    if cache.checksum == checksum:
+        return cache.members
+
+    log.debug("Collecting Redshift light groups.")
+    members: dict[str, list[c4d.BaseObject]] = {}
+    for light in lights:
+        light_group: str = light[c4d.REDSHIFT_LIGHT_LIGHT_GROUP]
         if light_group:
-            light_groups.add(light_group)
+            members.setdefault(light_group, []).append(light)
 
-    return light_groups
+    cache.members = members
+    cache.checksum = checksum
+    return members
+
+
+def get_redshift_light_groups(doc: c4d.documents.BaseDocument) -> set[str]:
+    return set(get_redshift_light_group_members(doc))
+
+
+def get_redshift_aov_light_group_names(aov) -> list[str]:
+    """Return the light group names listed on a Redshift AOV.
+
+    The list of returned light group names may contain 'unused' entries
+    that do not exist (anymore?) in the scene.
+    """
+    return [
+        lg.strip() for lg in
+        aov.GetParameter(c4d.REDSHIFT_AOV_LIGHTGROUP_NAMES).split("\n")
+        if lg.strip()
+    ]
 
 
 def iter_redshift_aovs(video_post: c4d.documents.BaseVideoPost) -> Generator[AOV, None, None]:
@@ -278,7 +910,8 @@ def iter_redshift_aovs(video_post: c4d.documents.BaseVideoPost) -> Generator[AOV
     This may separate light-groups into separate AOVs.
     """
     aovs = redshift.RendererGetAOVs(video_post)
-    scene_light_groups = get_redshift_light_groups(video_post.GetDocument())
+    scene_light_groups = get_redshift_light_group_members(
+        video_post.GetDocument())
 
     for aov in aovs:
         # Redshift Cryptomatte is always separate
@@ -304,11 +937,8 @@ def iter_redshift_aovs(video_post: c4d.documents.BaseVideoPost) -> Generator[AOV
         # that do not exist (anymore?) so we must filter the list against the
         # scene light groups.
         light_groups: list[str] = [
-            lg.strip() for lg in
-            aov.GetParameter(c4d.REDSHIFT_AOV_LIGHTGROUP_NAMES).split("\n")
-        ]
-        light_groups = [
-            lg for lg in light_groups if lg and lg in scene_light_groups
+            lg for lg in get_redshift_aov_light_group_names(aov)
+            if lg in scene_light_groups
         ]
         all_light_groups: bool = aov.GetParameter(c4d.REDSHIFT_AOV_LIGHTGROUP_ALL)
         if all_light_groups:
@@ -346,7 +976,7 @@ class LayerMetadata(object):
     products: list[RenderProduct] = attr.ib(factory=list)
 
 
-@attr.s
+@attr.s(slots=True)
 class RenderProduct(object):
     """
     Getting Colorspace as Specific Render Product Parameter for submitting
@@ -377,6 +1007,70 @@ def get_default_ocio_resource() -> str:
     return os.path.join(resources, "ocio", "config.ocio")
 
 
+@attr.s(frozen=True)
+class OcioNames:
+    """The OCIO names of a config with their index in the document settings.
+    """
+    displays: tuple[str, ...] = attr.ib(converter=tuple)
+    views: tuple[str, ...] = attr.ib(converter=tuple)
+    colorspaces: tuple[str, ...] = attr.ib(converter=tuple)
+    display_indices: dict[str, int] = attr.ib(init=False)
+    view_indices: dict[str, int] = attr.ib(init=False)
+    colorspace_indices: dict[str, int] = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        for names, attribute in (
+            (self.displays, "display_indices"),
+            (self.views, "view_indices"),
+            (self.colorspaces, "colorspace_indices"),
+        ):
+            # Keep the first index like `list.index` for duplicate names
+            indices: dict[str, int] = {}
+            for index, name in enumerate(names):
+                indices.setdefault(name, index)
+            object.__setattr__(self, attribute, indices)
+
+
+_ocio_names_cache: dict[
+    tuple[str, Optional[int], Optional[int]], OcioNames
+] = {}
+OCIO_NAMES_CACHE_SIZE = 8
+
+
+def get_ocio_names(doc: c4d.documents.BaseDocument) -> OcioNames:
+    """Return the OCIO display, view and colorspace names of the document.
+
+    The names are cached per resolved OCIO config path, the config file's
+    modification time and the display, since the view transforms depend
+    on the selected display.
+    """
+    config: str = doc.GetOcioConfigPath()
+    try:
+        mtime: Optional[int] = os.stat(config).st_mtime_ns
+    except (OSError, TypeError, ValueError):
+        mtime = None
+    try:
+        display_index: Optional[int] = (
+            doc[c4d.DOCUMENT_OCIO_DISPLAY_COLORSPACE]
+        )
+    except AttributeError:
+        display_index = None
+
+    key = (config, mtime, display_index)
+    names = _ocio_names_cache.get(key)
+    if names is None:
+        log.debug(f"Caching OCIO names of config: {config}")
+        names = OcioNames(
+            displays=doc.GetOcioDisplayColorSpaceNames(),
+            views=doc.GetOcioViewTransformNames(),
+            colorspaces=doc.GetOcioRenderingColorSpaceNames(),
+        )
+        if len(_ocio_names_cache) >= OCIO_NAMES_CACHE_SIZE:
+            _ocio_names_cache.pop(next(iter(_ocio_names_cache)))
+        _ocio_names_cache[key] = names
+    return names
+
+
 def set_scene_ocio_config(
     doc: c4d.documents.BaseDocument,
     config: Optional[str] = None,
@@ -390,29 +1084,37 @@ def set_scene_ocio_config(
         doc[c4d.DOCUMENT_COLOR_MANAGEMENT] = c4d.DOCUMENT_COLOR_MANAGEMENT_OCIO
         doc[c4d.DOCUMENT_OCIO_CONFIG] = config
 
-    if display is not None:
-        ocio_displays = doc.GetOcioDisplayColorSpaceNames()
-        if display in ocio_displays:
-            display_index = ocio_displays.index(display)
-            doc[c4d.DOCUMENT_OCIO_DISPLAY_COLORSPACE] = display_index
+    names = get_ocio_names(doc)
+    if display is not None and display in names.display_indices:
+        doc[c4d.DOCUMENT_OCIO_DISPLAY_COLORSPACE] = (
+            names.display_indices[display]
+        )
+        # The view transforms depend on the display
+        names = get_ocio_names(doc)
 
-    if view is not None:
-        ocio_views = doc.GetOcioViewTransformNames()
-        if view in ocio_views:
-            view_index = ocio_views.index(view)
-            doc[c4d.DOCUMENT_OCIO_VIEW_TRANSFORM] = view_index
+    if view is not None and view in names.view_indices:
+        doc[c4d.DOCUMENT_OCIO_VIEW_TRANSFORM] = names.view_indices[view]
 
-    if thumbnails:
-        ocio_views = doc.GetOcioViewTransformNames()
-        if thumbnails in ocio_views:
-            view_index = ocio_views.index(thumbnails)
-            doc[c4d.DOCUMENT_OCIO_VIEW_TRANSFORM_THUMBNAILS] = view_index
+    if thumbnails and thumbnails in names.view_indices:
+        doc[c4d.DOCUMENT_OCIO_VIEW_TRANSFORM_THUMBNAILS] = (
+            names.view_indices[thumbnails]
+        )
 
-    if colorspace is not None:
-        ocio_colorspaces = doc.GetOcioRenderingColorSpaceNames()
-        if colorspace in ocio_colorspaces:
-            colorspace_index = ocio_colorspaces.index(colorspace)
-            doc[c4d.DOCUMENT_OCIO_RENDER_COLORSPACE] = colorspace_index
+    if colorspace is not None and colorspace in names.colorspace_indices:
+        doc[c4d.DOCUMENT_OCIO_RENDER_COLORSPACE] = (
+            names.colorspace_indices[colorspace]
+        )
+
+
+def _get_ocio_name(
+    doc: c4d.documents.BaseDocument,
+    names: tuple[str, ...],
+    parameter: int,
+    index: int
+) -> str:
+    if 0 <= index < len(names):
+        return names[index]
+    return doc.GetNameFromColorSpaceId(parameter, index)
 
 
 def get_scene_ocio_config(
@@ -447,8 +1149,12 @@ def get_scene_ocio_config(
     # Get scene OCIO config, display and view
     config: str = doc.GetOcioConfigPath()
 
+    names = get_ocio_names(doc)
+
     display_index: int = doc[c4d.DOCUMENT_OCIO_DISPLAY_COLORSPACE]
-    display: str = doc.GetNameFromColorSpaceId(
+    display: str = _get_ocio_name(
+        doc,
+        names.displays,
         c4d.DOCUMENT_OCIO_DISPLAY_COLORSPACE,
         display_index
     )
@@ -460,12 +1166,17 @@ def get_scene_ocio_config(
         view_index: int = doc[c4d.DOCUMENT_OCIO_VIEW_TRANSFORM]
     except AttributeError:
         view_index = 0
-    view: str = doc.GetNameFromColorSpaceId(
+    view: str = _get_ocio_name(
+        doc,
+        names.views,
         c4d.DOCUMENT_OCIO_VIEW_TRANSFORM,
-        view_index)
+        view_index
+    )
 
     colorspace_index: int = doc[c4d.DOCUMENT_OCIO_RENDER_COLORSPACE]
-    colorspace: str = doc.GetNameFromColorSpaceId(
+    colorspace: str = _get_ocio_name(
+        doc,
+        names.colorspaces,
         c4d.DOCUMENT_OCIO_RENDER_COLORSPACE,
         colorspace_index
     )
@@ -0,0 +1,220 @@
+"""Watch render output directories for the expected render files.
+
+The output directories are indexed with one `os.scandir` per directory per
+poll and directories that did not change since the previous poll are not
+scanned again, so that polling large output trees stays cheap.
+
+This module does not depend on the `c4d` module.
+"""
+from __future__ import annotations
+import logging
+import os
+import time
+from typing import Callable, Iterable, Optional
+
+import attr
+
+from .lib_frames import FrameRangeSet, format_frame_ranges
+
+log = logging.getLogger(__name__)
+
+
+@attr.s
+class AOVStatus:
+    """Render output status of a single AOV."""
+    name: str = attr.ib()
+    expected: int = attr.ib()
+    existing: int = attr.ib()
+    missing: list[str] = attr.ib(factory=list)
+    missing_frames: list[int] = attr.ib(factory=list)
+    empty: list[str] = attr.ib(factory=list)
+    empty_frames: list[int] = attr.ib(factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing and not self.empty
+
+    @property
+    def progress(self) -> float:
+        if not self.expected:
+            return 1.0
+        return (self.existing - len(self.empty)) / self.expected
+
+    def __str__(self) -> str:
+        label = (
+            f"{self.name or '<Beauty>'}: "
+            f"{self.existing - len(self.empty)}/{self.expected}"
+        )
+        if self.missing_frames:
+            frames = format_frame_ranges(self.missing_frames)
+            label += f", missing frames {frames}"
+        elif self.missing:
+            label += f", {len(self.missing)} missing files"
+        if self.empty_frames:
+            frames = format_frame_ranges(self.empty_frames)
+            label += f", zero-byte frames {frames}"
+        elif self.empty:
+            label += f", {len(self.empty)} zero-byte files"
+        return label
+
+
+@attr.s
+class _DirectoryIndex:
+    """The state of the expected files in a single output directory."""
+    # Expected filename to (AOV name, frame number)
+    expected: dict[str, tuple[str, Optional[int]]] = attr.ib(factory=dict)
+    # Existing expected filename to file size
+    sizes: dict[str, int] = attr.ib(factory=dict)
+    mtime: Optional[int] = attr.ib(default=None)
+
+
+class RenderOutputWatcher:
+    """Compare the render output directories against the expected files.
+
+    Call `poll` repeatedly to update the index and get the status per AOV.
+    Only directories whose modification time changed, or that contain
+    zero-byte files that may still be written to, are scanned again.
+
+    Args:
+        expected_files: The expected filepaths per AOV name.
+        frames: The frame numbers of the expected files, in order of the
+            files of each AOV, to report missing frames instead of files.
+
+    """
+
+    def __init__(
+        self,
+        expected_files: dict[str, Iterable[str]],
+        frames: Optional[Iterable[int]] = None,
+    ):
+        frames = list(frames) if frames is not None else None
+        self._aovs: dict[str, int] = {}
+        self._directories: dict[str, _DirectoryIndex] = {}
+        for aov_name, files in expected_files.items():
+            count = 0
+            for index, path in enumerate(files):
+                frame: Optional[int] = None
+                if frames is not None and index < len(frames):
+                    frame = frames[index]
+                directory, filename = os.path.split(path)
+                directory_index = self._directories.setdefault(
+                    directory, _DirectoryIndex())
+                directory_index.expected[filename] = (aov_name, frame)
+                count += 1
+            self._aovs[aov_name] = count
+        self.scan_count: int = 0
+
+    @classmethod
+    def from_instance_data(cls, data: dict) -> "RenderOutputWatcher":
+        """Return a watcher for render instance data.
+
+        Uses the `expectedFiles` and `frameList` collected for Cinema 4D
+        render instances.
+        """
+        expected_files: dict[str, list[str]] = {}
+        for aov_files in data["expectedFiles"]:
+            expected_files.update(aov_files)
+
+        frames: Optional[FrameRangeSet] = None
+        if data.get("frameList"):
+            frames = FrameRangeSet.parse(data["frameList"])
+        return cls(expected_files, frames=frames)
+
+    def poll(self) -> dict[str, AOVStatus]:
+        """Update the index of the output directories and return the status.
+
+        Returns:
+            dict[str, AOVStatus]: The render output status per AOV name.
+
+        """
+        for directory, index in self._directories.items():
+            self._update_directory(directory, index)
+        return self.get_status()
+
+    def get_status(self) -> dict[str, AOVStatus]:
+        """Return the status per AOV name from the last poll."""
+        status: dict[str, AOVStatus] = {
+            aov_name: AOVStatus(name=aov_name, expected=count, existing=0)
+            for aov_name, count in self._aovs.items()
+        }
+        for directory, index in self._directories.items():
+            for filename, (aov_name, frame) in index.expected.items():
+                aov_status = status[aov_name]
+                size: Optional[int] = index.sizes.get(filename)
+                if size is None:
+                    aov_status.missing.append(
+                        os.path.join(directory, filename))
+                    if frame is not None:
+                        aov_status.missing_frames.append(frame)
+                    continue
+
+                aov_status.existing += 1
+                if size == 0:
+                    aov_status.empty.append(os.path.join(directory, filename))
+                    if frame is not None:
+                        aov_status.empty_frames.append(frame)
+        return status
+
+    def watch(
+        self,
+        interval: float = 5.0,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[dict[str, AOVStatus]], None]] = None,
+    ) -> dict[str, AOVStatus]:
+        """Poll until all expected files exist or the timeout is reached.
+
+        Args:
+            interval: Seconds to wait in between polls.
+            timeout: Maximum seconds to watch, or None to watch until done.
+            callback: Called with the status after each poll.
+
+        Returns:
+            dict[str, AOVStatus]: The render output status per AOV name.
+
+        """
+        start = time.monotonic()
+        while True:
+            status = self.poll()
+            if callback:
+                callback(status)
+            if all(aov_status.complete for aov_status in status.values()):
+                return status
+            if timeout is not None and time.monotonic() - start >= timeout:
+                return status
+            time.sleep(interval)
+
+    def _update_directory(self, directory: str, index: _DirectoryIndex):
+        try:
+            mtime: int = os.stat(directory).st_mtime_ns
+        except OSError:
+            index.sizes.clear()
+            index.mtime = None
+            return
+
+        # Zero-byte files may still be written to without changing the
+        # directory's modification time.
+        has_empty = any(size == 0 for size in index.sizes.values())
+        if mtime == index.mtime and not has_empty:
+            return
+
+        self.scan_count += 1
+        sizes: dict[str, int] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name not in index.expected:
+                        continue
+                    # Avoid a `stat` call for files known to have content
+                    size = index.sizes.get(entry.name)
+                    if not size:
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            continue
+                    sizes[entry.name] = size
+        except OSError as exc:
+            log.debug(f"Failed to scan render output directory: {exc}")
+            return
+
+        index.sizes = sizes
+        index.mtime = mtime
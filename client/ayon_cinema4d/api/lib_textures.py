@@ -0,0 +1,164 @@
+"""Convert textures to Redshift's `.rstexbin` format ahead of rendering.
+
+Textures are converted in parallel with a pool of texture processor
+processes and textures with an up-to-date converted file are skipped.
+
+This module does not depend on the `c4d` module.
+"""
+from __future__ import annotations
+import glob
+import logging
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import attr
+
+log = logging.getLogger(__name__)
+
+RSTEXBIN_EXTENSION = ".rstexbin"
+
+# UDIM and tile tokens that may be used in texture paths
+TILE_TOKEN_REGEX = re.compile(r"<udim>|<UDIM>|\$udim|<u>_<v>|<U>_<V>")
+
+
+@attr.s
+class TextureResult:
+    """The result of converting a single texture."""
+    source: str = attr.ib()
+    output: str = attr.ib()
+    # One of "converted", "skipped", "missing" or "failed"
+    status: str = attr.ib(default="")
+    message: str = attr.ib(default="")
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in {"converted", "skipped"}
+
+
+def get_rstexbin_path(path: str) -> str:
+    """Return the path the texture processor writes the converted file to.
+    """
+    return os.path.splitext(path)[0] + RSTEXBIN_EXTENSION
+
+
+def expand_texture_paths(paths: Iterable[str]) -> list[str]:
+    """Return the texture files, with UDIM and tile tokens expanded.
+
+    Already converted `.rstexbin` files and duplicate paths are excluded.
+    """
+    files: list[str] = []
+    for path in paths:
+        if not path or path.lower().endswith(RSTEXBIN_EXTENSION):
+            continue
+        if TILE_TOKEN_REGEX.search(path):
+            pattern = TILE_TOKEN_REGEX.sub("*", glob.escape(path))
+            files.extend(sorted(glob.glob(pattern)))
+        else:
+            files.append(path)
+
+    return list(dict.fromkeys(os.path.normpath(path) for path in files))
+
+
+def is_up_to_date(source: str, output: str) -> bool:
+    """Return whether the converted file is newer than the source texture.
+    """
+    try:
+        return os.stat(output).st_mtime >= os.stat(source).st_mtime
+    except OSError:
+        return False
+
+
+def find_texture_processor() -> Optional[str]:
+    """Return the path to Redshift's texture processor executable, if found.
+
+    The executable is searched for in the `bin` folder of the Redshift core
+    data path defined by the `REDSHIFT_COREDATAPATH` environment variable.
+    """
+    filename = "redshiftTextureProcessor"
+    if sys.platform == "win32":
+        filename += ".exe"
+
+    for env_key in ("REDSHIFT_COREDATAPATH", "REDSHIFT_LOCALDATAPATH"):
+        root: str = os.environ.get(env_key)
+        if not root:
+            continue
+        path = os.path.join(root, "bin", filename)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@attr.s
+class TextureProcessor:
+    """Convert textures with a pool of texture processor processes.
+
+    Attributes:
+        executable: The texture processor executable.
+        workers: Number of parallel processes. Defaults to the CPU count
+            when zero.
+        args: Additional arguments passed to the processor before the
+            texture path.
+        env: The environment for the processor processes.
+
+    """
+    executable: str = attr.ib()
+    workers: int = attr.ib(default=0)
+    args: list[str] = attr.ib(factory=list)
+    env: Optional[dict[str, str]] = attr.ib(default=None)
+
+    def process(self, paths: Iterable[str]) -> list[TextureResult]:
+        """Convert the textures that are not converted yet.
+
+        Returns:
+            list[TextureResult]: The result per texture file.
+
+        """
+        results: list[TextureResult] = []
+        pending: list[TextureResult] = []
+        for path in expand_texture_paths(paths):
+            result = TextureResult(source=path, output=get_rstexbin_path(path))
+            results.append(result)
+            if not os.path.isfile(path):
+                result.status = "missing"
+            elif is_up_to_date(path, result.output):
+                result.status = "skipped"
+            else:
+                pending.append(result)
+
+        if pending:
+            workers: int = self.workers or os.cpu_count() or 1
+            workers = max(1, min(workers, len(pending)))
+            log.info(
+                f"Converting {len(pending)} textures with {workers} workers."
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._convert, pending))
+        return results
+
+    def _convert(self, result: TextureResult) -> TextureResult:
+        command: list[str] = [self.executable, *self.args, result.source]
+        log.debug(f"Running: {subprocess.list2cmdline(command)}")
+        try:
+            process = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=self.env,
+                text=True,
+                errors="replace",
+            )
+        except OSError as exc:
+            result.status = "failed"
+            result.message = str(exc)
+            return result
+
+        if process.returncode != 0 or not os.path.isfile(result.output):
+            result.status = "failed"
+            result.message = process.stdout.strip()
+        else:
+            result.status = "converted"
+        return result
@@ -44,6 +44,11 @@ AYON_CONTEXT_CREATOR_IDENTIFIER = "io.ayon.create.context"
 class Cinema4DHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     name = "cinema4d"
 
+    # Link to the AYON context node to avoid searching the scene for it
+    _context_node_link = None
+    # Debug counter for how often the scene was searched for the context node
+    context_node_traversal_count = 0
+
     def install(self):
         # process path mapping
         # dirmap_processor = Cinema4DDirmap("cinema4d", project_settings)
@@ -83,17 +88,49 @@ class Cinema4DHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         with lib.maintained_selection():
             yield
 
+    def _get_cached_context_node(self, doc):
+        """Return the cached context node if it is still valid for `doc`."""
+        if self._context_node_link is None:
+            return None
+
+        # The link returns None if the node was deleted or is not part of
+        # the document (e.g. when the active document changed)
+        context_node = self._context_node_link.GetLink(doc)
+        if context_node is None:
+            return None
+
+        creator_id = lib.get_object_user_data_by_name(
+            context_node, "creator_identifier")
+        if creator_id != AYON_CONTEXT_CREATOR_IDENTIFIER:
+            return None
+
+        return context_node
+
     def _get_context_node(self, create_if_not_exists=False):
         doc = lib.active_document()
-        context_node = None
-        for creator_id, obj in plugin.iter_instance_objects(doc):
-            if creator_id == AYON_CONTEXT_CREATOR_IDENTIFIER:
-                context_node = obj
+        context_node = self._get_cached_context_node(doc)
+        if context_node is None:
+            # Find the context node in the scene
+            self.context_node_traversal_count += 1
+            log.debug(
+                "Searching AYON context node in scene "
+                f"(searched {self.context_node_traversal_count} times)"
+            )
+            instances = plugin.get_instance_cache(doc).get_instances()
+            context_nodes = instances.get(AYON_CONTEXT_CREATOR_IDENTIFIER)
+            if context_nodes:
+                # Use the last match like a full scene traversal would
+                context_node = context_nodes[-1]
 
         if context_node is None and create_if_not_exists:
             context_node = plugin.create_selection([], name="AYON_context")
             plugin.parent_to_ayon_null(context_node)
 
+        if context_node is not None:
+            link = c4d.BaseLink()
+            link.SetLink(context_node)
+            self._context_node_link = link
+
         return context_node
 
     def update_context_data(self, data, changes):
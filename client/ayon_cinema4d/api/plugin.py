@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import copy
+import logging
 import typing
 
 import c4d
@@ -17,22 +19,183 @@ from ayon_cinema4d.api import pipeline
 from . import lib
 
 if typing.TYPE_CHECKING:
-    from typing import Optional, List, Tuple, Union
+    from typing import Optional, Dict, List, Tuple, Union
+
+log = logging.getLogger(__name__)
 
 
 def iter_instance_objects(doc):
     instance_ids = {AYON_INSTANCE_ID, AVALON_INSTANCE_ID}
 
     for obj in lib.iter_objects(doc.GetFirstObject()):
-        if lib.get_object_user_data_by_name(obj, "id") not in instance_ids:
-            continue
+        creator_id = _get_instance_creator_id(obj, instance_ids)
+        if creator_id:
+            yield creator_id, obj
+
+
+def _get_instance_creator_id(obj, instance_ids) -> "Optional[str]":
+    """Return the creator identifier of an instance object, if any."""
+    if lib.get_object_user_data_by_name(obj, "id") not in instance_ids:
+        return None
+
+    return lib.get_object_user_data_by_name(obj, "creator_identifier")
+
+
+class InstanceCache:
+    """Document-scoped cache of the AYON instance objects in a document.
+
+    Discovering instance objects requires reading the user data of every
+    object in the document. This cache remembers per object GUID whether it
+    is an instance (and for which creator) together with the object's data
+    dirty counter. On the next discovery only objects that were added or
+    whose dirty counter changed are read again, and when no object changed
+    at all the previous discovery is reused as a whole.
+
+    The decoded instance data is cached in the same way so that a publisher
+    reset on an unchanged scene does not decode the user data again.
+
+    Use `get_instance_cache` to retrieve the cache for a document.
+
+    """
+    def __init__(self, doc):
+        self.doc = doc
+
+        # Object GUID -> (dirty, creator identifier or None)
+        self._entries: "Dict[int, Tuple[int, Optional[str]]]" = {}
+        # Object GUID -> (dirty, decoded instance data)
+        self._data: "Dict[int, Tuple[int, dict]]" = {}
+        self._signature: "Optional[tuple]" = None
+        self._instances: "Dict[str, List[c4d.BaseObject]]" = {}
+
+        # Debug counters
+        self.discovery_count: int = 0
+        self.discovery_skipped_count: int = 0
+
+    def _get_signature(self, objects) -> tuple:
+        return tuple(
+            (obj.GetGUID(), obj.GetDirty(c4d.DIRTYFLAGS_DATA))
+            for obj in objects
+        )
+
+    def get_instances(self) -> "Dict[str, List[c4d.BaseObject]]":
+        """Return instance objects in the document by creator identifier."""
+        objects = list(lib.iter_objects(self.doc.GetFirstObject()))
+        signature = self._get_signature(objects)
+        if signature == self._signature:
+            self.discovery_skipped_count += 1
+            log.debug(
+                "Reusing instance discovery for unchanged document "
+                f"(skipped {self.discovery_skipped_count} times, "
+                f"discovered {self.discovery_count} times)"
+            )
+            return self._instances
+
+        self.discovery_count += 1
+        instance_ids = {AYON_INSTANCE_ID, AVALON_INSTANCE_ID}
+        entries = {}
+        instances = {}
+        for obj, (guid, dirty) in zip(objects, signature):
+            entry = self._entries.get(guid)
+            if entry is None or entry[0] != dirty:
+                entry = (dirty, _get_instance_creator_id(obj, instance_ids))
+            entries[guid] = entry
+
+            creator_id = entry[1]
+            if creator_id:
+                instances.setdefault(creator_id, []).append(obj)
+
+        self._entries = entries
+        self._data = {
+            guid: value for guid, value in self._data.items()
+            if guid in entries
+        }
+        self._signature = signature
+        self._instances = instances
+        return instances
+
+    def read(self, obj) -> dict:
+        """Return the decoded user data of an instance object.
+
+        The returned dictionary is a copy and is safe to be altered.
+
+        """
+        guid: int = obj.GetGUID()
+        dirty: int = obj.GetDirty(c4d.DIRTYFLAGS_DATA)
+        cached = self._data.get(guid)
+        if cached is None or cached[0] != dirty:
+            cached = (dirty, lib.read(obj))
+            self._data[guid] = cached
+        return copy.deepcopy(cached[1])
+
+    def discard(self, objects):
+        """Remove objects (and their children) from the cache.
+
+        This allows to update the cache incrementally when removing instance
+        objects instead of forcing a new discovery of the whole document.
+        Call this before the objects are removed from the document.
+
+        Arguments:
+            objects (Iterable[c4d.BaseObject]): The objects to discard.
+
+        """
+        guids = set()
+        for obj in objects:
+            guids.add(obj.GetGUID())
+            for child in lib.iter_all_children(obj):
+                guids.add(child.GetGUID())
+        if not guids:
+            return
+
+        for guid in guids:
+            self._entries.pop(guid, None)
+            self._data.pop(guid, None)
+        if self._signature is not None:
+            self._signature = tuple(
+                item for item in self._signature if item[0] not in guids
+            )
+        self._instances = {
+            creator_id: [
+                instance_obj for instance_obj in instance_objects
+                if instance_obj.GetGUID() not in guids
+            ]
+            for creator_id, instance_objects in self._instances.items()
+        }
+
+    def clear(self):
+        """Clear the cache so the next discovery reads all objects again."""
+        self._entries.clear()
+        self._data.clear()
+        self._signature = None
+        self._instances = {}
+
+
+_instance_caches: "Dict[int, InstanceCache]" = {}
+
+
+def get_instance_cache(doc=None) -> InstanceCache:
+    """Return the instance cache for the document.
+
+    Args:
+        doc (Optional[c4d.documents.BaseDocument]): The document to get the
+            cache for. Defaults to the active document.
+
+    Returns:
+        InstanceCache: The document's instance cache.
+
+    """
+    doc = doc or lib.active_document()
+    key = hash(doc)
+    cache = _instance_caches.get(key)
+    if cache is None:
+        # Drop caches of documents that are no longer open
+        lib.prune_closed_document_caches(_instance_caches)
 
-        creator_id = lib.get_object_user_data_by_name(
-            obj, "creator_identifier")
-        if not creator_id:
-            continue
+        cache = InstanceCache(doc)
+        _instance_caches[key] = cache
 
-        yield creator_id, obj
+    # Always keep the latest reference to the document
+    cache.doc = doc
+    return cache
 
 
 def cache_instance_data(shared_data):
@@ -42,17 +205,19 @@ def cache_instance_data(shared_data):
     fill it with all collected instances from the scene under its
     respective creator identifiers.
 
+    The discovery itself is cached per document with `InstanceCache` so
+    that repeated publisher resets on an unchanged scene reuse it.
+
     Args:
         shared_data(Dict[str, Any]): Shared data.
 
     """
     if shared_data.get('cinema4d_cached_instances') is None:
-        cache = {}
-        doc = lib.active_document()
-        for creator_id, obj in iter_instance_objects(doc):
-            cache.setdefault(creator_id, []).append(obj)
-
-        shared_data["cinema4d_cached_instances"] = cache
+        instances = get_instance_cache().get_instances()
+        shared_data["cinema4d_cached_instances"] = {
+            creator_id: list(objects)
+            for creator_id, objects in instances.items()
+        }
 
     return shared_data
 
@@ -144,7 +309,6 @@ class Cinema4DCreator(Creator):
         shared_data = cache_instance_data(self.collection_shared_data)
         for obj in shared_data["cinema4d_cached_instances"].get(
                 self.identifier, []):
-
             data = self._read_instance_node(obj)
 
             # Add instance
@@ -163,16 +327,21 @@ class Cinema4DCreator(Creator):
         c4d.EventAdd()
 
     def remove_instances(self, instances):
+        nodes = []
         for instance in instances:
-
-            # Remove node from the scene
             node = instance.transient_data["instance_node"]
             if node:
-                node.Remove()
+                nodes.append(node)
 
-            # Remove the collected CreatedInstance to remove from UI directly
+        # Remove all nodes from the scene in a single undo step and update
+        # the instance cache directly instead of forcing a new discovery
+        doc = lib.active_document()
+        get_instance_cache(doc).discard(nodes)
+        lib.remove_nodes(nodes, doc=doc)
+
+        # Remove the collected CreatedInstance to remove from UI directly
+        for instance in instances:
             self._remove_instance_from_context(instance)
-        c4d.EventAdd()
 
     def _imprint(self, node, data):
 
@@ -182,7 +351,12 @@ class Cinema4DCreator(Creator):
         lib.imprint(node, data, group="AYON")
 
     def _read_instance_node(self, obj) -> dict:
-        data = lib.read(obj)
+        if isinstance(obj, c4d.BaseObject):
+            # Read the decoded data from the cache to avoid decoding the
+            # user data again when the object did not change
+            data = get_instance_cache(obj.GetDocument()).read(obj)
+        else:
+            data = lib.read(obj)
         data["instance_id"] = str(hash(obj))
         return data
 
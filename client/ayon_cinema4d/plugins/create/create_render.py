@@ -1,6 +1,14 @@
 from __future__ import annotations
+import copy
+import csv
 import inspect
+import json
+import os
+from typing import Optional
 
+import attr
+
+from ayon_core.lib import FileDef, TextDef
 from ayon_core.pipeline import CreatedInstance, AYON_INSTANCE_ID
 from ayon_cinema4d.api import lib, plugin
 
@@ -8,6 +16,78 @@ import c4d
 import c4d.documents
 
 
+@attr.s
+class TakeIndexEntry:
+    """Data of a single Take collected in a `TakeIndex`."""
+    take: c4d.modules.takesystem.BaseTake = attr.ib()
+    name: str = attr.ib()
+    checked: bool = attr.ib()
+    data: dict = attr.ib()      # Decoded instance data
+    marked: bool = attr.ib()    # Whether render instance data is imprinted
+
+
+class TakeIndex:
+    """Index of all Takes in a document built in a single pass.
+
+    Each Take's user data is read and decoded only once so that the index
+    can be shared by the creator's checks and collection.
+    """
+    def __init__(self, entries: list[TakeIndexEntry]):
+        self.entries: list[TakeIndexEntry] = entries
+        self._by_name: dict[str, TakeIndexEntry] = {
+            entry.name: entry for entry in entries
+        }
+
+    @property
+    def marked(self) -> bool:
+        """Return whether any Take has render instance data imprinted."""
+        return any(entry.marked for entry in self.entries)
+
+    def find_by_name(self, name: str) -> Optional[TakeIndexEntry]:
+        return self._by_name.get(name)
+
+    def add(self, entry: TakeIndexEntry):
+        self.entries.append(entry)
+        self._by_name[entry.name] = entry
+
+
+def read_variants_file(path: str) -> list[str]:
+    """Read variants from a CSV or JSON file.
+
+    A CSV file lists a variant per row in its first column, optionally with
+    a `variant` header. A JSON file contains either a list of variants, a
+    list of objects with a `variant` key or an object with a `variants` list.
+
+    Arguments:
+        path (str): Path to the CSV or JSON file.
+
+    Returns:
+        list[str]: The variants in the file.
+
+    """
+    if path.lower().endswith(".json"):
+        with open(path, "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("variants", [])
+        return [
+            item["variant"] if isinstance(item, dict) else str(item)
+            for item in data
+        ]
+
+    variants: list[str] = []
+    with open(path, "r", newline="") as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip():
+                continue
+            variant = row[0].strip()
+            if not variants and variant.lower() == "variant":
+                # Skip header
+                continue
+            variants.append(variant)
+    return variants
+
+
 class RenderlayerCreator(plugin.Cinema4DCreator):
     """Creator which creates an instance per renderlayer in the workfile.
 
@@ -32,18 +112,31 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
 
     _required_keys = ("creator_identifier", "productName")
 
-    def _is_marked_workfile_as_render_enabled(self, take_data) -> bool:
+    def _build_take_index(self, take_data) -> TakeIndex:
+        """Return index of all Takes in the Take data in a single pass."""
+        entries: list[TakeIndexEntry] = []
+        for take in lib.iter_objects(take_data.GetMainTake()):
+            data = self._read_instance_node(take)
+            entries.append(
+                TakeIndexEntry(
+                    take=take,
+                    name=take.GetName(),
+                    checked=take.IsChecked(),
+                    data=data,
+                    marked=all(key in data for key in self._required_keys),
+                )
+            )
+        return TakeIndex(entries)
+
+    def _is_marked_workfile_as_render_enabled(
+            self, take_index: TakeIndex) -> bool:
         """Return whether the detecting of Takes as render instances is
         enabled in the current workfile.
 
         This will be true if at least one Take in the scene has render instance
         data imprinted onto it.
         """
-        for take in lib.iter_objects(take_data.GetMainTake()):
-            data = self._read_instance_node(take)
-            if all(key in data for key in self._required_keys):
-                return True
-        return False
+        return take_index.marked
 
     def create(self, product_name, instance_data, pre_create_data):
 
@@ -52,22 +145,98 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
         # So we put some data somewhere that says, "takes are now collected".
         # self._mark_workfile_as_render_enabled()
 
+        batch_variants = self._get_batch_variants(pre_create_data)
+        if batch_variants:
+            return self.create_batch(batch_variants, instance_data)
+
         doc: c4d.documents.BaseDocument = c4d.documents.GetActiveDocument()
         take_data = doc.GetTakeData()
         if take_data is None:
             return
 
+        take_index = self._build_take_index(take_data)
+        with lib.undo_chunk(doc):
+            instance = self._create_take_instance(
+                doc, take_data, take_index, product_name, instance_data
+            )
+        c4d.EventAdd()
+
+        # Then directly refresh with all existing entries
+        self.collect_instances(take_index=take_index)
+
+        return instance
+
+    def create_batch(
+        self,
+        variants: list[str],
+        instance_data: Optional[dict] = None
+    ) -> list[CreatedInstance]:
+        """Create a render instance per variant in a single transaction.
+
+        All Takes are created and imprinted inside one undo chunk and the
+        instances are collected only once at the end.
+
+        Arguments:
+            variants (list[str]): The variants to create render Takes for.
+            instance_data (Optional[dict]): Base instance data to use for
+                each of the created instances.
+
+        Returns:
+            list[CreatedInstance]: The created instances.
+
+        """
+        doc: c4d.documents.BaseDocument = c4d.documents.GetActiveDocument()
+        take_data = doc.GetTakeData()
+        if take_data is None:
+            return []
+
+        product_type: str = self.product_base_type
+        context_cache = lib.get_create_context_cache(self.create_context)
+        take_index = self._build_take_index(take_data)
+        instances: list[CreatedInstance] = []
+        with lib.undo_chunk(doc):
+            for variant in variants:
+                variant_data = copy.deepcopy(instance_data or {})
+                variant_data["variant"] = variant
+                product_name = context_cache.get_product_name(
+                    self,
+                    self._sanitize_take_variant_name(variant),
+                    variant_data.get("productType") or product_type,
+                )
+                instances.append(
+                    self._create_take_instance(
+                        doc, take_data, take_index, product_name, variant_data
+                    )
+                )
+        c4d.EventAdd()
+
+        # Collect once for all the created Takes
+        self.collect_instances(take_index=take_index)
+
+        return instances
+
+    def _create_take_instance(
+        self,
+        doc: c4d.documents.BaseDocument,
+        take_data: c4d.modules.takesystem.TakeData,
+        take_index: TakeIndex,
+        product_name: str,
+        instance_data: dict
+    ) -> CreatedInstance:
+        """Create or mark the Take for the variant and imprint it.
+
+        The Take index is updated in place so that it can be passed on to
+        `collect_instances` without reading the Takes again.
+        """
         instance_node = None
         variant_name: str = instance_data.get("variant", "Main")
-        print(variant_name)
-        if not self._is_marked_workfile_as_render_enabled(take_data):
+        entry: Optional[TakeIndexEntry] = None
+        if not self._is_marked_workfile_as_render_enabled(take_index):
             # If there's already a take with the variant name, we skip creating
             # a new take but instead just mark the existing take
-            for take in lib.iter_objects(take_data.GetMainTake()):
-                if take.GetName() == variant_name:
-                    # If there's already a take with the variant name,
-                    # we do nothing
-                    instance_node = take
+            entry = take_index.find_by_name(variant_name)
+            if entry is not None:
+                instance_node = entry.take
 
         # Create a new take
         if instance_node is None:
@@ -75,7 +244,15 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
             # user
             root = take_data.GetMainTake()
             instance_node = take_data.AddTake(variant_name, root, None)
-            c4d.EventAdd()
+            doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, instance_node)
+            entry = TakeIndexEntry(
+                take=instance_node,
+                name=variant_name,
+                checked=instance_node.IsChecked(),
+                data={},
+                marked=False,
+            )
+            take_index.add(entry)
 
         # Enforce forward compatibility to avoid the instance to default
         # to the legacy `AVALON_INSTANCE_ID`
@@ -83,7 +260,10 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
         # Use the uniqueness of the node in Cinema4D as the instance id
         instance_data["instance_id"] = str(hash(instance_node))
         instance = CreatedInstance(
-            product_type=self.product_type,
+            product_base_type=self.product_base_type,
+            product_type=(
+                instance_data.get("productType") or self.product_base_type
+            ),
             product_name=product_name,
             data=instance_data,
             transient_data={
@@ -97,33 +277,66 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
         data = instance.data_to_store()
         self.imprint_instance_node(instance_node, data)
 
+        # Keep the index in sync with the imprinted data so the collection
+        # does not need to read the Takes again
+        entry.data = self._read_instance_node(instance_node)
+        entry.marked = True
+
         self._add_instance_to_context(instance)
 
-        # Then directly refresh with all existing entries
-        self.collect_instances()
+        return instance
+
+    def _get_batch_variants(self, pre_create_data: dict) -> list[str]:
+        """Return the unique variants to batch create from pre-create data.
+
+        Variants can be entered one per line (or comma separated) and/or be
+        read from a CSV or JSON file.
+        """
+        variants: list[str] = []
+        text: str = pre_create_data.get("batch_variants") or ""
+        for line in text.splitlines():
+            variants.extend(line.split(","))
+
+        batch_file = pre_create_data.get("batch_variants_file")
+        if batch_file and batch_file.get("filenames"):
+            path = os.path.join(
+                batch_file["directory"], batch_file["filenames"][0]
+            )
+            variants.extend(read_variants_file(path))
+
+        unique_variants: list[str] = []
+        for variant in variants:
+            variant = variant.strip()
+            if variant and variant not in unique_variants:
+                unique_variants.append(variant)
+        return unique_variants
+
+    def collect_instances(self, take_index: Optional[TakeIndex] = None):
+        # Retrieve the context cache first so it is cleared on every
+        # publisher reset, also when there are no render instances
+        context_cache = lib.get_create_context_cache(self.create_context)
 
-    def collect_instances(self):
         doc: c4d.documents.BaseDocument = c4d.documents.GetActiveDocument()
-        take_data = doc.GetTakeData()
-        if not self._is_marked_workfile_as_render_enabled(take_data):
+        if take_index is None:
+            take_data = doc.GetTakeData()
+            take_index = self._build_take_index(take_data)
+        if not self._is_marked_workfile_as_render_enabled(take_index):
             return
 
         # Each Cinema4D Take is considered a renderlayer
-        for take in lib.iter_objects(take_data.GetMainTake()):
-
-            data = self._read_instance_node(take)
-            if all(key in data for key in self._required_keys):
-                data = self.read_take_overrides(take, data)
+        for entry in take_index.entries:
+            take = entry.take
+            if entry.marked:
+                data = self.read_take_overrides(take, entry.data, entry)
                 instance = CreatedInstance.from_existing(data, creator=self)
             else:
-                take_name: str = take.GetName()
-                variant = self._sanitize_take_variant_name(take_name)
+                variant = self._sanitize_take_variant_name(entry.name)
 
                 # No existing scene instance node for this layer. Note that
                 # this instance will not have the `instance_node` data yet
                 # until it's been saved/persisted at least once.
-                folder_entity = self.create_context.get_current_folder_entity()
-                task_entity = self.create_context.get_current_task_entity()
+                folder_entity = context_cache.get_folder_entity()
+                task_entity = context_cache.get_task_entity()
                 instance_data = {
                     "folderPath": folder_entity["path"],
                     "task": task_entity["name"],
@@ -132,11 +345,15 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
 
                 # Allow subclass to override data behavior
                 instance_data = self.read_take_overrides(
-                    take, instance_data
+                    take, instance_data, entry
                 )
 
                 instance = CreatedInstance(
-                    product_type=self.product_type,
+                    product_base_type=self.product_base_type,
+                    product_type=(
+                        instance_data.get("productType")
+                        or self.product_base_type
+                    ),
                     # Defined in `read_take_overrides`
                     product_name=instance_data["productName"],
                     data=instance_data,
@@ -150,39 +367,40 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
     def read_take_overrides(
             self,
             take: c4d.modules.takesystem.BaseTake,
-            instance_data: dict) -> dict:
+            instance_data: dict,
+            take_entry: Optional[TakeIndexEntry] = None) -> dict:
         """Overridable read logic to read certain data from the take itself.
 
         Arguments:
             take (c4d.modules.takesystem.BaseTake): The render take.
             instance_data (dict): The instance's data dictionary.
+            take_entry (Optional[TakeIndexEntry]): The take's entry in the
+                take index, if available, to avoid querying the take again.
 
         Returns:
             dict: The instance's data dictionary with overrides.
 
         """
+        if take_entry is not None:
+            take_name: str = take_entry.name
+            checked: bool = take_entry.checked
+        else:
+            take_name: str = take.GetName()
+            checked: bool = take.IsChecked()
+
         # Override some regular "read" logic like active state
         # retrieved from take active state
-        instance_data["active"] = take.IsChecked()
+        instance_data["active"] = checked
 
-        project_name = self.create_context.get_current_project_name()
-        folder_entity = self.create_context.get_current_folder_entity()
-        task_entity = self.create_context.get_current_task_entity()
-        variant = self._sanitize_take_variant_name(take.GetName())
-
-        host_name = self.create_context.host_name
+        variant = self._sanitize_take_variant_name(take_name)
 
         product_type = instance_data.get("productType")
         if not product_type:
             product_type = self.product_base_type
         # Always keep product name in sync with the take name
-        product_name = self.get_product_name(
-            project_name,
-            folder_entity,
-            task_entity,
-            variant,
-            host_name,
-            product_type=product_type,
+        context_cache = lib.get_create_context_cache(self.create_context)
+        product_name = context_cache.get_product_name(
+            self, variant, product_type
         )
         instance_data["productName"] = product_name
         instance_data["variant"] = variant
@@ -244,29 +462,68 @@ class RenderlayerCreator(plugin.Cinema4DCreator):
         self._imprint(node, data)
 
     def remove_instances(self, instances):
-        # Disallow 'deleting the "Main" take because it can't be removed
+        # Collect all takes first so they can be removed in one undo step
+        takes: list[c4d.modules.takesystem.BaseTake] = []
+        main_take: Optional[c4d.modules.takesystem.BaseTake] = None
+        main_take_keys: set[str] = set()
+        removed_instances = []
         for instance in instances:
             take: c4d.modules.takesystem.BaseTake = (
                 instance.transient_data.get("take")
             )
             if not take:
                 continue
+            removed_instances.append(instance)
 
+            # Disallow 'deleting the "Main" take because it can't be removed
             if take.IsMain():
+                main_take = take
+                main_take_keys.update(instance.data_to_store().keys())
+            else:
+                takes.append(take)
+
+        doc: c4d.documents.BaseDocument = c4d.documents.GetActiveDocument()
+        with lib.undo_chunk(doc):
+            if main_take is not None:
                 # Remove any imprinted instance data, but avoid deleting it
                 # because deleting the main take will crash Cinema4D
-                existing_user_data = take.GetUserDataContainer()
-                instance_data_keys = set(instance.data_to_store().keys())
+                doc.AddUndo(c4d.UNDOTYPE_CHANGE, main_take)
+                existing_user_data = main_take.GetUserDataContainer()
                 for description_id, base_container in existing_user_data:
                     key = base_container[c4d.DESC_NAME]
-                    if key in instance_data_keys:
-                        take.RemoveUserData(description_id)
-            else:
+                    if key in main_take_keys:
+                        main_take.RemoveUserData(description_id)
+
+            for take in takes:
+                doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, take)
                 take.Remove()
 
-            # Remove the collected CreatedInstance to remove from UI directly
+        # Remove the collected CreatedInstance to remove from UI directly
+        for instance in removed_instances:
             self._remove_instance_from_context(instance)
         c4d.EventAdd()
 
     def get_pre_create_attr_defs(self):
-        return []
+        return [
+            TextDef(
+                "batch_variants",
+                label="Batch variants",
+                multiline=True,
+                placeholder="One variant per line",
+                tooltip=(
+                    "Create a render Take per variant in one go. When set,"
+                    " the variant above is ignored."
+                ),
+            ),
+            FileDef(
+                "batch_variants_file",
+                label="Batch variants file",
+                folders=False,
+                extensions=[".csv", ".json"],
+                single_item=True,
+                tooltip=(
+                    "CSV file with a variant per row in the first column or"
+                    " a JSON file with a list of variants."
+                ),
+            ),
+        ]
@@ -1,5 +1,8 @@
 from ayon_core.pipeline import CreatedInstance, AutoCreator, AYON_INSTANCE_ID
-from ayon_cinema4d.api.plugin import cache_instance_data
+from ayon_cinema4d.api.plugin import (
+    cache_instance_data,
+    get_instance_cache
+)
 from ayon_cinema4d.api import lib, plugin
 
 
@@ -88,10 +91,11 @@ class CreateWorkfile(AutoCreator):
     def collect_instances(self):
 
         shared_data = cache_instance_data(self.collection_shared_data)
+        instance_cache = get_instance_cache()
         for obj in shared_data["cinema4d_cached_instances"].get(
                 self.identifier, []):
 
-            data = lib.read(obj)
+            data = instance_cache.read(obj)
             data["instance_id"] = str(hash(obj))
 
             # Add instance
@@ -124,8 +128,13 @@ class CreateWorkfile(AutoCreator):
             lib.imprint(node, new_data, group="AYON")
 
     def remove_instances(self, instances):
-        for instance in instances:
-            node = instance.transient_data["instance_node"]
-            node.Remove()
+        nodes = [
+            instance.transient_data["instance_node"]
+            for instance in instances
+        ]
+        doc = lib.active_document()
+        get_instance_cache(doc).discard(nodes)
+        lib.remove_nodes(nodes, doc=doc)
 
+        for instance in instances:
             self._remove_instance_from_context(instance)
@@ -1,6 +1,8 @@
 import pyblish.api
 import c4d.documents
 
+from ayon_cinema4d.api import lib_exportworker, lib_prebake
+
 
 class CollectCinema4DActiveDocument(pyblish.api.ContextPlugin):
     """Inject the c4d.documents.GetActiveDocument() into context"""
@@ -10,4 +12,14 @@ class CollectCinema4DActiveDocument(pyblish.api.ContextPlugin):
     hosts = ['cinema4d']
 
     def process(self, context):
+        # Restore cache tags baked by a previous publish that stopped
+        # before its extractors could restore them
+        if lib_prebake.restore_pending_prebakes():
+            self.log.debug("Restored baked cache tags of previous publish.")
+
+        # Cancel export workers of a previous publish that stopped before
+        # their results were collected
+        if lib_exportworker.shutdown_active_pools():
+            self.log.debug("Cancelled export workers of previous publish.")
+
         context.data['doc'] = c4d.documents.GetActiveDocument()
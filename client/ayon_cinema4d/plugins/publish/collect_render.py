@@ -1,13 +1,20 @@
 from __future__ import annotations
 import attr
 import os
+import shutil
 import pyblish.api
 from typing import Optional
 
 import clique
 
 from ayon_core.pipeline import publish
-from ayon_cinema4d.api import lib, lib_renderproducts
+from ayon_cinema4d.api import (
+    lib,
+    lib_frames,
+    lib_products,
+    lib_renderproducts,
+)
+from ayon_cinema4d.api.lib_frames import FrameRangeSet, FrameSequence
 
 import c4d
 import c4d.documents
@@ -31,6 +38,17 @@ class Cinema4DRenderInstance(publish.RenderInstance):
     colorspaceDisplay: Optional[str] = attr.ib(default=None)
     colorspaceView: Optional[str] = attr.ib(default=None)
 
+    # Compact frame list of the frames that are rendered, e.g. `1-10x2,20`
+    frameList: Optional[str] = attr.ib(default=None)
+    takeName: Optional[str] = attr.ib(default=None)
+
+    # Optional compact encoding of the expected files per AOV
+    expectedFilesCompact: Optional[dict] = attr.ib(default=None)
+
+    # Estimated size in bytes of all render outputs and per AOV
+    estimatedOutputSize: Optional[int] = attr.ib(default=None)
+    estimatedOutputSizes: Optional[dict] = attr.ib(default=None)
+
 
 class CollectCinema4DRender(
     publish.AbstractCollectRender,
@@ -52,6 +70,21 @@ class CollectCinema4DRender(
     hosts = ["cinema4d"]
     families = ["render"]
 
+    settings_category = "cinema4d"
+
+    # Also store a compact encoding of the expected files on the instance
+    # that can be decoded with `lib_frames.decode_compact_files`
+    compact_expected_files: bool = False
+
+    # Store the collected render products in a local manifest cache keyed
+    # by a checksum of the scene so an unchanged scene reuses them
+    use_render_products_manifest: bool = True
+
+    # Estimate the size of the render outputs and calibrate the estimate
+    # with the size of previously rendered files found on disk
+    estimate_output_size: bool = True
+    calibrate_output_size: bool = True
+
     def get_instances(self, context):
         current_file = context.data["currentFile"]
         version = context.data.get("version")
@@ -90,13 +123,17 @@ class CollectCinema4DRender(
             resolution_width: int = int(render_data[c4d.RDATA_XRES])
             resolution_height: int = int(render_data[c4d.RDATA_YRES])
             pixel_aspect: float = float(render_data[c4d.RDATA_PIXELASPECT])
-            frame_start: int = int(
-                render_data[c4d.RDATA_FRAMEFROM].GetFrame(fps)
-            )
-            frame_end: int = int(
-                render_data[c4d.RDATA_FRAMETO].GetFrame(fps)
+            frames: FrameRangeSet = lib_renderproducts.get_render_frames(
+                render_data, fps
             )
-            step: int = int(render_data[c4d.RDATA_FRAMESTEP])
+            if not frames:
+                self.log.warning(
+                    f"Take '{take.GetName()}' renders no frames. Skipping.")
+                continue
+            frame_start: int = frames.first
+            frame_end: int = frames.last
+            frame_range = frames.as_range()
+            step: int = frame_range.step if frame_range is not None else 1
 
             instance_families = inst.data.get("families", [])
             product_name = inst.data["productName"]
@@ -129,6 +166,8 @@ class CollectCinema4DRender(
                 frameStartHandle=frame_start,
                 frameEndHandle=frame_end,
                 frameStep=step,
+                frameList=frames.to_frame_list(),
+                takeName=take.GetName(),
                 fps=fps,
                 publish_attributes=inst.data.get("publish_attributes", {}),
                 # The source instance this render instance replaces
@@ -163,7 +202,6 @@ class CollectCinema4DRender(
 
         instance: pyblish.api.Instance = render_instance.source_instance
         render_data: c4d.documents.RenderData = render_instance.renderData
-        doc = render_data.GetDocument()
 
         # From the Take and Render Data we find the correct output path,
         # whether it is multipass and what AOVs are enabled for the renderer.
@@ -176,12 +214,8 @@ class CollectCinema4DRender(
         # Debug log what take we're processing, etc.
         self.log.debug(f"Take: {take.GetName()}")
         self.log.debug(f"  Render Settings: {render_data.GetName()}")
-        self.log.debug(
-            "  Frame range: "
-            f"{render_instance.frameStartHandle}-"
-            f"{render_instance.frameEndHandle}x"
-            f"{render_instance.frameStep}"
-        )
+        frames = FrameRangeSet.parse(render_instance.frameList)
+        self.log.debug(f"  Frames: {frames}")
         self.log.debug(
             f"  Resolution:  "
             f"{render_instance.resolutionWidth}x"
@@ -195,67 +229,40 @@ class CollectCinema4DRender(
         video_posts_names = ", ".join(vp.GetName() for vp in video_posts)
         self.log.debug(f"  Video posts: {video_posts_names}")
 
-        name_format: int = render_data[c4d.RDATA_NAMEFORMAT]
-
-        def files_resolver(
-            token_path: str,
-            layer_name: str = "$userpass",
-            layer_type_name: str = "$pass",
-            file_format: int = render_data[c4d.RDATA_MULTIPASS_SAVEFORMAT],
-        ) -> list[str]:
-            """Return filepaths for all frames with given token path and
-            layer names."""
-            files: list[str] = []
-            token_path = self._abspath(doc, token_path)
-            for frame in range(
-                render_instance.frameStartHandle,
-                render_instance.frameEndHandle + 1,
-            ):
-                resolved_path = lib_renderproducts.resolve_filepath(
-                    token_path,
-                    doc=doc,
-                    render_data=render_data,
-                    layer_name=layer_name,
-                    layer_type_name=layer_type_name,
-                    take=take,
-                    frame=frame,
+        # Reuse the render products stored on disk by a previous publish
+        # of the unchanged scene
+        products: Optional[dict[str, FrameSequence | list[str]]] = None
+        manifest_checksum: Optional[str] = None
+        if self.use_render_products_manifest:
+            manifest_checksum = (
+                lib_renderproducts.get_render_products_checksum(
+                    render_data, take, frames
                 )
-                resolved_path = lib_renderproducts.apply_name_format(
-                    resolved_path,
-                    name_format=name_format,
-                    file_format=file_format,
-                    frame=frame
-                )
-                files.append(resolved_path)
-            return files
-
-        # Get take render data AOVs
-        products: dict[str, list[str]] = {}
-
-        # Regular image
-        save_image: bool = render_data[c4d.RDATA_SAVEIMAGE]
-        if save_image:
-            token_path: str = render_data[c4d.RDATA_PATH]
-            products[""] = files_resolver(
-                token_path,
-                file_format=render_data[c4d.RDATA_FORMAT]
             )
+            if manifest_checksum:
+                products = lib_renderproducts.load_render_products_manifest(
+                    manifest_checksum
+                )
+            if products is not None:
+                self.log.debug(
+                    "  Reusing render products from manifest: "
+                    f"{manifest_checksum}"
+                )
 
-        # Multi-Pass image
-        save_multipass_image: bool = render_data[c4d.RDATA_MULTIPASS_SAVEIMAGE]
-        if save_multipass_image:
-            products.update(
-                self._collect_multipass(
-                    render_data,
-                    files_resolver
+        if products is None:
+            products = self._collect_products(render_data, take, frames)
+            if manifest_checksum:
+                lib_renderproducts.save_render_products_manifest(
+                    manifest_checksum, products
                 )
-            )
 
         # Set output dir from the beauty output because it is required for
         # publish metadata to be written out and the publish job submission
         # to succeed
         if products:
-            first_product_file: str = next(iter(products.values()))[0]
+            first_product_file: str = next(iter(
+                next(iter(products.values()))
+            ))
             render_instance.outputDir = os.path.dirname(first_product_file)
             self.log.debug(
                 f"Collected output directory: {render_instance.outputDir}"
@@ -269,6 +276,10 @@ class CollectCinema4DRender(
             if aov_name == "":
                 aov_name = "<Beauty>"
 
+            if isinstance(aov_files, FrameSequence):
+                self.log.debug(f"  {aov_name} files: {aov_files}")
+                continue
+
             collections, remainder = clique.assemble(aov_files)
             file_labels = remainder + list(
                 str(collection) for collection in collections
@@ -287,13 +298,176 @@ class CollectCinema4DRender(
                 )
             )
 
-        return [products]
+        if self.estimate_output_size:
+            self._estimate_output_size(render_instance, products)
+
+        if self.compact_expected_files:
+            render_instance.expectedFilesCompact = (
+                lib_frames.encode_compact_files(products)
+            )
+
+        # Expand the frame sequences to the list of filepaths required by
+        # `AbstractCollectRender`
+        return [{
+            aov_name: lib_frames.expand_files(files)
+            for aov_name, files in products.items()
+        }]
+
+    def _estimate_output_size(
+        self,
+        render_instance: Cinema4DRenderInstance,
+        products: dict[str, FrameSequence | list[str]],
+    ):
+        """Estimate the size of all render outputs of the render instance.
+
+        The size of a single file is estimated from the resolution, bit
+        depth and compression class of the output format. When files of a
+        previous render of the product exist on disk their size is used
+        instead.
+        """
+        render_data: c4d.documents.RenderData = render_instance.renderData
+        beauty_format = lib_renderproducts.get_output_format(render_data)
+        multipass_format = lib_renderproducts.get_output_format(
+            render_data, multipass=True
+        )
+
+        sizes: dict[str, int] = {}
+        for aov_name, files in products.items():
+            output_format = multipass_format if aov_name else beauty_format
+            file_size: int = output_format.estimate_file_size(
+                render_instance.resolutionWidth,
+                render_instance.resolutionHeight,
+            )
+            if self.calibrate_output_size:
+                file_size = self._get_existing_file_size(files) or file_size
+            sizes[aov_name] = file_size * len(files)
+
+        total: int = sum(sizes.values())
+        render_instance.estimatedOutputSize = total
+        render_instance.estimatedOutputSizes = sizes
+        self.log.info(
+            f"Estimated render output size for '{render_instance.name}': "
+            f"{lib_products.format_bytes(total)}"
+        )
+
+        # Warn when the output will not fit on the output volume
+        directory: Optional[str] = render_instance.outputDir
+        while directory and not os.path.isdir(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return
+            directory = parent
+        if not directory:
+            return
+
+        free: int = shutil.disk_usage(directory).free
+        if total > free:
+            self.log.warning(
+                "Estimated render output size "
+                f"{lib_products.format_bytes(total)} exceeds the free space "
+                f"{lib_products.format_bytes(free)} of: {directory}"
+            )
+
+    @staticmethod
+    def _get_existing_file_size(
+        files: FrameSequence | list[str],
+        samples: int = 5,
+        max_checks: int = 20,
+    ) -> Optional[int]:
+        """Return the average size of existing files of the product.
+
+        Only the first `max_checks` files are checked to avoid querying the
+        file system for each frame of long sequences.
+        """
+        file_sizes: list[int] = []
+        for index, path in enumerate(files):
+            if index >= max_checks or len(file_sizes) >= samples:
+                break
+            try:
+                file_sizes.append(os.stat(path).st_size)
+            except OSError:
+                continue
+
+        if not file_sizes:
+            return None
+        return sum(file_sizes) // len(file_sizes)
+
+    def _collect_products(
+        self,
+        render_data: c4d.documents.RenderData,
+        take: c4d.modules.takesystem.BaseTake,
+        frames: FrameRangeSet,
+    ) -> dict[str, FrameSequence | list[str]]:
+        """Return the files per AOV for the take's render data."""
+        # Takes sharing the same render settings share their render products
+        # so only the frame expansion has to be done per take.
+        graph_key = lib_renderproducts.get_render_data_checksum(render_data)
+        graph = lib_renderproducts.get_cached_product_graph(graph_key)
+        if graph is None:
+            graph = self._collect_product_graph(render_data)
+            lib_renderproducts.cache_product_graph(graph_key, graph)
+        else:
+            self.log.debug(
+                "  Reusing render products of identical render settings.")
+
+        snapshot = lib_renderproducts.snapshot_take(
+            graph, render_data, take, frames
+        )
+        return lib_products.compute_products(snapshot)
+
+    def _collect_product_graph(
+        self,
+        render_data: c4d.documents.RenderData
+    ) -> lib_renderproducts.ProductGraph:
+        """Collect the render products of the render data."""
+        doc = render_data.GetDocument()
+
+        def product_fn(
+            token_path: str,
+            layer_name: str = "$userpass",
+            layer_type_name: str = "$pass",
+            file_format: int = render_data[c4d.RDATA_MULTIPASS_SAVEFORMAT],
+        ) -> lib_renderproducts.ProductSpec:
+            """Return render product for given token path and layer names.
+            """
+            return lib_renderproducts.ProductSpec(
+                token_path=self._abspath(doc, token_path),
+                layer_name=layer_name,
+                layer_type_name=layer_type_name,
+                file_format=file_format,
+            )
+
+        products: dict[str, lib_renderproducts.ProductSpec] = {}
+
+        # Regular image
+        save_image: bool = render_data[c4d.RDATA_SAVEIMAGE]
+        if save_image:
+            token_path: str = render_data[c4d.RDATA_PATH]
+            products[""] = product_fn(
+                token_path,
+                file_format=render_data[c4d.RDATA_FORMAT]
+            )
+
+        # Multi-Pass image
+        save_multipass_image: bool = render_data[c4d.RDATA_MULTIPASS_SAVEIMAGE]
+        if save_multipass_image:
+            products.update(
+                self._collect_multipass(
+                    render_data,
+                    product_fn
+                )
+            )
+
+        return lib_renderproducts.ProductGraph(
+            products=products,
+            name_format=render_data[c4d.RDATA_NAMEFORMAT],
+        )
 
     def _collect_multipass(
         self,
         render_data,
-        files_resolver
-    ) -> dict[str, list[str]]:
+        product_fn
+    ) -> dict[str, lib_renderproducts.ProductSpec]:
         multipass_token_path: str = render_data[c4d.RDATA_MULTIPASS_FILENAME]
         self.log.debug(
             f"Collected Multi-Pass Filepath: {multipass_token_path}"
@@ -311,7 +485,7 @@ class CollectCinema4DRender(
             # TODO: Check if Cryptomatte is still forced to be written out
             #   in this scenario as a separate file.
             # Single file
-            return {"": files_resolver(multipass_token_path)}
+            return {"": product_fn(multipass_token_path)}
 
         # Support Redshift AOVs
         renderer: int = render_data[c4d.RDATA_RENDERENGINE]
@@ -324,7 +498,7 @@ class CollectCinema4DRender(
             if redshift_vp:
                 return self._collect_redshift_aovs(
                     redshift_vp,
-                    files_resolver_fn=files_resolver,
+                    product_fn=product_fn,
                     multipass_token_path=multipass_token_path
                 )
 
@@ -333,11 +507,11 @@ class CollectCinema4DRender(
     def _collect_redshift_aovs(
         self,
         redshift_vp: c4d.documents.BaseVideoPost,
-        files_resolver_fn,
+        product_fn,
         multipass_token_path: str
-    ) -> dict[str, list[str]]:
-        """Collect all Redshift AOVs output filepaths by AOV name."""
-        products: dict[str, list[str]] = {}
+    ) -> dict[str, lib_renderproducts.ProductSpec]:
+        """Collect all Redshift AOVs render products by AOV name."""
+        products: dict[str, lib_renderproducts.ProductSpec] = {}
 
         # If Global AOV mode is set to disabled, collect no AOV data
         aov_disabled: int = c4d.REDSHIFT_RENDERER_AOV_GLOBAL_MODE_DISABLE
@@ -367,7 +541,7 @@ class CollectCinema4DRender(
                 #  from C4D instead of our 'copied' aovs
                 filepath = os.path.splitext(aov.file_effective_path)[0]
                 filepath = filepath.rstrip("0123456789")
-                files = files_resolver_fn(filepath)
+                product = product_fn(filepath)
             else:
                 # Make a copy because we may alter it for AOV suffix
                 multipass_token_path_aov = multipass_token_path
@@ -389,13 +563,13 @@ class CollectCinema4DRender(
 
                 # Format the filepath based on the render data's token
                 # path
-                files = files_resolver_fn(
+                product = product_fn(
                     multipass_token_path_aov,
                     layer_name=layer_name,
                     layer_type_name=aov.effective_name,
                 )
 
-            products[aov_name] = files
+            products[aov_name] = product
         return products
 
     def _abspath(self, doc, path: str) -> str:
@@ -2,7 +2,8 @@ import os
 import c4d
 
 from ayon_core.pipeline import publish
-from ayon_cinema4d.api import lib, exporters
+from ayon_cinema4d.api import lib, lib_prebake, exporters
+from ayon_cinema4d.api.lib_exportworker import ExportJob
 
 
 class ExtractAlembic(publish.Extractor):
@@ -16,8 +17,19 @@ class ExtractAlembic(publish.Extractor):
     hosts = ["cinema4d"]
     families = ["pointcache"]
 
+    settings_category = "cinema4d"
+
+    # Export from a document containing only the instance members, falls
+    # back to the full document when the members depend on other objects
+    isolate_document: bool = False
+
     def process(self, instance):
+        # Restores simulations baked by `ExtractPreBakeSimulations` after
+        # the last instance or when the extraction fails
+        with lib_prebake.extracting(instance):
+            self._extract(instance)
 
+    def _extract(self, instance):
         doc: c4d.BaseDocument = instance.context.data["doc"]
 
         # Collect the start and end including handles
@@ -38,6 +50,37 @@ class ExtractAlembic(publish.Extractor):
                 f"No valid objects found to export in members: {nodes}"
             )
 
+        options = {
+            "frame_start": start,
+            "frame_end": end,
+            "frame_step": step,
+            "global_matrix": bake_to_worldspace,
+        }
+
+        # Dispatch to the background export workers when started
+        pool = instance.context.data.get("exportWorkerPool")
+        if pool is not None:
+            job = ExportJob(
+                job_type="alembic",
+                scene_path=instance.context.data["exportWorkerSnapshot"],
+                filepath=path,
+                objects=[lib.get_object_index_path(obj) for obj in export_nodes],
+                options=dict(options, isolate=self.isolate_document),
+                document_path=doc.GetDocumentPath(),
+            )
+
+            def on_exported(result):
+                if not os.path.isfile(path):
+                    raise publish.PublishError(
+                        f"Exported Alembic not found: {path}")
+                self._add_representation(instance, dir_path, filename)
+
+            pool.submit(job, callback=on_exported)
+            self.log.info(
+                f"Dispatched instance '{instance.name}' to export workers."
+            )
+            return
+
         # Perform alembic extraction
         with lib.maintained_selection():
             lib.set_selection(doc, export_nodes)
@@ -45,16 +88,19 @@ class ExtractAlembic(publish.Extractor):
             # Export selection to camera
             exporters.extract_alembic(
                 path,
-                frame_start=start,
-                frame_end=end,
-                frame_step=step,
                 selection=True,
-                global_matrix=bake_to_worldspace,
                 doc=doc,
                 # Log the applied options to the publish logs
-                verbose=True
+                verbose=True,
+                isolate_objects=(
+                    export_nodes if self.isolate_document else None
+                ),
+                **options
             )
 
+        self._add_representation(instance, dir_path, filename)
+
+    def _add_representation(self, instance, dir_path, filename):
         representation = {
             "name": "abc",
             "ext": "abc",
@@ -63,6 +109,7 @@ class ExtractAlembic(publish.Extractor):
         }
         instance.data.setdefault("representations", []).append(representation)
 
+        path = os.path.join(dir_path, filename)
         self.log.info(f"Extracted instance '{instance.name}' to: {path}")
 
     def filter_objects(self, nodes):
@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+
+import pyblish.api
+import c4d
+
+from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import OptionalPyblishPluginMixin
+from ayon_cinema4d.api import exporters, export_worker
+from ayon_cinema4d.api.lib_exportworker import ExportWorkerPool
+
+
+class ExtractStartExportWorkers(
+    pyblish.api.ContextPlugin, OptionalPyblishPluginMixin
+):
+    """Start headless export workers for the Alembic and proxy extractors.
+
+    A snapshot of the scene is saved once and the extractors dispatch their
+    export to a pool of `c4dpy` worker processes exporting from the snapshot
+    in parallel. The results are collected by `ExtractExportWorkerResults`.
+    When the publish stops before that, the workers are cancelled at the
+    start of the next publish.
+    """
+
+    label = "Start Export Workers"
+    order = pyblish.api.ExtractorOrder - 0.3
+    hosts = ["cinema4d"]
+    families = ["pointcache", "camera", "redshiftproxy"]
+    optional = True
+    active = False
+
+    settings_category = "cinema4d"
+
+    # Worker executable, defaults to `c4dpy` of the running Cinema 4D, and
+    # parallel worker processes, zero is half the CPU count
+    executable: str = ""
+    processes: int = 0
+
+    def process(self, context: pyblish.api.Context):
+        if not self.is_active(context.data):
+            return
+
+        doc: c4d.documents.BaseDocument = context.data["doc"]
+        snapshot_dir: str = tempfile.mkdtemp(prefix="ayon_c4d_snapshot_")
+        try:
+            scene_path: str = exporters.save_document_snapshot(
+                doc, os.path.join(snapshot_dir, "snapshot.c4d")
+            )
+        except Exception:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            raise
+
+        pool: ExportWorkerPool = export_worker.create_pool(
+            executable=self.executable,
+            processes=self.processes,
+        )
+        # Removes the snapshot on shutdown, also when the publish stops
+        # before `ExtractExportWorkerResults` and the pool is shut down by
+        # the next publish
+        pool.cleanup_paths.append(snapshot_dir)
+        context.data["exportWorkerPool"] = pool
+        context.data["exportWorkerSnapshot"] = scene_path
+        self.log.info(
+            f"Started {pool.processes} export workers for: {scene_path}"
+        )
+
+
+class ExtractExportWorkerResults(pyblish.api.ContextPlugin):
+    """Wait for the export workers and add the exported representations."""
+
+    label = "Export Worker Results"
+    order = pyblish.api.ExtractorOrder + 0.45
+    hosts = ["cinema4d"]
+    families = ["pointcache", "camera", "redshiftproxy"]
+
+    def process(self, context: pyblish.api.Context):
+        pool: ExportWorkerPool = context.data.pop("exportWorkerPool", None)
+        if pool is None:
+            return
+
+        failed: list[str] = []
+        try:
+            for job, result in pool.iter_results():
+                if result.succeeded:
+                    self.log.info(
+                        f"Exported {job} in {result.duration:.2f}s"
+                    )
+                else:
+                    self.log.error(f"Export of {job} failed:\n{result.message}")
+                    failed.append(str(job))
+        finally:
+            # Also removes the snapshot directory
+            pool.shutdown()
+            context.data.pop("exportWorkerSnapshot", None)
+
+        if failed:
+            raise publish.PublishError(
+                "Export workers failed for: " + ", ".join(failed)
+            )
@@ -0,0 +1,148 @@
+import os
+from collections import defaultdict
+
+import pyblish.api
+
+from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import OptionalPyblishPluginMixin
+from ayon_cinema4d.api import lib
+from ayon_cinema4d.api.lib_frames import FrameRangeSet
+from ayon_cinema4d.api.lib_localrender import (
+    LocalRenderScheduler,
+    RenderChunk,
+    RenderJob,
+)
+from ayon_cinema4d.api.lib_renderwatch import AOVStatus, RenderOutputWatcher
+
+
+class ExtractLocalRender(
+    pyblish.api.ContextPlugin, OptionalPyblishPluginMixin
+):
+    """Render the render instances locally instead of on the farm.
+
+    The frames of all takes are split into chunks that are rendered in
+    parallel with the Cinema 4D command line renderer. Failed chunks, or
+    chunks with missing output files, are rendered again. The rendered files
+    are published as representations of the render instances.
+    """
+
+    label = "Render Locally"
+    order = pyblish.api.ExtractorOrder - 0.1
+    hosts = ["cinema4d"]
+    families = ["render"]
+    optional = True
+    active = False
+
+    settings_category = "cinema4d"
+
+    # Parallel render processes and threads per process, zero is automatic
+    processes: int = 0
+    threads: int = 0
+    chunk_size: int = 10
+    retries: int = 2
+    # Seconds in between checks of the render output while rendering
+    watch_interval: float = 10.0
+
+    def process(self, context: pyblish.api.Context):
+        if not self.is_active(context.data):
+            return
+
+        instances = [
+            instance for instance in context
+            if instance.data.get("publish", True)
+            and instance.data.get("active", True)
+            and (
+                instance.data.get("productBaseType")
+                or instance.data.get("productType")
+            ) == "render"
+            and instance.data.get("expectedFiles")
+        ]
+        if not instances:
+            return
+
+        scene_path: str = context.data["currentFile"]
+        jobs: dict[str, RenderJob] = {}
+        for instance in instances:
+            frames = FrameRangeSet.parse(instance.data["frameList"])
+            expected_files: dict[int, list[str]] = defaultdict(list)
+            for files in instance.data["expectedFiles"][0].values():
+                for frame, path in zip(frames, files):
+                    expected_files[frame].append(path)
+
+            jobs[instance.id] = RenderJob(
+                scene_path=scene_path,
+                take=instance.data["takeName"],
+                frames=frames,
+                expected_files=dict(expected_files),
+            )
+
+        scheduler = LocalRenderScheduler(
+            executable=lib.get_commandline_executable(),
+            processes=self.processes,
+            threads=self.threads,
+            chunk_size=self.chunk_size,
+            retries=self.retries,
+            progress_callback=self._on_progress,
+            # Check the render output of each instance while rendering
+            watchers={
+                instance.name: RenderOutputWatcher.from_instance_data(
+                    instance.data)
+                for instance in instances
+            },
+            watch_interval=self.watch_interval,
+            watch_callback=self._on_output_status,
+        )
+        chunks: list[RenderChunk] = scheduler.render(list(jobs.values()))
+
+        # Report the render output per AOV from the final check
+        for name, watcher in scheduler.watchers.items():
+            for aov_status in watcher.get_status().values():
+                self.log.info(f"{name} - {aov_status}")
+
+        failed = [chunk for chunk in chunks if not chunk.succeeded]
+        if failed:
+            raise publish.PublishError(
+                "Local render failed for: "
+                + ", ".join(str(chunk) for chunk in failed)
+            )
+
+        for instance in instances:
+            self._add_representations(instance)
+
+    def _on_progress(self, chunk: RenderChunk, frame: int):
+        self.log.debug(
+            f"Rendered frame {frame} of {chunk} "
+            f"({len(chunk.rendered_frames)}/{len(chunk.frames)})"
+        )
+
+    def _on_output_status(self, name: str, status: dict[str, AOVStatus]):
+        self.log.debug(
+            f"Render output of {name}: "
+            + ", ".join(str(aov_status) for aov_status in status.values())
+        )
+
+    def _add_representations(self, instance: pyblish.api.Instance):
+        """Publish the rendered files instead of submitting to the farm."""
+        instance.data["farm"] = False
+        families: list[str] = instance.data.get("families", [])
+        if "render.farm" in families:
+            families.remove("render.farm")
+
+        representations: list[dict] = instance.data.setdefault(
+            "representations", [])
+        for aov_name, files in instance.data["expectedFiles"][0].items():
+            ext: str = os.path.splitext(files[0])[1].lstrip(".")
+            filenames = [os.path.basename(path) for path in files]
+            representations.append({
+                # Beauty is published under its extension
+                "name": aov_name or ext,
+                "ext": ext,
+                "files": filenames if len(filenames) > 1 else filenames[0],
+                "stagingDir": os.path.dirname(files[0]),
+                "frameStart": instance.data["frameStartHandle"],
+                "frameEnd": instance.data["frameEndHandle"],
+            })
+        self.log.info(
+            f"Rendered instance '{instance.name}' locally to: "
+            f"{instance.data['outputDir']}"
+        )
@@ -0,0 +1,92 @@
+import pyblish.api
+import c4d
+
+from ayon_core.pipeline.publish import OptionalPyblishPluginMixin
+from ayon_cinema4d.api import lib_prebake
+
+
+class ExtractPreBakeSimulations(
+    pyblish.api.ContextPlugin, OptionalPyblishPluginMixin
+):
+    """Bake the simulation cache tags once for all extractors.
+
+    The cache tags of the instance members are baked over the union of the
+    frame ranges of the instances, so that the Alembic and Redshift Proxy
+    extractors play back the cached simulation instead of each simulating
+    dynamics and MoGraph again. The tags are restored by the extractors
+    after the last instance is extracted or when an extraction fails.
+    """
+
+    label = "Pre-bake Simulations"
+    order = pyblish.api.ExtractorOrder - 0.4
+    hosts = ["cinema4d"]
+    families = ["pointcache", "camera", "redshiftproxy"]
+    optional = True
+    active = False
+
+    settings_category = "cinema4d"
+
+    def process(self, context: pyblish.api.Context):
+        if not self.is_active(context.data):
+            return
+
+        instances = [
+            instance for instance in context
+            if instance.data.get("publish", True)
+            and instance.data.get("active", True)
+            and (
+                instance.data.get("productBaseType")
+                or instance.data.get("productType")
+            ) in self.families
+            and "frameStartHandle" in instance.data
+        ]
+        if not instances:
+            return
+
+        # Union frame range of all instances
+        frame_start = int(min(
+            instance.data["frameStartHandle"] for instance in instances
+        ))
+        frame_end = int(max(
+            instance.data["frameEndHandle"] for instance in instances
+        ))
+
+        objects: list[c4d.BaseObject] = []
+        for instance in instances:
+            objects.extend(instance[:])
+        tags = list(lib_prebake.iter_cache_tags(objects))
+        if not tags:
+            self.log.debug("No simulation cache tags to bake.")
+            return
+
+        doc: c4d.documents.BaseDocument = context.data["doc"]
+        self.log.info(
+            f"Baking {len(tags)} cache tags up to frame {frame_end} for "
+            f"frame range {frame_start}-{frame_end}."
+        )
+        baked = lib_prebake.bake_cache_tags(doc, tags, frame_start, frame_end)
+
+        # The extractors restore the tags after the last instance, or as
+        # soon as one of them fails
+        context.data["preBake"] = lib_prebake.PreBake(
+            baked, [instance.id for instance in instances]
+        )
+
+
+class ExtractRestorePreBakedSimulations(pyblish.api.ContextPlugin):
+    """Restore cache tags baked by `ExtractPreBakeSimulations`.
+
+    The extractors restore the tags after the last instance is extracted.
+    This restores them when no extractor ran for some of the instances.
+    """
+
+    label = "Restore Pre-baked Simulations"
+    order = pyblish.api.ExtractorOrder + 0.49
+    hosts = ["cinema4d"]
+    families = ["pointcache", "camera", "redshiftproxy"]
+
+    def process(self, context: pyblish.api.Context):
+        context.data.pop("preBake", None)
+        restored = lib_prebake.restore_pending_prebakes()
+        if restored:
+            self.log.debug("Restored baked cache tags.")
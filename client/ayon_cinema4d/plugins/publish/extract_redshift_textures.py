@@ -0,0 +1,104 @@
+import pyblish.api
+import c4d
+
+from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import OptionalPyblishPluginMixin
+from ayon_cinema4d.api import lib, lib_renderproducts, lib_textures
+
+
+class ExtractRedshiftTextures(
+    pyblish.api.ContextPlugin, OptionalPyblishPluginMixin
+):
+    """Convert the textures of the scene to Redshift `.rstexbin` files.
+
+    Render nodes otherwise each convert the same textures on first use.
+    The textures are converted once, in parallel, before the render
+    submission. Textures with an up-to-date converted file are skipped.
+
+    The converted files are stored per render instance in the
+    `redshiftTextures` data for the submission.
+    """
+
+    label = "Pre-process Redshift Textures"
+    order = pyblish.api.ExtractorOrder - 0.2
+    hosts = ["cinema4d"]
+    families = ["render"]
+    optional = True
+    active = False
+
+    settings_category = "cinema4d"
+
+    # Texture processor executable, found from the Redshift environment if
+    # not set and parallel processes, zero is the CPU count
+    executable: str = ""
+    workers: int = 0
+
+    def process(self, context: pyblish.api.Context):
+        if not self.is_active(context.data):
+            return
+
+        instances = [
+            instance for instance in context
+            if instance.data.get("publish", True)
+            and instance.data.get("active", True)
+            and (
+                instance.data.get("productBaseType")
+                or instance.data.get("productType")
+            ) == "render"
+            and self._is_redshift(instance.data.get("renderData"))
+        ]
+        if not instances:
+            self.log.debug("No Redshift render instances.")
+            return
+
+        executable = (
+            self.executable or lib_textures.find_texture_processor()
+        )
+        if not executable:
+            raise publish.PublishError(
+                "Redshift texture processor executable not found."
+            )
+
+        doc: c4d.documents.BaseDocument = context.data["doc"]
+        texture_paths: list[str] = lib.get_texture_paths(doc)
+        processor = lib_textures.TextureProcessor(
+            executable=executable,
+            workers=self.workers,
+        )
+        results = processor.process(texture_paths)
+
+        for result in results:
+            if result.status == "missing":
+                self.log.warning(f"Texture not found: {result.source}")
+            elif result.status == "failed":
+                self.log.error(
+                    f"Failed to convert texture: {result.source}\n"
+                    f"{result.message}"
+                )
+
+        failed = [result for result in results if result.status == "failed"]
+        if failed:
+            raise publish.PublishError(
+                f"Failed to convert {len(failed)} textures for Redshift."
+            )
+
+        converted = sum(1 for result in results if result.status == "converted")
+        self.log.info(
+            f"Converted {converted} textures, "
+            f"{len(results) - converted} up-to-date or missing."
+        )
+
+        outputs: list[str] = [
+            result.output for result in results if result.succeeded
+        ]
+        for instance in instances:
+            instance.data["redshiftTextures"] = list(outputs)
+
+    @staticmethod
+    def _is_redshift(render_data) -> bool:
+        if render_data is None:
+            return False
+        return (
+            render_data[c4d.RDATA_RENDERENGINE]
+            == lib_renderproducts.REDSHIFT_RENDER_ENGINE_ID
+        )
@@ -1,8 +1,17 @@
 import os
+import shutil
+import tempfile
 import c4d
 
 from ayon_core.pipeline import publish
-from ayon_cinema4d.api import lib, exporters
+from ayon_cinema4d.api import (
+    lib,
+    lib_frames,
+    lib_prebake,
+    exporters,
+    export_worker,
+)
+from ayon_cinema4d.api.lib_exportworker import ExportJob, ExportWorkerPool
 
 
 class ExtractRedshiftProxy(publish.Extractor):
@@ -12,8 +21,23 @@ class ExtractRedshiftProxy(publish.Extractor):
     hosts = ["cinema4d"]
     families = ["redshiftproxy"]
 
+    settings_category = "cinema4d"
+
+    # Export from a document containing only the instance members, falls
+    # back to the full document when the members depend on other objects
+    isolate_document: bool = False
+
+    # Split the frame range into this many shards that are exported in
+    # parallel by export workers from a snapshot of the scene
+    shards: int = 1
+
     def process(self, instance):
+        # Restores simulations baked by `ExtractPreBakeSimulations` after
+        # the last instance or when the extraction fails
+        with lib_prebake.extracting(instance):
+            self._extract(instance)
 
+    def _extract(self, instance):
         doc: c4d.BaseDocument = instance.context.data["doc"]
 
         # Collect the start and end including handles
@@ -34,6 +58,45 @@ class ExtractRedshiftProxy(publish.Extractor):
         #  frame end because redshift export fails if the frame range is
         #  outside of the current document's timeline range.
 
+        options = {
+            "frame_start": start,
+            "frame_end": end,
+            "frame_step": step,
+        }
+
+        shards = lib_frames.split_frame_range(start, end, step, self.shards)
+        if len(shards) > 1:
+            # Shards start evaluating the document at their first frame so
+            # simulations must be baked to export the same geometry
+            unbaked = lib_prebake.get_unbaked_cache_tags(instance)
+            if unbaked:
+                self.log.info(
+                    "Exporting in a single shard because simulation cache "
+                    "tags are not pre-baked: " + ", ".join(
+                        tag.GetObject().GetName() for tag in unbaked
+                    )
+                )
+                shards = lib_frames.split_frame_range(start, end, step, 1)
+
+        # Dispatch to the background export workers when started
+        pool = instance.context.data.get("exportWorkerPool")
+        if pool is not None:
+            self._submit_jobs(
+                pool,
+                instance.context.data["exportWorkerSnapshot"],
+                instance, path, export_nodes, options, shards,
+            )
+            self.log.info(
+                f"Dispatched instance '{instance.name}' to export workers "
+                f"in {len(shards)} shards."
+            )
+            return
+
+        # Export the shards with a pool of export workers for this instance
+        if len(shards) > 1:
+            self._export_shards(instance, path, export_nodes, options, shards)
+            return
+
         # Perform alembic extraction
         with lib.maintained_selection():
             lib.set_selection(doc, export_nodes)
@@ -41,31 +104,142 @@ class ExtractRedshiftProxy(publish.Extractor):
             # Export selection to camera
             exporters.extract_redshiftproxy(
                 path,
-                frame_start=start,
-                frame_end=end,
-                frame_step=step,
                 selection=True,
                 doc=doc,
                 # Log the applied options to the publish logs
-                verbose=True
+                verbose=True,
+                isolate_objects=(
+                    export_nodes if self.isolate_document else None
+                ),
+                **options
             )
 
+        self._add_representation(
+            instance, dir_path, filename, start, end, step)
+
+    def _export_shards(self, instance, path, export_nodes, options, shards):
+        doc: c4d.BaseDocument = instance.context.data["doc"]
+        snapshot_dir: str = tempfile.mkdtemp(prefix="ayon_c4d_snapshot_")
+        try:
+            scene_path: str = exporters.save_document_snapshot(
+                doc, os.path.join(snapshot_dir, "snapshot.c4d")
+            )
+            with export_worker.create_pool(processes=len(shards)) as pool:
+                self._submit_jobs(
+                    pool, scene_path, instance, path, export_nodes, options,
+                    shards,
+                )
+                failed: list[str] = []
+                for job, result in pool.iter_results():
+                    frame_range = "{frame_start}-{frame_end}".format(
+                        **job.options)
+                    if result.succeeded:
+                        self.log.debug(
+                            f"Exported frames {frame_range} in "
+                            f"{result.duration:.2f}s"
+                        )
+                    else:
+                        failed.append(f"{frame_range}: {result.message}")
+        finally:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+        if failed:
+            raise publish.PublishError(
+                f"Export of Redshift Proxy shards failed for {path}\n"
+                + "\n".join(failed)
+            )
+
+    def _submit_jobs(
+        self,
+        pool: ExportWorkerPool,
+        scene_path: str,
+        instance,
+        path: str,
+        export_nodes,
+        options: dict,
+        shards: list[tuple[int, int]],
+    ):
+        """Submit an export job per frame range shard to the pool.
+
+        The frame files of all shards are added as a single representation
+        once the last shard is exported.
+        """
+        doc: c4d.BaseDocument = instance.context.data["doc"]
+        objects = [lib.get_object_index_path(obj) for obj in export_nodes]
+        remaining: set[str] = set()
+
+        def on_shard_exported(result):
+            remaining.discard(result.job_id)
+            if not remaining:
+                self._add_representation(
+                    instance,
+                    os.path.dirname(path),
+                    os.path.basename(path),
+                    options["frame_start"],
+                    options["frame_end"],
+                    options["frame_step"],
+                )
+
+        for shard_start, shard_end in shards:
+            job = ExportJob(
+                job_type="redshiftproxy",
+                scene_path=scene_path,
+                filepath=path,
+                objects=objects,
+                options=dict(
+                    options,
+                    frame_start=shard_start,
+                    frame_end=shard_end,
+                    isolate=self.isolate_document,
+                ),
+                document_path=doc.GetDocumentPath(),
+            )
+            remaining.add(job.id)
+            pool.submit(job, callback=on_shard_exported)
+
+    def _add_representation(
+        self, instance, dir_path, filename, start, end, step
+    ):
+        path = os.path.join(dir_path, filename)
+
         # The Redshift exporter will add the frame numbers to the filepath
-        # before the extension. So we collect the resulting files.
-        frame_filepaths: "list[str]" = []
-        for frame in range(int(start), int(end) + 1):
-            head, tail = os.path.splitext(path)
-            frame_filepath = f"{head}{frame:04d}{tail}"
-            if not os.path.exists(frame_filepath):
-                raise publish.PublishError(
-                    "Expected exported Redshift Proxy frame not found: "
-                    f"{frame_filepath}")
-
-            frame_filepaths.append(frame_filepath)
+        # before the extension. So we collect the resulting files with a
+        # single scan of the staging directory.
+        head, tail = os.path.splitext(filename)
+        expected_frames = range(int(start), int(end) + 1, max(1, int(step)))
+        scanned = lib_frames.scan_frame_files(dir_path, head, tail)
+        missing: list[int] = [
+            frame for frame in expected_frames if frame not in scanned
+        ]
+        empty: list[int] = [
+            frame for frame in expected_frames
+            if frame in scanned and scanned[frame].size == 0
+        ]
+        if missing or empty:
+            errors: list[str] = []
+            if missing:
+                errors.append(
+                    "Missing frames: "
+                    f"{lib_frames.format_frame_ranges(missing)}"
+                )
+            if empty:
+                errors.append(
+                    "Zero-byte frames: "
+                    f"{lib_frames.format_frame_ranges(empty)}"
+                )
+            raise publish.PublishError(
+                "Exported Redshift Proxy frames are incomplete for "
+                f"{path}\n" + "\n".join(errors)
+            )
+
+        paddings = {scanned[frame].padding for frame in expected_frames}
+        self.log.debug(f"Detected frame padding: {paddings}")
 
         # Define the collected filename with the frame numbers
-        frame_filenames = [os.path.basename(path) for path in frame_filepaths]
-        if len(frame_filepaths) == 1:
+        frame_filenames = [
+            scanned[frame].filename for frame in expected_frames
+        ]
+        if len(frame_filenames) == 1:
             files = frame_filenames[0]
         else:
             files = frame_filenames
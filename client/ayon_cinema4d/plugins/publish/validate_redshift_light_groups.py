@@ -0,0 +1,92 @@
+import pyblish.api
+import c4d
+
+from ayon_core.pipeline.publish import (
+    OptionalPyblishPluginMixin,
+    ValidateContentsOrder,
+)
+from ayon_cinema4d.api import lib_renderproducts
+
+
+class ValidateRedshiftLightGroups(
+    pyblish.api.InstancePlugin, OptionalPyblishPluginMixin
+):
+    """Report Redshift AOV light groups that contain no lights.
+
+    Light groups listed on an AOV that no Redshift light in the scene
+    belongs to produce no light group AOV output. This only warns, once per
+    light group per publish, since Redshift may keep stale light group names
+    on the AOVs.
+    """
+
+    label = "Validate Redshift Light Groups"
+    order = ValidateContentsOrder
+    hosts = ["cinema4d"]
+    families = ["render"]
+    optional = True
+
+    settings_category = "cinema4d"
+
+    def process(self, instance: pyblish.api.Instance):
+        if not self.is_active(instance.data):
+            return
+
+        doc: c4d.documents.BaseDocument = instance.context.data["doc"]
+        take_data = doc.GetTakeData()
+        take: c4d.modules.takesystem.BaseTake = instance.data["transientData"][
+            "take"
+        ]
+        render_data, base_take = take.GetEffectiveRenderData(take_data)
+        redshift_vp = lib_renderproducts.find_video_post(
+            render_data,
+            lib_renderproducts.REDSHIFT_RENDER_ENGINE_ID
+        )
+        if redshift_vp is None:
+            return
+
+        # Redshift may not be available so we import here
+        import redshift
+
+        # Uses the cached light groups of the document so this does not
+        # traverse the scene again for each render instance
+        members = lib_renderproducts.get_redshift_light_group_members(doc)
+
+        # AOV names per light group without any lights
+        empty_light_groups: dict[str, list[str]] = {}
+        for aov in redshift.RendererGetAOVs(redshift_vp):
+            if not aov.GetParameter(c4d.REDSHIFT_AOV_ENABLED):
+                continue
+
+            if aov.GetParameter(c4d.REDSHIFT_AOV_LIGHTGROUP_ALL):
+                continue
+
+            aov_name: str = aov.GetParameter(c4d.REDSHIFT_AOV_EFFECTIVE_NAME)
+            for light_group in (
+                lib_renderproducts.get_redshift_aov_light_group_names(aov)
+            ):
+                if members.get(light_group):
+                    continue
+                aov_names = empty_light_groups.setdefault(light_group, [])
+                if aov_name not in aov_names:
+                    aov_names.append(aov_name)
+
+        # Report each light group only once per publish, render instances
+        # often share the same render settings
+        reported: set[str] = instance.context.data.setdefault(
+            "redshiftEmptyLightGroupsReported", set())
+        unreported = {
+            light_group: aov_names
+            for light_group, aov_names in empty_light_groups.items()
+            if light_group not in reported
+        }
+        if not unreported:
+            return
+
+        reported.update(unreported)
+        self.log.warning(
+            "Redshift light groups without any lights are listed on AOVs:\n"
+            + "\n".join(
+                f"- {light_group}: {', '.join(aov_names)}"
+                for light_group, aov_names in sorted(unreported.items())
+            )
+        )
@@ -21,7 +21,151 @@ class BasicEnabledStatesModel(BaseSettingsModel):
     )
 
 
+class CollectCinema4DRenderModel(BaseSettingsModel):
+    compact_expected_files: bool = SettingsField(
+        False,
+        title="Compact expected files",
+        description=(
+            "Also store the expected render files as a compact encoding per "
+            "AOV (directory, filename pattern and frame ranges) on the "
+            "render instance for farm publish metadata."
+        ),
+    )
+    use_render_products_manifest: bool = SettingsField(
+        True,
+        title="Use render products manifest cache",
+        description=(
+            "Store the collected render products per take in a local "
+            "cache keyed by a checksum of the render settings, takes and "
+            "document path. Publishing an unchanged scene again reuses "
+            "them instead of resolving all render products."
+        ),
+    )
+    estimate_output_size: bool = SettingsField(
+        True,
+        title="Estimate output size",
+        description=(
+            "Estimate the disk size of the render outputs from frames, "
+            "AOVs, resolution, bit depth and file format compression. The "
+            "estimate is stored on the render instance and a warning is "
+            "logged when it exceeds the free space of the output volume."
+        ),
+    )
+    calibrate_output_size: bool = SettingsField(
+        True,
+        title="Calibrate output size from disk",
+        description=(
+            "Use the size of previously rendered files on disk for the "
+            "output size estimate when they exist."
+        ),
+    )
+
+
+class ExtractLocalRenderModel(BaseSettingsModel):
+    enabled: bool = SettingsField(True, title="Enabled")
+    optional: bool = SettingsField(True, title="Optional")
+    active: bool = SettingsField(False, title="Active")
+    processes: int = SettingsField(
+        0,
+        ge=0,
+        title="Render processes",
+        description=(
+            "Number of parallel command line render processes. "
+            "Use 0 for one process per four CPU cores."
+        ),
+    )
+    threads: int = SettingsField(
+        0,
+        ge=0,
+        title="Threads per process",
+        description=(
+            "Render threads per process. Use 0 to divide the CPU cores "
+            "over the render processes."
+        ),
+    )
+    chunk_size: int = SettingsField(
+        10,
+        ge=1,
+        title="Frames per chunk",
+    )
+    retries: int = SettingsField(
+        2,
+        ge=0,
+        title="Retries",
+        description="How often a failed chunk of frames is rendered again.",
+    )
+
+
+class ExtractRedshiftTexturesModel(BaseSettingsModel):
+    enabled: bool = SettingsField(True, title="Enabled")
+    optional: bool = SettingsField(True, title="Optional")
+    active: bool = SettingsField(False, title="Active")
+    executable: str = SettingsField(
+        "",
+        title="Texture processor executable",
+        description=(
+            "Path to 'redshiftTextureProcessor'. When empty it is searched "
+            "for in the Redshift core data path."
+        ),
+    )
+    workers: int = SettingsField(
+        0,
+        ge=0,
+        title="Parallel processes",
+        description="Use 0 for one process per CPU core.",
+    )
+
+
+class ExtractStartExportWorkersModel(BaseSettingsModel):
+    enabled: bool = SettingsField(True, title="Enabled")
+    optional: bool = SettingsField(True, title="Optional")
+    active: bool = SettingsField(False, title="Active")
+    executable: str = SettingsField(
+        "",
+        title="Worker executable",
+        description=(
+            "Path to the 'c4dpy' executable for the export workers. When "
+            "empty the 'c4dpy' of the running Cinema 4D is used."
+        ),
+    )
+    processes: int = SettingsField(
+        0,
+        ge=0,
+        title="Worker processes",
+        description="Use 0 for half the number of CPU cores.",
+    )
+
+
+class ExtractIsolatedDocumentModel(BaseSettingsModel):
+    isolate_document: bool = SettingsField(
+        False,
+        title="Export from isolated document",
+        description=(
+            "Export only the instance members from a new document instead "
+            "of the full scene. Falls back to the full scene when the "
+            "members depend on other objects, e.g. through expressions."
+        ),
+    )
+
+
+class ExtractRedshiftProxyModel(ExtractIsolatedDocumentModel):
+    shards: int = SettingsField(
+        1,
+        ge=1,
+        title="Frame range shards",
+        description=(
+            "Split the frame range into this many shards that are exported "
+            "in parallel by headless 'c4dpy' processes."
+        ),
+    )
+
+
 class PublishPluginsModel(BaseSettingsModel):
+    CollectCinema4DRender: CollectCinema4DRenderModel = SettingsField(
+        default_factory=CollectCinema4DRenderModel,
+        title="Collect Render",
+    )
+
     # Frame range and resolution validators
     ValidateFrameRange: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
@@ -37,9 +181,65 @@ class PublishPluginsModel(BaseSettingsModel):
             "Validate publish resolution matches AYON task entity."
         )
     )
+    ExtractRedshiftTextures: ExtractRedshiftTexturesModel = SettingsField(
+        default_factory=ExtractRedshiftTexturesModel,
+        title="Pre-process Redshift Textures",
+        description=(
+            "Convert the scene textures to Redshift '.rstexbin' files once "
+            "before render submission."
+        )
+    )
+    ExtractLocalRender: ExtractLocalRenderModel = SettingsField(
+        default_factory=ExtractLocalRenderModel,
+        title="Render Locally",
+        description=(
+            "Render the render instances locally with parallel Cinema 4D "
+            "command line render processes instead of on the farm."
+        )
+    )
+    ExtractPreBakeSimulations: BasicEnabledStatesModel = SettingsField(
+        default_factory=BasicEnabledStatesModel,
+        title="Pre-bake Simulations",
+        description=(
+            "Bake the simulation cache tags of the Alembic and Redshift "
+            "Proxy instances once over their union frame range before "
+            "extraction."
+        )
+    )
+    ExtractStartExportWorkers: ExtractStartExportWorkersModel = (
+        SettingsField(
+            default_factory=ExtractStartExportWorkersModel,
+            title="Start Export Workers",
+            description=(
+                "Export Alembic and Redshift Proxy instances in parallel "
+                "with headless 'c4dpy' processes from a scene snapshot."
+            )
+        )
+    )
+    ExtractAlembic: ExtractIsolatedDocumentModel = SettingsField(
+        default_factory=ExtractIsolatedDocumentModel,
+        title="Extract Alembic",
+    )
+    ExtractRedshiftProxy: ExtractRedshiftProxyModel = SettingsField(
+        default_factory=ExtractRedshiftProxyModel,
+        title="Extract Redshift Proxy",
+    )
+    ValidateRedshiftLightGroups: BasicEnabledStatesModel = SettingsField(
+        default_factory=BasicEnabledStatesModel,
+        title="Validate Redshift Light Groups",
+        description=(
+            "Report Redshift AOV light groups that contain no lights."
+        )
+    )
 
 
 DEFAULT_PUBLISH_SETTINGS = {
+    "CollectCinema4DRender": {
+        "compact_expected_files": False,
+        "use_render_products_manifest": True,
+        "estimate_output_size": True,
+        "calibrate_output_size": True,
+    },
     "ValidateFrameRange": {
         "enabled": True,
         "optional": True,
@@ -50,4 +250,44 @@ DEFAULT_PUBLISH_SETTINGS = {
         "optional": True,
         "active": True,
     },
+    "ValidateRedshiftLightGroups": {
+        "enabled": True,
+        "optional": True,
+        "active": True,
+    },
+    "ExtractLocalRender": {
+        "enabled": True,
+        "optional": True,
+        "active": False,
+        "processes": 0,
+        "threads": 0,
+        "chunk_size": 10,
+        "retries": 2,
+    },
+    "ExtractRedshiftTextures": {
+        "enabled": True,
+        "optional": True,
+        "active": False,
+        "executable": "",
+        "workers": 0,
+    },
+    "ExtractAlembic": {
+        "isolate_document": False,
+    },
+    "ExtractRedshiftProxy": {
+        "isolate_document": False,
+        "shards": 1,
+    },
+    "ExtractStartExportWorkers": {
+        "enabled": True,
+        "optional": True,
+        "active": False,
+        "executable": "",
+        "processes": 0,
+    },
+    "ExtractPreBakeSimulations": {
+        "enabled": True,
+        "optional": True,
+        "active": False,
+    },
 }
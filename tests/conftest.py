@@ -0,0 +1,23 @@
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+CLIENT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "client")
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+
+@pytest.fixture
+def make_stub(tmp_path):
+    """Return a function writing an executable Python stub script."""
+
+    def _make_stub(name, code):
+        path = tmp_path / name
+        path.write_text(f"#!{sys.executable}\n{textwrap.dedent(code)}")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+        return str(path)
+
+    return _make_stub
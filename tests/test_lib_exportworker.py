@@ -0,0 +1,85 @@
+"""Tests for the export worker pool with a stub worker script."""
+import os
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api import lib_exportworker  # noqa: E402
+from ayon_cinema4d.api.lib_exportworker import (  # noqa: E402
+    ExportJob,
+    ExportWorkerPool,
+)
+
+# Reports a succeeded result after sleeping `options["sleep"]` seconds
+STUB_WORKER = """
+import json
+import sys
+import time
+
+from ayon_cinema4d.api.lib_exportworker import ExportResult, format_result
+
+with open(sys.argv[1]) as f:
+    job = json.load(f)["job"]
+time.sleep(job["options"].get("sleep", 0))
+print(format_result(ExportResult(job_id=job["id"], succeeded=True)))
+"""
+
+
+def make_pool(tmp_path, make_stub, **kwargs):
+    return ExportWorkerPool(
+        executable=sys.executable,
+        script=make_stub("worker.py", STUB_WORKER),
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        **kwargs
+    )
+
+
+def make_job(tmp_path, sleep=0):
+    return ExportJob(
+        job_type="alembic",
+        scene_path=str(tmp_path / "snapshot.c4d"),
+        filepath=str(tmp_path / "out.abc"),
+        options={"sleep": sleep},
+    )
+
+
+def test_iter_results(tmp_path, make_stub):
+    exported = []
+    with make_pool(tmp_path, make_stub, processes=2) as pool:
+        for _ in range(3):
+            pool.submit(make_job(tmp_path), callback=exported.append)
+        results = [result for _, result in pool.iter_results()]
+
+    assert len(results) == 3
+    assert all(result.succeeded for result in results)
+    assert len(exported) == 3
+    assert pool not in lib_exportworker._active_pools
+
+
+def test_shutdown_after_failed_publish(tmp_path, make_stub):
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_dir.mkdir()
+    pool = make_pool(
+        tmp_path, make_stub, processes=1, cleanup_paths=[str(snapshot_dir)])
+    running = pool.submit(make_job(tmp_path, sleep=60))
+    queued = pool.submit(make_job(tmp_path, sleep=60))
+
+    # Wait for the first worker to start
+    deadline = time.time() + 10
+    while not pool._processes and time.time() < deadline:
+        time.sleep(0.05)
+
+    # The publish stopped before the results were collected so the next
+    # publish shuts down the pool
+    start = time.perf_counter()
+    assert lib_exportworker.shutdown_active_pools() == 1
+    assert time.perf_counter() - start < 30
+
+    assert not running.result().succeeded
+    assert queued.cancelled()
+    assert not snapshot_dir.exists()
+    assert not os.path.exists(pool._job_dir)
+    assert lib_exportworker.shutdown_active_pools() == 0
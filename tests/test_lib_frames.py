@@ -0,0 +1,149 @@
+"""Tests for the frame sequence helpers."""
+import os
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api import lib_frames  # noqa: E402
+from ayon_cinema4d.api.lib_frames import (  # noqa: E402
+    FrameRangeSet,
+    FrameSequence,
+)
+
+
+@pytest.mark.parametrize("frames, expected", [
+    ([], []),
+    ([5], [(5, 5, 1)]),
+    ([1, 2, 3, 5, 7, 9, 20], [(1, 3, 1), (5, 9, 2), (20, 20, 1)]),
+    # Reversed and duplicate input
+    ([9, 7, 5, 5, 3, 2, 1], [(1, 3, 1), (5, 9, 2)]),
+    # Two frames far apart are single frames
+    ([1, 10], [(1, 1, 1), (10, 10, 1)]),
+    ([-2, -1, 0, 1], [(-2, 1, 1)]),
+])
+def test_frames_to_ranges(frames, expected):
+    assert lib_frames.frames_to_ranges(frames) == expected
+
+
+@pytest.mark.parametrize("frames", [
+    [1001],
+    list(range(1001, 1101)),
+    list(range(1001, 1101, 4)) + [1200, 1201, 1500],
+    [-10, -5, 0, 5, 10, 11],
+])
+def test_frame_list_round_trip(frames):
+    frame_list = lib_frames.format_frame_ranges(frames)
+    assert lib_frames.parse_frame_ranges(frame_list) == frames
+    assert list(FrameRangeSet.parse(frame_list)) == frames
+
+
+def test_frame_range_set():
+    frames = FrameRangeSet.from_range(1001, 1010, 3)
+    assert frames.ranges == ((1001, 1010, 3),)
+    assert len(frames) == 4
+    assert 1004 in frames
+    assert 1005 not in frames
+    assert frames.as_range() == range(1001, 1011, 3)
+
+    union = frames.union(FrameRangeSet.from_range(1020, 1020))
+    assert str(union) == "1001-1010x3,1020"
+    assert union.as_range() is None
+    assert (union.first, union.last) == (1001, 1020)
+
+    assert not FrameRangeSet()
+    assert FrameRangeSet().as_range() == range(0)
+
+
+def test_frame_sequence_holes():
+    frames = FrameRangeSet.from_frames([1, 2, 3, 6, 7])
+    sequence = FrameSequence.from_range_set("/out/beauty.", 4, ".exr", frames)
+    assert sequence.holes == frozenset({4, 5})
+    assert list(sequence.frames()) == [1, 2, 3, 6, 7]
+    assert len(sequence) == 5
+    assert sequence.to_list()[-1] == "/out/beauty.0007.exr"
+    assert "(holes: 4, 5)" in str(sequence)
+    assert sequence.to_frame_list() == "1-3x1,6-7x1"
+
+    stepped = FrameSequence.from_range_set(
+        "/out/beauty.", 4, ".exr", FrameRangeSet.from_range(1, 9, 2))
+    assert not stepped.holes
+    assert stepped.step == 2
+    assert len(stepped) == 5
+    assert stepped.to_frame_list() == "1-9x2"
+
+
+@pytest.mark.parametrize("padding, frames", [
+    (4, [1001, 1002, 1003, 1010]),
+    (1, [1, 10, 100]),
+    (6, [-3, -2, -1, 0, 1]),
+])
+def test_compact_files_round_trip(padding, frames):
+    head = os.path.join("render", "shot_%v", "beauty.")
+    sequence = FrameSequence.from_range_set(
+        head, padding, ".exr", FrameRangeSet.from_frames(frames))
+    products = {
+        "": sequence,
+        "list": ["/render/a.exr", "/render/b.exr"],
+        "mixed": ["/render/a.exr", "/other/b.exr"],
+    }
+    encoded = lib_frames.encode_compact_files(products)
+    assert encoded[""]["pattern"] == f"beauty.%0{padding}d.exr"
+    assert encoded["list"] == {
+        "directory": "/render", "files": ["a.exr", "b.exr"]}
+    assert encoded["mixed"]["directory"] == ""
+
+    decoded = lib_frames.decode_compact_files(encoded)
+    assert decoded[""] == sequence.to_list()
+    assert decoded["list"] == products["list"]
+    assert decoded["mixed"] == products["mixed"]
+
+
+def test_compact_files_keep_windows_separator():
+    encoded = {"": {
+        "directory": "C:\\render\\",
+        "pattern": "beauty.%04d.exr",
+        "frames": "1-2x1",
+    }}
+    assert lib_frames.decode_compact_files(encoded)[""] == [
+        "C:\\render\\beauty.0001.exr",
+        "C:\\render\\beauty.0002.exr",
+    ]
+
+
+def test_large_sequence_stays_compact():
+    # A long sequence with many AOVs is described without its file paths
+    frames = FrameRangeSet.from_range(1, 1_000_000)
+    products = {
+        f"aov{index}": FrameSequence.from_range_set(
+            f"/render/aov{index}.", 7, ".exr", frames)
+        for index in range(100)
+    }
+    assert all(len(files) == 1_000_000 for files in products.values())
+    encoded = lib_frames.encode_compact_files(products)
+    assert encoded["aov99"] == {
+        "directory": "/render",
+        "pattern": "aov99.%07d.exr",
+        "frames": "1-1000000x1",
+    }
+
+
+def test_split_frame_range():
+    assert lib_frames.split_frame_range(1001, 1010, 1, 3) == [
+        (1001, 1004), (1005, 1007), (1008, 1010)]
+    assert lib_frames.split_frame_range(1, 9, 2, 2) == [(1, 5), (7, 9)]
+    # No more shards than frames
+    assert lib_frames.split_frame_range(1, 2, 1, 8) == [(1, 1), (2, 2)]
+
+
+def test_scan_frame_files(tmp_path):
+    for name in ("beauty.0001.exr", "beauty.0002.exr", "beauty.10.exr",
+                 "other.0001.exr", "beauty.0001.exr.tmp"):
+        (tmp_path / name).write_text("exr")
+    (tmp_path / "beauty.0003.exr").write_text("")
+
+    scanned = lib_frames.scan_frame_files(str(tmp_path), "beauty.", ".exr")
+    assert sorted(scanned) == [1, 2, 3, 10]
+    assert scanned[3].size == 0
+    assert scanned[10].padding == 2
+    assert scanned[1].filename == "beauty.0001.exr"
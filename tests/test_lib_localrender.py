@@ -0,0 +1,130 @@
+"""Tests for the local render scheduler with a stub render executable."""
+import os
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api.lib_frames import FrameRangeSet  # noqa: E402
+from ayon_cinema4d.api.lib_localrender import (  # noqa: E402
+    LocalRenderScheduler,
+    RenderJob,
+    split_frames,
+)
+from ayon_cinema4d.api.lib_renderwatch import RenderOutputWatcher  # noqa: E402
+
+# Renders the frames of the `-frame start,end,step` argument into the
+# `STUB_OUT` directory. The chunk starting at `STUB_FAIL_FRAME` fails once.
+STUB_RENDER = """
+import os
+import sys
+
+args = sys.argv[1:]
+start, end, step = map(int, args[args.index("-frame") + 1].split(","))
+output_dir = os.environ["STUB_OUT"]
+marker = os.path.join(output_dir, f"failed_{start}")
+for frame in range(start, end + 1, step):
+    print(f"Rendering frame {frame} at 00:00:01", flush=True)
+    if (
+        str(start) == os.environ.get("STUB_FAIL_FRAME")
+        and not os.path.exists(marker)
+    ):
+        open(marker, "w").close()
+        sys.exit(3)
+    with open(os.path.join(output_dir, f"beauty.{frame:04d}.exr"), "w") as f:
+        f.write("exr")
+"""
+
+
+def make_job(output_dir, frames):
+    return RenderJob(
+        scene_path="scene.c4d",
+        take="Main",
+        frames=frames,
+        expected_files={
+            frame: [os.path.join(output_dir, f"beauty.{frame:04d}.exr")]
+            for frame in frames
+        },
+    )
+
+
+def test_split_frames():
+    job = make_job("", FrameRangeSet.from_range(1001, 1025))
+    chunks = split_frames(job, chunk_size=10)
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [
+        (1001, 1010), (1011, 1020), (1021, 1025)
+    ]
+
+
+def test_render_with_retry(tmp_path, make_stub):
+    output_dir = tmp_path / "render"
+    output_dir.mkdir()
+    executable = make_stub("stub_render", STUB_RENDER)
+    env = dict(
+        os.environ, STUB_OUT=str(output_dir), STUB_FAIL_FRAME="1011")
+
+    progress = []
+    scheduler = LocalRenderScheduler(
+        executable=executable,
+        processes=3,
+        chunk_size=10,
+        retries=1,
+        env=env,
+        progress_callback=lambda chunk, frame: progress.append(frame),
+    )
+    job = make_job(str(output_dir), FrameRangeSet.from_range(1001, 1030))
+    chunks = scheduler.render([job])
+
+    assert all(chunk.succeeded for chunk in chunks)
+    assert [chunk.attempts for chunk in chunks] == [1, 2, 1]
+    assert set(progress) == set(range(1001, 1031))
+    for files in job.expected_files.values():
+        assert all(os.path.isfile(path) for path in files)
+
+
+def test_render_reports_missing_files(tmp_path, make_stub):
+    output_dir = tmp_path / "render"
+    output_dir.mkdir()
+    # Exits successfully without writing any files
+    executable = make_stub("stub_render", "print('Rendering frame 1 at 0')\n")
+    scheduler = LocalRenderScheduler(
+        executable=executable, processes=1, chunk_size=5, retries=0)
+    chunks = scheduler.render(
+        [make_job(str(output_dir), FrameRangeSet.from_range(1, 5))])
+
+    assert len(chunks) == 1
+    assert not chunks[0].succeeded
+    assert chunks[0].returncode == 0
+    assert len(chunks[0].missing_files) == 5
+
+
+def test_render_watches_output(tmp_path, make_stub):
+    output_dir = tmp_path / "render"
+    output_dir.mkdir()
+    frames = FrameRangeSet.from_range(1, 20)
+    job = make_job(str(output_dir), frames)
+    watcher = RenderOutputWatcher(
+        {"": [files[0] for files in job.expected_files.values()]},
+        frames=frames,
+    )
+
+    statuses = []
+    scheduler = LocalRenderScheduler(
+        executable=make_stub("stub_render", STUB_RENDER),
+        processes=2,
+        chunk_size=5,
+        retries=0,
+        env=dict(os.environ, STUB_OUT=str(output_dir)),
+        watchers={"main": watcher},
+        watch_interval=0.01,
+        watch_callback=lambda name, status: statuses.append(
+            (name, status[""])),
+    )
+    scheduler.render([job])
+
+    # The output is polled once more after the render finished
+    assert statuses
+    name, last_status = statuses[-1]
+    assert name == "main"
+    assert last_status.complete
+    assert last_status.existing == 20
@@ -0,0 +1,91 @@
+"""Tests for the render product engine outside of Cinema 4D."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The addon package itself requires `ayon_core`, but not `c4d`
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api import lib_products  # noqa: E402
+from ayon_cinema4d.api.lib_frames import FrameRangeSet  # noqa: E402
+from conftest import CLIENT_DIR  # noqa: E402
+
+
+def make_snapshots(takes, aovs, frames=240):
+    name_format = lib_products.NameFormat(
+        padding=4, separator=".", extension=".exr")
+    snapshots = []
+    for take in range(takes):
+        products = []
+        for aov in range(aovs):
+            template = lib_products.FilepathTemplate(
+                parts=(
+                    f"/render/{lib_products.TAKE_PLACEHOLDER}/f",
+                    f"/aov{aov}",
+                ),
+                padding=4,
+            )
+            products.append(lib_products.ProductSnapshot(
+                name=f"aov{aov}", name_format=name_format, template=template
+            ))
+        snapshots.append(lib_products.TakeSnapshot(
+            take_name=f"take{take}",
+            frames=FrameRangeSet.from_range(1001, 1000 + frames),
+            products=products,
+        ))
+    return snapshots
+
+
+def test_import_without_c4d():
+    code = (
+        "import sys\n"
+        "import ayon_cinema4d.api.lib_products\n"
+        "assert 'c4d' not in sys.modules, 'c4d was imported'\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={"PYTHONPATH": os.pathsep.join([CLIENT_DIR, *sys.path])},
+    )
+
+
+def test_compute_products():
+    snapshot = make_snapshots(1, 2, frames=3)[0]
+    products = lib_products.compute_products(snapshot)
+    files = lib_products.compute_product_files(
+        snapshot.products[0], snapshot.take_name, snapshot.frames)
+    assert set(products) == {"aov0", "aov1"}
+    assert list(products["aov0"]) == list(files)
+    assert list(files) == [
+        f"/render/take0/f{frame}/aov0.{frame}.exr"
+        for frame in (1001, 1002, 1003)
+    ]
+
+
+def test_take_name_is_inserted_as_resolved():
+    # The snapshot holds the `$take` token value resolved by Cinema 4D, so
+    # it must not be altered again when filling in the templates
+    snapshot = make_snapshots(1, 1, frames=1)[0]
+    snapshot = lib_products.TakeSnapshot(
+        take_name="Take 01_v2.final",
+        frames=snapshot.frames,
+        products=snapshot.products,
+    )
+    products = lib_products.compute_products(snapshot)
+    assert list(products["aov0"]) == [
+        "/render/Take 01_v2.final/f1001/aov0.1001.exr"]
+
+
+def test_compute_products_batch_in_processes():
+    snapshots = make_snapshots(takes=40, aovs=10)
+    serial = lib_products.compute_products_batch(snapshots, processes=None)
+    parallel = lib_products.compute_products_batch(snapshots, processes=2)
+    assert len(parallel) == len(serial)
+    for serial_products, parallel_products in zip(serial, parallel):
+        assert {
+            name: list(files) for name, files in serial_products.items()
+        } == {
+            name: list(files) for name, files in parallel_products.items()
+        }
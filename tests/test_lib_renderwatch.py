@@ -0,0 +1,96 @@
+"""Tests for the render output watcher."""
+import os
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api.lib_renderwatch import RenderOutputWatcher  # noqa: E402
+
+
+def make_expected_files(root, aovs, frames):
+    return {
+        aov: [
+            os.path.join(root, aov or "beauty", f"{aov}.{frame:04d}.exr")
+            for frame in frames
+        ]
+        for aov in aovs
+    }
+
+
+def write(path, content=b"data"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def test_poll_reports_missing_and_empty_frames(tmp_path):
+    frames = list(range(1001, 1011))
+    expected = make_expected_files(str(tmp_path), ["", "diffuse"], frames)
+    watcher = RenderOutputWatcher(expected, frames=frames)
+
+    # Output directories do not exist yet
+    status = watcher.poll()
+    assert status[""].existing == 0
+    assert status[""].missing_frames == frames
+    assert not status[""].complete
+
+    for path in expected[""]:
+        write(path)
+    for path in expected["diffuse"][:5]:
+        write(path)
+    write(expected["diffuse"][5], b"")
+
+    status = watcher.poll()
+    assert status[""].complete
+    assert status[""].progress == 1.0
+    assert status["diffuse"].existing == 6
+    assert status["diffuse"].empty_frames == [1006]
+    assert status["diffuse"].missing_frames == list(range(1007, 1011))
+    assert status["diffuse"].progress == 0.5
+    assert "missing frames 1007-1010" in str(status["diffuse"])
+    assert "zero-byte frames 1006" in str(status["diffuse"])
+
+
+def test_poll_scans_only_changed_directories(tmp_path):
+    frames = list(range(1, 4))
+    expected = make_expected_files(str(tmp_path), ["a", "b"], frames)
+    for paths in expected.values():
+        for path in paths:
+            write(path)
+    # Unrelated files in the output directory are ignored
+    write(os.path.join(tmp_path, "a", "other.txt"))
+
+    watcher = RenderOutputWatcher(expected, frames=frames)
+    status = watcher.poll()
+    assert all(aov_status.complete for aov_status in status.values())
+    assert watcher.scan_count == 2
+
+    # Unchanged directories are not scanned again
+    watcher.poll()
+    assert watcher.scan_count == 2
+
+    # A removed file changes the directory modification time
+    os.remove(expected["b"][0])
+    stat = os.stat(os.path.join(tmp_path, "b"))
+    os.utime(
+        os.path.join(tmp_path, "b"),
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000),
+    )
+    status = watcher.poll()
+    assert watcher.scan_count == 3
+    assert status["b"].missing_frames == [1]
+
+
+def test_poll_rescans_directories_with_empty_files(tmp_path):
+    frames = [1]
+    expected = make_expected_files(str(tmp_path), ["a"], frames)
+    write(expected["a"][0], b"")
+
+    watcher = RenderOutputWatcher(expected, frames=frames)
+    assert watcher.poll()["a"].empty_frames == [1]
+
+    # Writing to the file does not change the directory modification time
+    write(expected["a"][0])
+    assert watcher.poll()["a"].complete
+    assert watcher.scan_count == 2
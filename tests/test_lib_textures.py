@@ -0,0 +1,61 @@
+"""Tests for the Redshift texture processor with a stub executable."""
+import os
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_cinema4d.api.lib_textures import TextureProcessor  # noqa: E402
+
+# Writes the `.rstexbin` next to the texture, fails for "bad" textures
+STUB_PROCESSOR = """
+import os
+import sys
+
+source = sys.argv[-1]
+if "bad" in os.path.basename(source):
+    print("Unable to read texture")
+    sys.exit(1)
+with open(os.path.splitext(source)[0] + ".rstexbin", "w") as f:
+    f.write("converted")
+"""
+
+
+def test_process_textures(tmp_path, make_stub):
+    for filename in ("a.png", "b.exr", "tile.1001.exr", "tile.1002.exr",
+                     "bad.jpg"):
+        (tmp_path / filename).write_text("texture")
+
+    paths = [
+        str(tmp_path / "a.png"),
+        str(tmp_path / "b.exr"),
+        str(tmp_path / "tile.<UDIM>.exr"),
+        str(tmp_path / "bad.jpg"),
+        str(tmp_path / "missing.png"),
+        # Duplicate paths are converted only once
+        str(tmp_path / "a.png"),
+    ]
+    processor = TextureProcessor(
+        executable=make_stub("processor", STUB_PROCESSOR), workers=4)
+
+    results = {
+        os.path.basename(result.source): result.status
+        for result in processor.process(paths)
+    }
+    assert results == {
+        "a.png": "converted",
+        "b.exr": "converted",
+        "tile.1001.exr": "converted",
+        "tile.1002.exr": "converted",
+        "bad.jpg": "failed",
+        "missing.png": "missing",
+    }
+
+    # Up-to-date converted textures are skipped on the next run
+    results = {
+        os.path.basename(result.source): result.status
+        for result in processor.process(paths)
+    }
+    assert results["a.png"] == "skipped"
+    assert results["tile.1002.exr"] == "skipped"
+    assert results["bad.jpg"] == "failed"
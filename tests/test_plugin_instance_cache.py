@@ -0,0 +1,74 @@
+"""Tests for the instance cache, these require Cinema 4D, e.g. `c4dpy`."""
+import pytest
+
+c4d = pytest.importorskip("c4d")
+pytest.importorskip("ayon_core")
+
+from ayon_core.pipeline import AYON_INSTANCE_ID  # noqa: E402
+from ayon_cinema4d.api import lib  # noqa: E402
+from ayon_cinema4d.api.plugin import InstanceCache  # noqa: E402
+
+CREATOR_IDENTIFIER = "io.ayon.creators.cinema4d.test"
+
+
+@pytest.fixture
+def doc():
+    doc = c4d.documents.BaseDocument()
+    yield doc
+    c4d.documents.KillDocument(doc)
+
+
+def add_instance(doc, name, variant="Main"):
+    obj = c4d.BaseObject(c4d.Oselection)
+    obj.SetName(name)
+    doc.InsertObject(obj)
+    lib.imprint(obj, {
+        "id": AYON_INSTANCE_ID,
+        "creator_identifier": CREATOR_IDENTIFIER,
+        "variant": variant,
+    })
+    return obj
+
+
+def test_discovery_is_reused_for_unchanged_document(doc):
+    obj = add_instance(doc, "instance")
+    doc.InsertObject(c4d.BaseObject(c4d.Onull))
+
+    cache = InstanceCache(doc)
+    assert cache.get_instances() == {CREATOR_IDENTIFIER: [obj]}
+    assert cache.get_instances() == {CREATOR_IDENTIFIER: [obj]}
+    assert cache.discovery_count == 1
+    assert cache.discovery_skipped_count == 1
+
+
+def test_data_change_invalidates_entry(doc):
+    obj = add_instance(doc, "instance")
+    cache = InstanceCache(doc)
+    cache.get_instances()
+    assert cache.read(obj)["variant"] == "Main"
+
+    # Changing the user data increments the `DIRTYFLAGS_DATA` counter
+    dirty = obj.GetDirty(c4d.DIRTYFLAGS_DATA)
+    lib.imprint(obj, {"variant": "Other"})
+    assert obj.GetDirty(c4d.DIRTYFLAGS_DATA) != dirty
+
+    assert cache.read(obj)["variant"] == "Other"
+    cache.get_instances()
+    assert cache.discovery_count == 2
+
+    # Objects that are no longer an instance are dropped
+    lib.imprint(obj, {"id": ""})
+    assert cache.get_instances() == {}
+
+
+def test_discard(doc):
+    obj = add_instance(doc, "instance")
+    other = add_instance(doc, "other")
+    cache = InstanceCache(doc)
+    cache.get_instances()
+
+    cache.discard([obj])
+    obj.Remove()
+    assert cache.get_instances() == {CREATOR_IDENTIFIER: [other]}
+    # Discarding keeps the signature in sync so no discovery is needed
+    assert cache.discovery_count == 1